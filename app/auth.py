@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
+import re
 import secrets
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional
 
 if TYPE_CHECKING:
     from app.store import Store
 
-from fastapi import Depends, Header, HTTPException, Request, status
+from fastapi import Header, HTTPException, Request, status
+from sqlalchemy import case, update
 from sqlmodel import Field, Session, SQLModel, select
 
+from app.rate_limit import enforce_api_key_rate_limit
 from app.settings import Settings, settings as global_settings
 
+LOGGER = logging.getLogger(__name__)
+
 
 class APIKey(SQLModel, table=True):
     """API key for authentication."""
@@ -25,7 +34,7 @@ class APIKey(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     key_hash: str = Field(index=True, unique=True)
-    key_prefix: str = Field(index=True)  # First 12 chars for display (mdwb_XXXXXXX)
+    key_prefix: bytes = Field(index=True)  # First 12 ASCII bytes for display (mdwb_XXXXXXX)
     name: str  # Human-readable name for the key
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     last_used_at: datetime | None = None
@@ -45,9 +54,60 @@ class AuthContext:
     owner: str | None
 
 
-def hash_api_key(api_key: str) -> str:
-    """Hash an API key for storage."""
-    return hashlib.sha256(api_key.encode()).hexdigest()
+class VerifiedKey(NamedTuple):
+    """Columns of an active API key, loaded without hydrating an ORM row."""
+
+    id: int
+    name: str
+    key_prefix: bytes
+    rate_limit: int | None
+    owner: str | None
+    last_used_at: datetime | None
+
+
+_VERIFIED_KEY_COLUMNS = (
+    APIKey.id,
+    APIKey.name,
+    APIKey.key_prefix,
+    APIKey.rate_limit,
+    APIKey.owner,
+    APIKey.last_used_at,
+)
+
+
+_API_KEY_PREFIX = b"mdwb_"
+_API_KEY_PATTERN = re.compile(r"mdwb_[0-9a-f]{32}")  # prefix + 32 lowercase hex chars
+
+
+def _key_bytes(api_key: str | bytes) -> bytes:
+    return api_key if isinstance(api_key, bytes) else api_key.encode()
+
+
+def hash_api_key(api_key: str | bytes) -> str:
+    """Hash an API key for storage.
+
+    Keys carry 128 bits of entropy, so a 160-bit BLAKE2b digest is ample and
+    noticeably cheaper than SHA-256 on CPUs without SHA extensions.
+    """
+    return hashlib.blake2b(_key_bytes(api_key), digest_size=20).hexdigest()
+
+
+def _legacy_hash_api_key(api_key: str | bytes) -> str:
+    """Return the SHA-256 digest used for keys issued before the BLAKE2b switch."""
+    return hashlib.sha256(_key_bytes(api_key)).hexdigest()
+
+
+def _parse_api_key(value: str) -> bytes | None:
+    """Return the ASCII-encoded key when it is well formed, otherwise None.
+
+    A single precompiled ``fullmatch`` rejects malformed keys before any hashing;
+    keys are always generated with ``secrets.token_hex`` so only lowercase hex
+    is accepted.
+    """
+
+    if _API_KEY_PATTERN.fullmatch(value) is None:
+        return None
+    return value.encode("ascii")
 
 
 def generate_api_key() -> str:
@@ -76,7 +136,7 @@ def create_api_key(
     """
     plain_key = generate_api_key()
     key_hash = hash_api_key(plain_key)
-    key_prefix = plain_key[:12]  # mdwb_<first 7 hex chars>
+    key_prefix = plain_key.encode("ascii")[:12]  # mdwb_<first 7 hex chars>
 
     api_key = APIKey(
         key_hash=key_hash,
@@ -95,13 +155,16 @@ def create_api_key(
 
 def verify_api_key(
     session: Session,
-    api_key: str,
+    api_key: str | bytes,
     update_threshold_seconds: int = 3600,
-) -> Optional[APIKey]:
-    """Verify an API key and return the corresponding record.
+) -> Optional[VerifiedKey]:
+    """Verify an API key and return the columns needed to authenticate it.
 
     Updates last_used_at timestamp only if it hasn't been updated recently,
     to avoid database writes on every request (performance optimization).
+    Verified keys are cached in-process for a short TTL so repeat callers skip
+    the lookup query; revoking a key evicts it immediately. Timestamp bumps are
+    queued and written by :func:`flush_last_used` rather than committed inline.
 
     Args:
         session: Database session
@@ -110,43 +173,111 @@ def verify_api_key(
             more than this many seconds ago (default: 3600 = 1 hour)
 
     Returns:
-        APIKey if valid and active, None otherwise
+        VerifiedKey if valid and active, None otherwise
     """
-    if not api_key or not api_key.startswith("mdwb_"):
+    if not api_key or not _key_bytes(api_key).startswith(_API_KEY_PREFIX):
         return None
 
     key_hash = hash_api_key(api_key)
 
-    statement = select(APIKey).where(
-        APIKey.key_hash == key_hash,
+    result = _get_cached_api_key(key_hash)
+    fetched = result is None
+    if result is None:
+        result = _fetch_active_api_key(session, api_key, key_hash)
+        if result is None:
+            return None
+
+    # Update last used timestamp only if it's been a while since last update
+    # This prevents a database write on every request (huge performance win)
+    now = datetime.now(timezone.utc)
+
+    # Handle timezone-aware/naive datetime comparison
+    # SQLite doesn't preserve timezone info, so we need to ensure compatibility
+    last_used = result.last_used_at
+    if last_used is not None and last_used.tzinfo is None:
+        # Database returned naive datetime - assume UTC
+        last_used = last_used.replace(tzinfo=timezone.utc)
+
+    should_update = (
+        last_used is None
+        or (now - last_used).total_seconds() > update_threshold_seconds
+    )
+
+    if should_update:
+        # Persisted in batches by the background flusher instead of committing here.
+        _mark_last_used(result.id, now)
+        result = result._replace(last_used_at=now)
+
+    if fetched or should_update:
+        _cache_api_key(key_hash, result)
+    return result
+
+
+def _fetch_active_api_key(session: Session, api_key: str | bytes, key_hash: str) -> Optional[VerifiedKey]:
+    """Load the columns of an active key by hash as plain values.
+
+    Keys issued before the BLAKE2b switch are matched by their SHA-256 digest in
+    the same query, so an unknown key costs a single SELECT; a legacy match is
+    upgraded in place so the next request hits the fast path.
+    """
+
+    statement = select(*_VERIFIED_KEY_COLUMNS, APIKey.key_hash).where(
+        APIKey.key_hash.in_((key_hash, _legacy_hash_api_key(api_key))),
         APIKey.is_active.is_(True),
     )
 
-    result = session.exec(statement).first()
+    row = session.exec(statement).first()
+    if row is None:
+        return None
 
-    if result:
-        # Update last used timestamp only if it's been a while since last update
-        # This prevents a database write on every request (huge performance win)
-        now = datetime.now(timezone.utc)
+    *columns, stored_hash = row
+    if stored_hash != key_hash:
+        session.execute(update(APIKey).where(APIKey.id == columns[0]).values(key_hash=key_hash))
+        session.commit()
+    return VerifiedKey._make(columns)
 
-        # Handle timezone-aware/naive datetime comparison
-        # SQLite doesn't preserve timezone info, so we need to ensure compatibility
-        last_used = result.last_used_at
-        if last_used is not None and last_used.tzinfo is None:
-            # Database returned naive datetime - assume UTC
-            last_used = last_used.replace(tzinfo=timezone.utc)
 
-        should_update = (
-            last_used is None
-            or (now - last_used).total_seconds() > update_threshold_seconds
-        )
+# In-process cache of verified keys so hot callers skip the SELECT. Entries expire
+# after a short TTL so revocations made by other processes still propagate.
+_VERIFIED_KEY_TTL_SECONDS = 60.0
+_VERIFIED_KEY_CACHE_SIZE = 4096
+_verified_keys: OrderedDict[str, tuple[float, VerifiedKey]] = OrderedDict()
+_verified_keys_lock = threading.Lock()
 
-        if should_update:
-            result.last_used_at = now
-            session.add(result)
-            session.commit()
 
-    return result
+def _get_cached_api_key(key_hash: str) -> Optional[VerifiedKey]:
+    with _verified_keys_lock:
+        entry = _verified_keys.get(key_hash)
+        if entry is None:
+            return None
+        expires_at, record = entry
+        if expires_at <= time.monotonic():
+            del _verified_keys[key_hash]
+            return None
+        _verified_keys.move_to_end(key_hash)
+        return record
+
+
+def _cache_api_key(key_hash: str, record: VerifiedKey) -> None:
+    with _verified_keys_lock:
+        _verified_keys[key_hash] = (time.monotonic() + _VERIFIED_KEY_TTL_SECONDS, record)
+        _verified_keys.move_to_end(key_hash)
+        while len(_verified_keys) > _VERIFIED_KEY_CACHE_SIZE:
+            _verified_keys.popitem(last=False)
+
+
+def _evict_cached_api_key(key_id: int) -> None:
+    with _verified_keys_lock:
+        for key_hash, (_, record) in list(_verified_keys.items()):
+            if record.id == key_id:
+                del _verified_keys[key_hash]
+
+
+def clear_api_key_cache() -> None:
+    """Drop every cached verification result (used by tests and key rotation tooling)."""
+
+    with _verified_keys_lock:
+        _verified_keys.clear()
 
 
 def revoke_api_key(session: Session, key_id: int) -> bool:
@@ -164,6 +295,7 @@ def revoke_api_key(session: Session, key_id: int) -> bool:
     api_key.is_active = False
     session.add(api_key)
     session.commit()
+    _evict_cached_api_key(key_id)
 
     return True
 
@@ -203,6 +335,68 @@ def get_store() -> "Store":
     return _global_store
 
 
+# Pending last_used_at bumps keyed by API key id, drained by flush_last_used().
+_pending_last_used: dict[int, datetime] = {}
+_pending_last_used_lock = threading.Lock()
+_last_used_task: asyncio.Task[None] | None = None
+
+
+def _mark_last_used(key_id: int, when: datetime) -> None:
+    with _pending_last_used_lock:
+        _pending_last_used[key_id] = when
+
+
+def flush_last_used(store: "Store | None" = None) -> int:
+    """Persist queued last_used_at bumps in a single UPDATE; returns rows flushed."""
+
+    with _pending_last_used_lock:
+        if not _pending_last_used:
+            return 0
+        pending = dict(_pending_last_used)
+        _pending_last_used.clear()
+
+    statement = (
+        update(APIKey)
+        .where(APIKey.id.in_(pending))
+        .values(last_used_at=case(pending, value=APIKey.id))
+    )
+    with (store or get_store()).session() as session:
+        session.execute(statement)
+        session.commit()
+    return len(pending)
+
+
+async def _last_used_flush_loop(store: "Store | None", interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(flush_last_used, store)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to flush API key last_used_at updates: %s", exc)
+
+
+def start_last_used_flusher(store: "Store | None" = None, *, interval: float = 5.0) -> None:
+    """Start the background task that batches last_used_at writes."""
+
+    global _last_used_task
+    if _last_used_task is None or _last_used_task.done():
+        _last_used_task = asyncio.create_task(_last_used_flush_loop(store, interval))
+
+
+async def stop_last_used_flusher(store: "Store | None" = None) -> None:
+    """Cancel the flusher and persist anything still queued."""
+
+    global _last_used_task
+    task, _last_used_task = _last_used_task, None
+    if task and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await asyncio.to_thread(flush_last_used, store)
+
+
 def get_db_session() -> Iterator[Session]:
     """FastAPI dependency to get database session.
 
@@ -221,14 +415,15 @@ def get_db_session() -> Iterator[Session]:
 
 async def get_auth_context(
     request: Request,
-    session: Session = Depends(get_db_session),
     x_api_key: Optional[str] = Header(None, alias="X-API-Key"),
     settings: Settings | None = None,
 ) -> AuthContext:
     """FastAPI dependency to get authentication context from request.
 
     Validates API key and returns authentication context.
-    Raises HTTPException if authentication fails.
+    Raises HTTPException if authentication fails. A database session is only
+    opened when a key actually has to be verified, so anonymous mode stays off
+    SQLite entirely.
 
     Usage:
         @app.get("/protected")
@@ -257,7 +452,8 @@ async def get_auth_context(
         )
 
     # Verify API key format
-    if not x_api_key.startswith("mdwb_") or len(x_api_key) != 37:
+    raw_key = _parse_api_key(x_api_key)
+    if raw_key is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key format",
@@ -265,7 +461,8 @@ async def get_auth_context(
         )
 
     # Verify API key against database
-    api_key_record = verify_api_key(session, x_api_key)
+    with get_store().session() as session:
+        api_key_record = verify_api_key(session, raw_key)
     if not api_key_record:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -273,18 +470,13 @@ async def get_auth_context(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    # Return authentication context from database record
-    # api_key_record.id should always be set for records from DB, but check for type safety
-    if api_key_record.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error: API key missing ID",
-        )
+    # Per-key admission control before the request reaches the job/OCR pipeline
+    enforce_api_key_rate_limit(api_key_record.id, api_key_record.rate_limit)
 
     return AuthContext(
         api_key_id=api_key_record.id,
         api_key_name=api_key_record.name,
-        api_key_prefix=api_key_record.key_prefix,
+        api_key_prefix=api_key_record.key_prefix.decode("ascii"),
         rate_limit=api_key_record.rate_limit,
         owner=api_key_record.owner,
     )
@@ -305,7 +497,7 @@ def cli_generate_key(name: str, rate_limit: int | None = None, owner: str | None
         print("\n✅ API Key created successfully!")
         print(f"\nKey ID: {api_key.id}")
         print(f"Name: {api_key.name}")
-        print(f"Prefix: {api_key.key_prefix}")
+        print(f"Prefix: {api_key.key_prefix.decode('ascii')}")
         print(f"Rate Limit: {api_key.rate_limit or 'None (unlimited)'}")
         print(f"Owner: {api_key.owner or 'None'}")
         print("\n🔑 API Key (save this, it won't be shown again):")
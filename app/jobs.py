@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict
+from bisect import bisect_left
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from importlib import metadata
+from itertools import islice
 import time
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Sequence, TypedDict, cast
+import weakref
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Sequence, TypedDict, cast
 from uuid import uuid4
 
 import hashlib
@@ -18,6 +23,7 @@ from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import logging
 
 import httpx
+import orjson
 
 from app import metrics
 from app.capture import CaptureConfig, CaptureManifest, CaptureResult, capture_tiles
@@ -34,7 +40,7 @@ from app.dom_links import (
 from app.ocr_client import OCRRequest, SubmitTilesResult, submit_tiles
 from app.schemas import JobCreateRequest, ManifestMetadata
 from app.settings import Settings, settings as global_settings
-from app.store import Store, build_store
+from app.store import RunRecord, Store, build_store
 from app.stitch import stitch_markdown
 from app.warning_log import append_warning_log, summarize_dom_assists
 
@@ -42,6 +48,10 @@ LOGGER = logging.getLogger(__name__)
 
 WebhookSender = Callable[[str, dict[str, Any]], Awaitable[None]]
 _EVENT_HISTORY_LIMIT = 500
+_SUBSCRIBER_BUFFER = 64
+_WEBHOOK_WORKERS = 8
+_WEBHOOK_QUEUE_SIZE = 1000
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
 
 try:  # Playwright may be missing in some CI environments
     PLAYWRIGHT_VERSION = metadata.version("playwright")
@@ -65,10 +75,14 @@ class JobState(str, Enum):
 
 
 class JobSnapshot(TypedDict, total=False):
-    """Serialized view of a job for API responses and SSE events."""
+    """Serialized view of a job for API responses and SSE events.
+
+    Payloads are shared between subscribers and the event log; treat them as
+    read-only and let ``JobManager`` swap in new snapshots on updates.
+    """
 
     id: str
-    state: JobState
+    state: str  # JobState value, stored pre-serialized
     url: str
     progress: dict[str, int]
     manifest_path: str
@@ -93,17 +107,12 @@ def build_initial_snapshot(
 ) -> JobSnapshot:
     """Construct a baseline snapshot before capture begins."""
 
-    manifest = None
     active_settings = settings or global_settings
-    if active_settings:
-        manifest = ManifestMetadata(
-            environment=active_settings.manifest_environment(playwright_version=PLAYWRIGHT_VERSION)
-        )
 
     snapshot = JobSnapshot(
         id=job_id,
         url=url,
-        state=JobState.BROWSER_STARTING,
+        state=JobState.BROWSER_STARTING.value,
         progress={"done": 0, "total": 0},
         manifest_path="",
         error=None,
@@ -116,14 +125,72 @@ def build_initial_snapshot(
     snapshot["seam_marker_count"] = None
     snapshot["seam_hash_count"] = None
     snapshot["seam_markers"] = []
-    if manifest:
-        manifest.profile_id = profile_id
-        manifest.cache_hit = cache_hit
-        snapshot["manifest"] = manifest.model_dump()
+    if active_settings:
+        snapshot["manifest"] = {
+            **_baseline_manifest(active_settings),
+            "profile_id": profile_id,
+            "cache_hit": cache_hit,
+        }
     return snapshot
+
+
+@lru_cache(maxsize=4)
+def _baseline_manifest(settings: Settings) -> dict[str, Any]:
+    """Dumped manifest stub for ``settings``; invariant for the life of the process.
+
+    Callers get a shallow copy; nested values are shared and must stay read-only
+    like the rest of the snapshot payload.
+    """
+
+    manifest = ManifestMetadata(environment=settings.manifest_environment(playwright_version=PLAYWRIGHT_VERSION))
+    return manifest.model_dump()
+
+
 RunnerType = Callable[..., Awaitable[tuple[CaptureResult, list[dict[str, object]]]]]
 
 
+@dataclass(slots=True)
+class JobRecord:
+    """Everything ``JobManager`` keeps in memory for one job."""
+
+    snapshot: JobSnapshot
+    event_log: Deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=_EVENT_HISTORY_LIMIT))
+    event_sequence: int = 0
+    latest_payload: JobSnapshot | None = None
+    snapshot_version: int = 0
+    snapshot_changed: asyncio.Event = field(default_factory=asyncio.Event)
+    event_subscribers: List[asyncio.Queue[dict[str, Any]]] = field(default_factory=list)
+    webhooks: List[dict[str, Any]] = field(default_factory=list)
+    pending_webhooks: List[dict[str, Any]] = field(default_factory=list)
+    cache_key: str | None = None
+
+
+class SnapshotSubscription:
+    """Latest-value view of a job's snapshots shared by every stream subscriber.
+
+    Snapshots are complete job states, so a reader that falls behind only needs
+    the newest one; intermediate updates are conflated instead of queued.
+    """
+
+    __slots__ = ("_record", "_seen")
+
+    def __init__(self, record: JobRecord) -> None:
+        self._record = record
+        self._seen = 0
+
+    def get_nowait(self) -> JobSnapshot:
+        record = self._record
+        if record.snapshot_version == self._seen or record.latest_payload is None:
+            raise asyncio.QueueEmpty
+        self._seen = record.snapshot_version
+        return record.latest_payload
+
+    async def get(self) -> JobSnapshot:
+        while self._record.snapshot_version == self._seen:
+            await self._record.snapshot_changed.wait()
+        return self.get_nowait()
+
+
 class JobManager:
     """In-memory job registry backed by Store persistence."""
 
@@ -137,16 +204,15 @@ class JobManager:
     ) -> None:
         self.store = store or build_store()
         self._runner = runner or execute_capture_job
-        self._snapshots: Dict[str, JobSnapshot] = {}
-        self._tasks: Dict[str, asyncio.Task[None]] = {}
-        self._subscribers: Dict[str, List[asyncio.Queue[JobSnapshot]]] = {}
-        self._event_logs: Dict[str, List[dict[str, Any]]] = {}
-        self._event_sequences: Dict[str, int] = {}
-        self._event_subscribers: Dict[str, List[asyncio.Queue[dict[str, Any]]]] = {}
-        self._webhooks: Dict[str, List[dict[str, Any]]] = {}
-        self._pending_webhooks: Dict[str, List[dict[str, Any]]] = {}
+        self._jobs: Dict[str, JobRecord] = {}
+        # The set owns running capture tasks; the weak map only resolves job ids for
+        # cancellation, so finished tasks and their frames are freed immediately.
+        self._bg_tasks: set[asyncio.Task[None]] = set()
+        self._tasks: weakref.WeakValueDictionary[str, asyncio.Task[None]] = weakref.WeakValueDictionary()
         self._webhook_sender = webhook_sender or _default_webhook_sender
-        self._cache_keys: Dict[str, str | None] = {}
+        self._webhook_queue: asyncio.Queue[tuple[str, dict[str, Any]]] | None = None
+        self._webhook_workers: list[asyncio.Task[None]] = []
+        self._webhook_loop: asyncio.AbstractEventLoop | None = None
         self._job_timeout_seconds = job_timeout_seconds
         self._watchdog_task: asyncio.Task[None] | None = None
         self._shutdown = False
@@ -163,10 +229,7 @@ class JobManager:
             profile_id=capture_config.profile_id,
             cache_hit=False,
         )
-        self._snapshots[job_id] = snapshot.copy()
-        self._event_logs[job_id] = []
-        self._event_sequences[job_id] = 0
-        self._cache_keys[job_id] = cache_key
+        self._jobs[job_id] = JobRecord(snapshot=snapshot, cache_key=cache_key)
         self._broadcast(job_id)
 
         cache_record = None
@@ -174,16 +237,18 @@ class JobManager:
             cache_record = self.store.find_cache_hit(cache_key)
         if cache_record:
             self.store.register_cached_run(job_id=job_id, source=cache_record)
-            snapshot = self._snapshots[job_id]
             manifest = self.store.read_manifest(cache_record.id)
             manifest["cache_hit"] = True
-            snapshot["cache_hit"] = True
-            snapshot["manifest"] = manifest
-            snapshot["manifest_path"] = cache_record.manifest_path
             total_tiles = cache_record.tiles_total or manifest.get("tiles_total") or 0
-            snapshot["progress"] = {"done": total_tiles, "total": total_tiles}
-            snapshot["artifacts"] = self.store.read_artifacts(cache_record.id)
-            self._snapshots[job_id] = snapshot.copy()
+            self._update_snapshot(
+                job_id,
+                cache_hit=True,
+                manifest=manifest,
+                manifest_path=cache_record.manifest_path,
+                progress={"done": total_tiles, "total": total_tiles},
+                artifacts=self.store.read_artifacts(cache_record.id),
+                **_seam_counts(cache_record),
+            )
             self._record_custom_event(
                 job_id,
                 "cache_hit",
@@ -196,6 +261,8 @@ class JobManager:
             return self._snapshot_payload(job_id)
 
         task = asyncio.create_task(self._run_job(job_id=job_id, url=request.url, config=capture_config))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_job_done)
         self._tasks[job_id] = task
         return self._snapshot_payload(job_id)
 
@@ -247,41 +314,28 @@ class JobManager:
     def get_snapshot(self, job_id: str) -> JobSnapshot:
         return self._snapshot_payload(job_id)
 
-    def subscribe(self, job_id: str) -> asyncio.Queue[JobSnapshot]:
-        if job_id not in self._snapshots:
-            raise KeyError(f"Job {job_id} not found")
-        queue: asyncio.Queue[JobSnapshot] = asyncio.Queue()
-        queue.put_nowait(self._snapshot_payload(job_id))
-        self._subscribers.setdefault(job_id, []).append(queue)
-        return queue
-
-    def unsubscribe(self, job_id: str, queue: asyncio.Queue[JobSnapshot]) -> None:
-        subscribers = self._subscribers.get(job_id)
-        if not subscribers:
-            return
-        if queue in subscribers:
-            subscribers.remove(queue)
-        if not subscribers:
-            self._subscribers.pop(job_id, None)
+    def subscribe(self, job_id: str) -> SnapshotSubscription:
+        return SnapshotSubscription(self._record(job_id))
 
     def subscribe_events(
         self, job_id: str, *, since: datetime | None = None
     ) -> tuple[list[dict[str, Any]], asyncio.Queue[dict[str, Any]]]:
-        if job_id not in self._snapshots:
-            raise KeyError(f"Job {job_id} not found")
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        self._event_subscribers.setdefault(job_id, []).append(queue)
+        record = self._record(job_id)
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=_SUBSCRIBER_BUFFER)
+        record.event_subscribers.append(queue)
         backlog = self.get_events(job_id, since=since)
         return backlog, queue
 
     def unsubscribe_events(self, job_id: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
-        subscribers = self._event_subscribers.get(job_id)
-        if not subscribers:
-            return
-        if queue in subscribers:
-            subscribers.remove(queue)
-        if not subscribers:
-            self._event_subscribers.pop(job_id, None)
+        record = self._jobs.get(job_id)
+        if record and queue in record.event_subscribers:
+            record.event_subscribers.remove(queue)
+
+    def _record(self, job_id: str) -> JobRecord:
+        record = self._jobs.get(job_id)
+        if record is None:
+            raise KeyError(f"Job {job_id} not found")
+        return record
 
     def start_watchdog(self) -> None:
         """Start the background watchdog task to monitor for stuck jobs."""
@@ -299,6 +353,15 @@ class JobManager:
         if exc:
             LOGGER.exception("Watchdog task crashed unexpectedly: %s", exc)
 
+    def _on_job_done(self, task: asyncio.Task[None]) -> None:
+        """Release a finished capture task and retrieve its outcome."""
+        self._bg_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            LOGGER.warning("Capture task failed: %s", exc)
+
     async def stop_watchdog(self) -> None:
         """Stop the watchdog task gracefully."""
         self._shutdown = True
@@ -320,19 +383,19 @@ class JobManager:
         cutoff_time = now - timedelta(hours=retention_hours)
         jobs_to_clean = []
 
-        for job_id, snapshot in list(self._snapshots.items()):
+        for job_id, record in list(self._jobs.items()):
             # Only clean up completed jobs
-            if snapshot["state"] not in (JobState.DONE, JobState.FAILED):
+            if record.snapshot["state"] not in (JobState.DONE, JobState.FAILED):
                 continue
 
             # Check completion time from database
             try:
-                record = await asyncio.to_thread(self.store.fetch_run, job_id)
-                if not record or not record.finished_at:
+                run = await asyncio.to_thread(self.store.fetch_run, job_id)
+                if not run or not run.finished_at:
                     continue
 
                 # Normalize finished_at to UTC-naive for comparison
-                finished_at = record.finished_at
+                finished_at = run.finished_at
                 finished_at_naive = finished_at.replace(tzinfo=None) if finished_at.tzinfo else finished_at
                 cutoff_naive = cutoff_time.replace(tzinfo=None)
 
@@ -343,16 +406,7 @@ class JobManager:
 
         # Clean up memory for old jobs
         for job_id in jobs_to_clean:
-            self._snapshots.pop(job_id, None)
-            self._event_logs.pop(job_id, None)
-            self._event_sequences.pop(job_id, None)
-            self._subscribers.pop(job_id, None)
-            self._event_subscribers.pop(job_id, None)
-            self._webhooks.pop(job_id, None)
-            self._pending_webhooks.pop(job_id, None)
-            self._cache_keys.pop(job_id, None)
-            # Defensive cleanup of tasks (should already be cleaned up, but just in case)
-            self._tasks.pop(job_id, None)
+            self._jobs.pop(job_id, None)
 
         if jobs_to_clean:
             LOGGER.info("Cleaned up memory for %d completed jobs", len(jobs_to_clean))
@@ -374,7 +428,8 @@ class JobManager:
                     await self._cleanup_completed_jobs(now)
                     last_cleanup = now
 
-                for job_id, snapshot in list(self._snapshots.items()):
+                for job_id, job in list(self._jobs.items()):
+                    snapshot = job.snapshot
                     # Skip already-completed jobs
                     if snapshot["state"] in (JobState.DONE, JobState.FAILED):
                         continue
@@ -427,7 +482,8 @@ class JobManager:
         storage = self.store
         started_at = datetime.now(timezone.utc)
         profile_id = getattr(config, "profile_id", None)
-        cache_key = self._cache_keys.get(job_id)
+        job = self._jobs.get(job_id)
+        cache_key = job.cache_key if job else None
         # Use asyncio.to_thread for potentially blocking database operations
         await asyncio.to_thread(
             storage.allocate_run,
@@ -438,9 +494,7 @@ class JobManager:
             cache_key=cache_key,
         )
         await asyncio.to_thread(storage.update_status, job_id=job_id, status=JobState.CAPTURING)
-        pending = self._pending_webhooks.pop(job_id, [])
-        if pending:
-            _persist_pending_webhooks(storage, pending, job_id)
+        self._persist_pending_webhooks(job_id)
         try:
             self._set_state(job_id, JobState.CAPTURING)
             capture_result, tile_artifacts = await self._runner(
@@ -451,18 +505,20 @@ class JobManager:
             )
             run_record = self.store.fetch_run(job_id)
             manifest_path = str(run_record.manifest_path) if run_record else ""
-            snapshot = self._snapshots[job_id]
-            snapshot["manifest_path"] = manifest_path
-            snapshot["progress"] = {
-                "done": capture_result.manifest.tiles_total,
-                "total": capture_result.manifest.tiles_total,
+            changes: dict[str, Any] = {
+                **_seam_counts(run_record),
+                "manifest_path": manifest_path,
+                "progress": {
+                    "done": capture_result.manifest.tiles_total,
+                    "total": capture_result.manifest.tiles_total,
+                },
+                "manifest": asdict(capture_result.manifest),
+                "artifacts": tile_artifacts,
+                "cache_hit": bool(capture_result.manifest.cache_hit),
             }
-            snapshot["manifest"] = asdict(capture_result.manifest)
             if capture_result.manifest.seam_markers:
-                snapshot["seam_markers"] = capture_result.manifest.seam_markers
-            snapshot["artifacts"] = tile_artifacts
-            snapshot["cache_hit"] = bool(capture_result.manifest.cache_hit)
-            self._broadcast(job_id)
+                changes["seam_markers"] = capture_result.manifest.seam_markers
+            self._broadcast(job_id, self._update_snapshot(job_id, **changes))
             self._emit_ocr_event(job_id, capture_result.manifest)
             self._emit_dom_assist_event(job_id, capture_result.manifest)
             self._set_state(job_id, JobState.DONE)
@@ -477,25 +533,36 @@ class JobManager:
             )
             raise
         finally:
-            self._tasks.pop(job_id, None)
-            self._cache_keys.pop(job_id, None)
+            if job is not None:
+                job.cache_key = None
+
+    def _update_snapshot(self, job_id: str, **changes: Any) -> JobRecord | None:
+        """Swap in a new snapshot dict rather than mutating the shared one.
+
+        Snapshots and the payloads derived from them are handed to every
+        subscriber by reference, so they must never be modified in place.
+        """
+
+        record = self._jobs.get(job_id)
+        if record is None:
+            return None
+        record.snapshot = cast(JobSnapshot, {**record.snapshot, **changes})
+        return record
 
     def _set_state(self, job_id: str, state: JobState) -> None:
-        snapshot = self._snapshots.get(job_id)
-        if snapshot is None:
-            return
-        snapshot["state"] = state
-        self._broadcast(job_id)
         normalized_state = state.value if isinstance(state, JobState) else str(state)
+        record = self._update_snapshot(job_id, state=normalized_state)
+        if record is None:
+            return
+        self._broadcast(job_id, record)
         if normalized_state in (JobState.DONE.value, JobState.FAILED.value):
             metrics.record_job_completion(normalized_state)
 
     def _set_error(self, job_id: str, message: str | None) -> None:
-        snapshot = self._snapshots.get(job_id)
-        if snapshot is None:
+        record = self._update_snapshot(job_id, error=message)
+        if record is None:
             return
-        snapshot["error"] = message
-        self._broadcast(job_id)
+        self._broadcast(job_id, record)
 
     def get_events(
         self,
@@ -504,29 +571,20 @@ class JobManager:
         *,
         min_sequence: int | None = None,
     ) -> List[dict[str, Any]]:
-        if job_id not in self._snapshots:
-            raise KeyError(f"Job {job_id} not found")
-        events = self._event_logs.get(job_id, [])
-        if since is None:
-            if min_sequence is None:
-                return [event.copy() for event in events]
-            return [
-                event.copy()
-                for event in events
-                if self._sequence_newer(event, min_sequence)
-            ]
-        filtered: List[dict[str, Any]] = []
-        for event in events:
-            parsed_ts = self._parse_timestamp(event.get("timestamp"))
-            if parsed_ts and parsed_ts >= since:
-                if min_sequence is not None and not self._sequence_newer(event, min_sequence):
-                    continue
-                filtered.append(event.copy())
-        return filtered
+        events = self._record(job_id).event_log
+        if not events:
+            return []
+        # Sequences within a log are consecutive and timestamps never decrease, so
+        # both filters resolve to a start offset instead of a per-event scan.
+        start = 0
+        if min_sequence is not None:
+            start = self._sequence_offset(events, min_sequence)
+        if since is not None:
+            start = bisect_left(events, since, lo=start, key=self._event_time)
+        return [event.copy() for event in islice(events, start, None)]
 
     def register_webhook(self, job_id: str, *, url: str, events: list[str] | None = None) -> None:
-        if job_id not in self._snapshots:
-            raise KeyError(f"Job {job_id} not found")
+        record = self._record(job_id)
         valid_states = {member.value for member in JobState}
         normalized: list[str] = []
         for entry in events or [JobState.DONE.value, JobState.FAILED.value]:
@@ -535,12 +593,12 @@ class JobManager:
                 raise ValueError(msg)
             normalized.append(entry)
         entry = {"url": url, "events": normalized}
-        self._webhooks.setdefault(job_id, []).append(entry)
+        record.webhooks.append(entry)
         try:
-            record = self.store.register_webhook(job_id=job_id, url=url, events=normalized)
-            entry["id"] = record.id
+            stored = self.store.register_webhook(job_id=job_id, url=url, events=normalized)
+            entry["id"] = stored.id
         except KeyError:
-            self._pending_webhooks.setdefault(job_id, []).append(entry)
+            record.pending_webhooks.append(entry)
 
     def delete_webhook(self, job_id: str, *, webhook_id: int | None = None, url: str | None = None) -> int:
         """Remove webhook registrations from persistence + in-memory caches."""
@@ -549,7 +607,7 @@ class JobManager:
             deleted = self.store.delete_webhooks(job_id=job_id, webhook_id=webhook_id, url=url)
         except KeyError:
             # If the run has not been allocated yet we may still have in-memory registrations.
-            if job_id not in self._snapshots:
+            if job_id not in self._jobs:
                 raise
             deleted = 0
         removed = self._remove_cached_webhooks(job_id, webhook_id=webhook_id, url=url)
@@ -566,82 +624,60 @@ class JobManager:
     ) -> int:
         """Delete webhook entries from in-memory caches and pending queues."""
 
-        removed = self._prune_webhook_entries(self._webhooks, job_id, webhook_id=webhook_id, url=url)
-        pending_removed = self._prune_webhook_entries(
-            self._pending_webhooks, job_id, webhook_id=webhook_id, url=url
-        )
-        return removed or pending_removed
-
-    def _prune_webhook_entries(
-        self,
-        source: Dict[str, List[dict[str, Any]]],
-        job_id: str,
-        *,
-        webhook_id: int | None = None,
-        url: str | None = None,
-    ) -> int:
-        entries = source.get(job_id)
-        if not entries:
+        record = self._jobs.get(job_id)
+        if record is None:
             return 0
-        remaining = [entry for entry in entries if not _webhook_matches(entry, webhook_id, url)]
-        removed = len(entries) - len(remaining)
-        if remaining:
-            source[job_id] = remaining
-        else:
-            source.pop(job_id, None)
-        return removed
+        removed = _prune_webhook_entries(record.webhooks, webhook_id=webhook_id, url=url)
+        pending_removed = _prune_webhook_entries(record.pending_webhooks, webhook_id=webhook_id, url=url)
+        return removed or pending_removed
 
     def _persist_pending_webhooks(self, job_id: str) -> None:
-        pending = self._pending_webhooks.pop(job_id, [])
-        if not pending:
+        record = self._jobs.get(job_id)
+        if record is None or not record.pending_webhooks:
             return
+        pending, record.pending_webhooks = record.pending_webhooks, []
         _persist_pending_webhooks(self.store, pending, job_id)
 
-    def _broadcast(self, job_id: str) -> None:
-        payload = self._snapshot_payload(job_id)
-        self._record_event(job_id, payload)
-        for queue in list(self._subscribers.get(job_id, [])):
-            queue.put_nowait(payload.copy())
-        self._maybe_trigger_webhooks(job_id, payload)
-
-    def _snapshot_payload(self, job_id: str) -> JobSnapshot:
-        snapshot = self._snapshots.get(job_id)
-        if snapshot is None:
-            raise KeyError(f"Job {job_id} not found")
-        payload = snapshot.copy()
-        record = self.store.fetch_run(job_id)
-        if record:
-            if record.seam_marker_count is not None:
-                payload["seam_marker_count"] = record.seam_marker_count
-            else:
-                payload.pop("seam_marker_count", None)
-            if record.seam_hash_count is not None:
-                payload["seam_hash_count"] = record.seam_hash_count
-            else:
-                payload.pop("seam_hash_count", None)
-        state = payload.get("state")
-        if isinstance(state, JobState):
-            payload["state"] = state.value
-        return payload
-
-    def _record_event(self, job_id: str, payload: JobSnapshot) -> None:
-        self._append_event_entry(job_id, {"event": "snapshot", "snapshot": payload})
+    def _broadcast(self, job_id: str, record: JobRecord | None = None) -> None:
+        # One payload is shared (read-only) by the event log, stream subscribers,
+        # and webhook deliveries instead of copying it per consumer.
+        record = record or self._record(job_id)
+        payload = self._snapshot_payload(job_id, record)
+        # Stamp once so the event log and webhook envelope agree on the time.
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self._append_event_entry(
+            job_id, {"event": "snapshot", "snapshot": payload, "timestamp": timestamp}, record=record
+        )
+        # Publish by reference and wake every waiting stream at once.
+        record.latest_payload = payload
+        record.snapshot_version += 1
+        record.snapshot_changed.set()
+        record.snapshot_changed.clear()
+        self._maybe_trigger_webhooks(job_id, payload, timestamp=timestamp, record=record)
+
+    def _snapshot_payload(self, job_id: str, record: JobRecord | None = None) -> JobSnapshot:
+        # Copy-on-write snapshots can be handed out as-is; seam counts are folded
+        # in when the run record changes instead of re-fetched per broadcast.
+        return (record or self._record(job_id)).snapshot
 
     def _record_custom_event(self, job_id: str, event: str, data: Mapping[str, Any]) -> None:
         self._append_event_entry(job_id, {"event": event, "data": dict(data)})
 
-    def _append_event_entry(self, job_id: str, entry: Mapping[str, Any]) -> None:
-        sequence = self._event_sequences.get(job_id, 0)
-        enriched = dict(entry)
-        enriched.setdefault("timestamp", datetime.now(timezone.utc).isoformat())
-        enriched["sequence"] = sequence
-        self._event_sequences[job_id] = sequence + 1
-        log = self._event_logs.setdefault(job_id, [])
-        log.append(enriched)
-        if len(log) > _EVENT_HISTORY_LIMIT:
-            del log[: len(log) - _EVENT_HISTORY_LIMIT]
-        for queue in list(self._event_subscribers.get(job_id, [])):
-            queue.put_nowait(enriched.copy())
+    def _append_event_entry(
+        self, job_id: str, entry: dict[str, Any], *, record: JobRecord | None = None
+    ) -> None:
+        """Stamp and publish ``entry``; callers hand over a fresh dict, so it is not copied."""
+
+        record = record or self._jobs.get(job_id)
+        if record is None:
+            return
+        if "timestamp" not in entry:
+            entry["timestamp"] = datetime.now(timezone.utc).isoformat()
+        entry["sequence"] = record.event_sequence
+        record.event_sequence += 1
+        record.event_log.append(entry)  # bounded deque drops the oldest entry in O(1)
+        for queue in record.event_subscribers:
+            _offer(queue, entry)
 
     def _parse_timestamp(self, raw: Any) -> datetime | None:
         if not isinstance(raw, str):
@@ -654,12 +690,14 @@ class JobManager:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
 
-    def _sequence_newer(self, event: Mapping[str, Any], min_sequence: int) -> bool:
-        try:
-            seq = int(event.get("sequence", -1))
-        except (TypeError, ValueError):
-            return False
-        return seq > min_sequence
+    def _sequence_offset(self, events: Deque[dict[str, Any]], min_sequence: int) -> int:
+        """Index of the first event whose sequence is greater than ``min_sequence``."""
+
+        first = int(events[0].get("sequence", 0))
+        return min(len(events), max(0, min_sequence - first + 1))
+
+    def _event_time(self, event: Mapping[str, Any]) -> datetime:
+        return self._parse_timestamp(event.get("timestamp")) or _EPOCH
 
     def _emit_ocr_event(self, job_id: str, manifest: CaptureManifest) -> None:
         summary = _summarize_ocr_batches(manifest)
@@ -678,31 +716,73 @@ class JobManager:
         if summary:
             self._record_custom_event(job_id, "dom_assist", summary)
 
-    def _maybe_trigger_webhooks(self, job_id: str, payload: JobSnapshot) -> None:
-        sender = self._webhook_sender
-        if sender is None:
+    def _maybe_trigger_webhooks(
+        self,
+        job_id: str,
+        payload: JobSnapshot,
+        *,
+        timestamp: str | None = None,
+        record: JobRecord | None = None,
+    ) -> None:
+        if self._webhook_sender is None:
             return
-        hooks = self._webhooks.get(job_id)
+        record = record or self._jobs.get(job_id)
+        hooks = record.webhooks if record else None
         if not hooks:
             return
         state = payload.get("state")
         if not isinstance(state, str):
             return
+        envelope: dict[str, Any] | None = None
         for hook in hooks:
             allowed = hook.get("events") or []
             if state not in allowed:
                 continue
-            asyncio.create_task(
-                sender(
-                    hook["url"],
-                    {
-                        "job_id": job_id,
-                        "state": state,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "snapshot": payload,
-                    },
-                )
-            )
+            if envelope is None:
+                # Built once per broadcast and shared by every matching hook.
+                envelope = {
+                    "job_id": job_id,
+                    "state": state,
+                    "timestamp": timestamp or datetime.now(timezone.utc).isoformat(),
+                    "snapshot": payload,
+                }
+            self._enqueue_webhook(hook["url"], envelope)
+
+    def _enqueue_webhook(self, url: str, envelope: dict[str, Any]) -> None:
+        """Hand a delivery to the worker pool, dropping it if the backlog is full."""
+
+        loop = asyncio.get_running_loop()
+        if self._webhook_queue is None or self._webhook_loop is not loop:
+            # (Re)build the pool on the running loop; test clients spin up fresh loops.
+            self._webhook_loop = loop
+            self._webhook_queue = asyncio.Queue(maxsize=_WEBHOOK_QUEUE_SIZE)
+            self._webhook_workers = [
+                asyncio.create_task(self._webhook_worker(self._webhook_queue)) for _ in range(_WEBHOOK_WORKERS)
+            ]
+        try:
+            self._webhook_queue.put_nowait((url, envelope))
+        except asyncio.QueueFull:
+            LOGGER.warning("Webhook queue full; dropping %s delivery to %s", envelope.get("state"), url)
+
+    async def _webhook_worker(self, queue: asyncio.Queue[tuple[str, dict[str, Any]]]) -> None:
+        while True:
+            url, envelope = await queue.get()
+            try:
+                await self._webhook_sender(url, envelope)
+            except Exception as exc:  # pragma: no cover - senders log their own failures
+                LOGGER.warning("Webhook delivery to %s failed: %s", url, exc)
+            finally:
+                queue.task_done()
+
+    async def stop_webhook_workers(self) -> None:
+        """Cancel the webhook worker pool; undelivered entries are dropped."""
+
+        workers, self._webhook_workers = self._webhook_workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._webhook_queue = None
+        self._webhook_loop = None
 
 
 async def execute_capture_job(
@@ -717,49 +797,100 @@ async def execute_capture_job(
     storage = store or build_store()
 
     capture_config = config or CaptureConfig(url=url)
-    try:
-        capture_result = await capture_tiles(capture_config)
-        markdown, ocr_ms, stitch_ms, ocr_links = await _run_ocr_pipeline(
-            job_id=job_id,
-            capture_result=capture_result,
+    capture_result = await capture_tiles(capture_config)
+    markdown, ocr_ms, stitch_ms, ocr_links = await _run_ocr_pipeline(
+        job_id=job_id,
+        capture_result=capture_result,
+    )
+    capture_result.manifest.ocr_ms = ocr_ms
+    capture_result.manifest.stitch_ms = stitch_ms
+    metrics.observe_manifest_metrics(capture_result.manifest)
+    # Tiles, manifest, Markdown and link files are all synchronous disk writes;
+    # flush them in one worker-thread hop so other jobs' streams keep ticking.
+    tile_artifacts = await asyncio.to_thread(
+        _persist_capture_outputs,
+        storage,
+        job_id=job_id,
+        url=url,
+        capture_result=capture_result,
+        markdown=markdown,
+        ocr_links=ocr_links,
+    )
+    return capture_result, tile_artifacts
+
+
+def _persist_capture_outputs(
+    storage: Store,
+    *,
+    job_id: str,
+    url: str,
+    capture_result: CaptureResult,
+    markdown: str,
+    ocr_links: Sequence[LinkRecord],
+) -> list[dict[str, object]]:
+    append_warning_log(job_id=job_id, url=url, manifest=capture_result.manifest)
+    dom_snapshot = getattr(capture_result, "dom_snapshot", None)
+    dom_path = None
+    dom_links: Sequence[LinkRecord] = []
+    if dom_snapshot:
+        dom_path = storage.write_dom_snapshot(job_id=job_id, html=dom_snapshot)
+    write_links = getattr(storage, "write_links", None)
+    if dom_path and callable(write_links):
+        try:
+            dom_links = extract_links_from_dom(dom_path)
+            write_links(job_id=job_id, links=serialize_links(dom_links))
+        except Exception as exc:  # pragma: no cover - log and continue
+            LOGGER.warning("Failed to extract DOM links for %s: %s", job_id, exc)
+    tile_artifacts = storage.write_tiles(job_id=job_id, tiles=capture_result.tiles)
+    storage.write_manifest(job_id=job_id, manifest=capture_result.manifest)
+    if markdown:
+        storage.write_markdown(job_id=job_id, content=markdown)
+    blended_links: Sequence[LinkRecord] = dom_links
+    if ocr_links:
+        blended_links = blend_dom_with_ocr(dom_links=dom_links, ocr_links=ocr_links)
+    if blended_links and callable(write_links):
+        storage.write_links(job_id=job_id, links=serialize_links(blended_links))
+    return tile_artifacts
+
+
+def _encode_json(payload: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``payload`` to compact UTF-8 JSON bytes (naive datetimes as UTC)."""
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(payload, option=option)
+
+
+_WEBHOOK_CLIENT: httpx.AsyncClient | None = None
+
+
+def _webhook_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client used for every webhook delivery."""
+
+    global _WEBHOOK_CLIENT
+    if _WEBHOOK_CLIENT is None or _WEBHOOK_CLIENT.is_closed:
+        _WEBHOOK_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            http2=True,
         )
-        capture_result.manifest.ocr_ms = ocr_ms
-        capture_result.manifest.stitch_ms = stitch_ms
-        metrics.observe_manifest_metrics(capture_result.manifest)
-        append_warning_log(job_id=job_id, url=url, manifest=capture_result.manifest)
-        dom_snapshot = getattr(capture_result, "dom_snapshot", None)
-        dom_path = None
-        dom_links: Sequence[LinkRecord] = []
-        if dom_snapshot:
-            dom_path = storage.write_dom_snapshot(job_id=job_id, html=dom_snapshot)
-        write_links = getattr(storage, "write_links", None)
-        if dom_path and callable(write_links):
-            try:
-                dom_links = extract_links_from_dom(dom_path)
-                write_links(job_id=job_id, links=serialize_links(dom_links))
-            except Exception as exc:  # pragma: no cover - log and continue
-                LOGGER.warning("Failed to extract DOM links for %s: %s", job_id, exc)
-        tile_artifacts = storage.write_tiles(job_id=job_id, tiles=capture_result.tiles)
-        storage.write_manifest(job_id=job_id, manifest=capture_result.manifest)
-        if markdown:
-            storage.write_markdown(job_id=job_id, content=markdown)
-        blended_links: Sequence[LinkRecord] = dom_links
-        if ocr_links:
-            blended_links = blend_dom_with_ocr(dom_links=dom_links, ocr_links=ocr_links)
-        if blended_links and callable(write_links):
-            storage.write_links(job_id=job_id, links=serialize_links(blended_links))
-    except Exception:
-        raise
+    return _WEBHOOK_CLIENT
 
-    return capture_result, tile_artifacts
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook client (called from the FastAPI lifespan)."""
+
+    global _WEBHOOK_CLIENT
+    client, _WEBHOOK_CLIENT = _WEBHOOK_CLIENT, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
 
 async def _default_webhook_sender(url: str, payload: dict[str, Any]) -> None:
     """Best-effort webhook HTTP POST without signing."""
 
+    body = _encode_json(payload)
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            await client.post(url, json=payload)
+        await _webhook_client().post(url, content=body, headers={"Content-Type": "application/json"})
     except Exception as exc:  # pragma: no cover - logging only
         LOGGER.warning("Webhook delivery to %s failed: %s", url, exc)
 
@@ -767,18 +898,21 @@ async def _default_webhook_sender(url: str, payload: dict[str, Any]) -> None:
 def build_signed_webhook_sender(secret: str, *, version: str = "v1") -> WebhookSender:
     """Return a webhook sender that signs payloads using HMAC-SHA256."""
 
-    secret_bytes = secret.encode("utf-8")
+    # Key the HMAC once; copying the keyed state per payload skips re-deriving
+    # the inner/outer pads on every delivery.
+    template = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
 
     async def _sender(url: str, payload: dict[str, Any]) -> None:
-        body = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
-        signature = hmac.new(secret_bytes, body, hashlib.sha256).hexdigest()
+        body = _encode_json(payload, sort_keys=True)
+        mac = template.copy()
+        mac.update(body)
+        signature = mac.hexdigest()
         headers = {
             "Content-Type": "application/json",
             "X-MDWB-Signature": f"{version}={signature}",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                await client.post(url, content=body, headers=headers)
+            await _webhook_client().post(url, content=body, headers=headers)
         except Exception as exc:  # pragma: no cover - logging only
             LOGGER.warning("Signed webhook delivery to %s failed: %s", url, exc)
 
@@ -1045,3 +1179,34 @@ def _webhook_matches(entry: dict[str, Any], webhook_id: int | None, url: str | N
     if url:
         return entry_url == url
     return False
+
+
+def _offer(queue: asyncio.Queue[Any], item: Any) -> None:
+    """Enqueue without blocking, dropping the oldest item when a subscriber lags."""
+
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def _seam_counts(run: RunRecord | None) -> dict[str, int | None]:
+    """Seam counters persisted on the run row, in snapshot-key form."""
+
+    if run is None:
+        return {}
+    return {"seam_marker_count": run.seam_marker_count, "seam_hash_count": run.seam_hash_count}
+
+
+def _prune_webhook_entries(
+    entries: List[dict[str, Any]],
+    *,
+    webhook_id: int | None = None,
+    url: str | None = None,
+) -> int:
+    """Drop matching entries from ``entries`` in place and return how many went."""
+
+    remaining = [entry for entry in entries if not _webhook_matches(entry, webhook_id, url)]
+    removed = len(entries) - len(remaining)
+    if removed:
+        entries[:] = remaining
+    return removed
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import html
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Mapping, cast
+from typing import Any, AsyncIterator, Callable, Mapping, cast
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
@@ -18,8 +21,16 @@ from prometheus_client import start_http_server
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from app import metrics
+from app.auth import get_store, start_last_used_flusher, stop_last_used_flusher
 from app.dom_links import blend_dom_with_ocr, demo_dom_links, demo_ocr_links, serialize_links
-from app.jobs import JobManager, JobSnapshot, JobState, build_signed_webhook_sender
+from app.jobs import (
+    JobManager,
+    JobSnapshot,
+    JobState,
+    build_signed_webhook_sender,
+    close_webhook_client,
+)
+from app.ocr_client import close_ocr_client
 from app.schemas import (
     EmbeddingSearchRequest,
     EmbeddingSearchResponse,
@@ -32,14 +43,54 @@ from app.schemas import (
     WebhookDeleteRequest,
 )
 from app.settings import settings
-from app.store import build_store
-from app.warning_log import summarize_dom_assists
+from app.warning_log import (
+    start_warning_log_flusher,
+    stop_warning_log_flusher,
+    summarize_dom_assists,
+)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 WEB_ROOT = BASE_DIR / "web"
 
 LOGGER = logging.getLogger(__name__)
 _PROMETHEUS_EXPORTER_STARTED = False
+_STREAM_HEARTBEAT_SECONDS = 5
+_SSE_EVENT_NAMES = (
+    "state",
+    "progress",
+    "profile",
+    "manifest",
+    "warnings",
+    "blocklist",
+    "sweep",
+    "validation",
+    "dom_assist",
+    "runtime",
+    "artifacts",
+    "log",
+)
+_SSE_PREFIXES = {name: f"event: {name}\ndata: ".encode() for name in _SSE_EVENT_NAMES}
+_SSE_SUFFIX = b"\n\n"
+_EMBEDDING_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _embedding_executor() -> ThreadPoolExecutor:
+    """Return the pool reserved for embedding searches, one worker per core."""
+
+    global _EMBEDDING_EXECUTOR
+    if _EMBEDDING_EXECUTOR is None:
+        _EMBEDDING_EXECUTOR = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="mdwb-embeddings",
+        )
+    return _EMBEDDING_EXECUTOR
+
+
+def _shutdown_embedding_executor() -> None:
+    global _EMBEDDING_EXECUTOR
+    executor, _EMBEDDING_EXECUTOR = _EMBEDDING_EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 async def _start_prometheus_exporter() -> None:
@@ -65,9 +116,17 @@ async def _lifespan(_: FastAPI):
     await _start_prometheus_exporter()
     # Start the job watchdog to monitor for stuck jobs
     JOB_MANAGER.start_watchdog()
+    start_last_used_flusher()
+    start_warning_log_flusher()
     yield
     # Gracefully stop the watchdog on shutdown
     await JOB_MANAGER.stop_watchdog()
+    await JOB_MANAGER.stop_webhook_workers()
+    await stop_last_used_flusher()
+    await stop_warning_log_flusher()
+    await close_webhook_client()
+    await close_ocr_client()
+    _shutdown_embedding_executor()
 
 
 app = FastAPI(title="Markdown Web Browser", lifespan=_lifespan)
@@ -79,8 +138,13 @@ try:
 except ValueError:  # pragma: no cover - already registered
     LOGGER.debug("Prometheus /metrics endpoint already exposed")
 
-JOB_MANAGER = JobManager(webhook_sender=build_signed_webhook_sender(settings.webhook_secret))
-store = build_store()
+# Share one Store (and therefore one SQLite engine/connection pool) between auth
+# dependencies, the job manager, and the artifact routes.
+store = get_store()
+JOB_MANAGER = JobManager(
+    store=store,
+    webhook_sender=build_signed_webhook_sender(settings.webhook_secret),
+)
 
 
 def _demo_manifest_payload() -> dict:
@@ -311,31 +375,31 @@ async def job_stream(job_id: str, request: Request) -> StreamingResponse:
         return StreamingResponse(demo_generator(), media_type="text/event-stream")
 
     try:
-        queue = JOB_MANAGER.subscribe(job_id)
+        subscription = JOB_MANAGER.subscribe(job_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Job not found") from exc
 
-    async def event_generator() -> AsyncIterator[str]:
+    async def event_generator() -> AsyncIterator[bytes]:
         # Initial keepalive to flush connection buffers
-        yield ": connected\n\n"
+        yield b": connected\n\n"
         heartbeat = 0
-        try:
-            while True:
-                try:
-                    snapshot = await asyncio.wait_for(queue.get(), timeout=5)
-                except asyncio.TimeoutError:
-                    heartbeat += 1
-                    metrics.increment_sse_heartbeat()
-                    yield f"event: log\ndata: <li>Heartbeat {heartbeat}: waiting for updates…</li>\n\n"
-                    if await request.is_disconnected():
-                        break
-                    continue
-                for event_name, payload in _snapshot_events(snapshot):
-                    yield f"event: {event_name}\ndata: {payload}\n\n"
+        event_cache = _SnapshotEventCache()
+        while True:
+            try:
+                async with asyncio.timeout(_STREAM_HEARTBEAT_SECONDS):
+                    snapshot = await subscription.get()
+            except TimeoutError:
+                heartbeat += 1
+                metrics.increment_sse_heartbeat()
+                yield _sse_frame("log", f"<li>Heartbeat {heartbeat}: waiting for updates…</li>")
+                # StreamingResponse cancels us on disconnect; polling only while idle
+                # covers servers that never deliver http.disconnect.
                 if await request.is_disconnected():
                     break
-        finally:
-            JOB_MANAGER.unsubscribe(job_id, queue)
+                continue
+            # One write per snapshot instead of one per event keeps ASGI sends low.
+            events = _snapshot_events(snapshot, event_cache)
+            yield b"".join(_sse_frame(name, payload) for name, payload in events)
 
     return StreamingResponse(
         event_generator(),
@@ -363,23 +427,24 @@ async def job_events(job_id: str, request: Request, since: str | None = None) ->
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Job not found") from exc
 
-    async def event_generator() -> AsyncIterator[str]:
+    async def event_generator() -> AsyncIterator[bytes]:
         heartbeat = 0
         last_sequence = _extract_sequence(backlog[-1]) if backlog else None
         try:
             for entry in backlog:
-                yield _serialize_log_entry(entry) + "\n"
+                yield _serialize_log_entry(entry)
             while True:
                 try:
-                    event_entry = await asyncio.wait_for(queue.get(), timeout=5)
+                    async with asyncio.timeout(_STREAM_HEARTBEAT_SECONDS):
+                        event_entry = await queue.get()
                     heartbeat = 0
                     sequence = _extract_sequence(event_entry)
                     if sequence is not None and last_sequence is not None and sequence < last_sequence:
                         continue
                     if sequence is not None:
                         last_sequence = sequence
-                    yield _serialize_log_entry(event_entry) + "\n"
-                except asyncio.TimeoutError:
+                    yield _serialize_log_entry(event_entry)
+                except TimeoutError:
                     heartbeat += 1
                     metrics.increment_sse_heartbeat()
                     heartbeat_entry = {
@@ -387,9 +452,9 @@ async def job_events(job_id: str, request: Request, since: str | None = None) ->
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                         "data": {"count": heartbeat},
                     }
-                    yield json.dumps(heartbeat_entry) + "\n"
-                if await request.is_disconnected():
-                    break
+                    yield _ndjson_line(heartbeat_entry)
+                    if await request.is_disconnected():
+                        break
         finally:
             JOB_MANAGER.unsubscribe_events(job_id, queue)
 
@@ -457,13 +522,17 @@ async def job_artifact(job_id: str, artifact_path: str) -> FileResponse:
 async def embeddings_search(job_id: str, payload: EmbeddingSearchRequest) -> EmbeddingSearchResponse:
     """Search section embeddings for a capture run using cosine similarity."""
 
+    # Scoring is a pure-Python loop; a dedicated pool keeps large searches from
+    # starving the default executor that job persistence and tiling share.
+    search = partial(
+        store.search_section_embeddings,
+        job_id=job_id,
+        vector=payload.vector,
+        top_k=payload.top_k,
+    )
+    loop = asyncio.get_running_loop()
     try:
-        total, matches = await asyncio.to_thread(
-            store.search_section_embeddings,
-            job_id=job_id,
-            vector=payload.vector,
-            top_k=payload.top_k,
-        )
+        total, matches = await loop.run_in_executor(_embedding_executor(), search)
     except KeyError as exc:  # pragma: no cover - run not found
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except ValueError as exc:
@@ -522,7 +591,31 @@ async def delete_webhook(job_id: str, payload: WebhookDeleteRequest) -> dict[str
     return {"job_id": job_id, "deleted": deleted}
 
 
-def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
+class _SnapshotEventCache:
+    """Per-stream memo of serialized snapshot fields, keyed by object identity.
+
+    Snapshots are copy-on-write, so a manifest or artifact list that did not
+    change between broadcasts is the very same object and is not re-dumped.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Any, Any]] = {}
+
+    def get(self, key: str, source: Any, build: Callable[[Any], Any]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is source:
+            return entry[1]
+        value = build(source)
+        # Holding ``source`` keeps its id from being recycled while cached.
+        self._entries[key] = (source, value)
+        return value
+
+
+def _snapshot_events(
+    snapshot: JobSnapshot, cache: _SnapshotEventCache | None = None
+) -> list[tuple[str, str]]:
     events: list[tuple[str, str]] = []
     state = snapshot.get("state")
     if state:
@@ -536,68 +629,98 @@ def _snapshot_events(snapshot: JobSnapshot) -> list[tuple[str, str]]:
     profile_id = snapshot.get("profile_id")
     if profile_id:
         events.append(("profile", str(profile_id)))
+    if cache is None:
+        cache = _SnapshotEventCache()
     manifest = snapshot.get("manifest")
     if manifest:
-        events.append(("manifest", json.dumps(manifest)))
-        if isinstance(manifest, dict):
-            warnings = manifest.get("warnings")
-            if warnings:
-                events.append(("warnings", json.dumps(warnings)))
-            blocklist_hits = manifest.get("blocklist_hits")
-            if blocklist_hits:
-                events.append(("blocklist", json.dumps(blocklist_hits)))
-            sweep_stats = manifest.get("sweep_stats")
-            overlap_ratio = manifest.get("overlap_match_ratio")
-            if sweep_stats or overlap_ratio is not None:
-                events.append(
-                    (
-                        "sweep",
-                        json.dumps(
-                            {
-                                "sweep_stats": sweep_stats,
-                                "overlap_match_ratio": overlap_ratio,
-                            }
-                        ),
-                    )
-                )
-            validation_failures = manifest.get("validation_failures")
-            if validation_failures:
-                events.append(("validation", json.dumps(validation_failures)))
-            dom_summary = None
-            dom_assists = manifest.get("dom_assists")
-            if isinstance(dom_assists, list) and dom_assists:
-                tiles_total = manifest.get("tiles_total")
-                tiles_total_int = tiles_total if isinstance(tiles_total, int) else None
-                dom_summary = summarize_dom_assists(dom_assists, tiles_total=tiles_total_int) or {
-                    "count": len(dom_assists)
-                }
-            if not dom_summary:
-                raw_summary = manifest.get("dom_assist_summary")
-                if isinstance(raw_summary, Mapping):
-                    dom_summary = dict(raw_summary)
-                elif raw_summary:
-                    dom_summary = raw_summary
-            if dom_summary:
-                events.append(("dom_assist", json.dumps(dom_summary)))
-            environment = manifest.get("environment")
-            if isinstance(environment, dict):
-                env_data = cast(dict[str, Any], environment)
-                cft_label = str(env_data.get("cft_label") or env_data.get("cft_version") or "CfT")
-                playwright_version = str(env_data.get("playwright_version") or "?")
-                events.append(("runtime", f"{cft_label} · Playwright {playwright_version}"))
+        events.extend(cache.get("manifest", manifest, _manifest_events))
     artifacts = snapshot.get("artifacts")
     if artifacts:
-        events.append(("artifacts", json.dumps(artifacts)))
+        events.append(("artifacts", cache.get("artifacts", artifacts, _dumps)))
     error = snapshot.get("error")
     if error:
         events.append(("log", f"<li class=\"text-red-500\">{error}</li>"))
     return events
 
 
-def _serialize_log_entry(entry: dict[str, Any]) -> str:
-    payload = entry.copy()
-    payload.setdefault("event", "snapshot")
-    return json.dumps(payload)
+def _manifest_events(manifest: Any) -> list[tuple[str, str]]:
+    events: list[tuple[str, str]] = []
+    events.append(("manifest", _dumps(manifest)))
+    if isinstance(manifest, dict):
+        warnings = manifest.get("warnings")
+        if warnings:
+            events.append(("warnings", _dumps(warnings)))
+        blocklist_hits = manifest.get("blocklist_hits")
+        if blocklist_hits:
+            events.append(("blocklist", _dumps(blocklist_hits)))
+        sweep_stats = manifest.get("sweep_stats")
+        overlap_ratio = manifest.get("overlap_match_ratio")
+        if sweep_stats or overlap_ratio is not None:
+            events.append(
+                (
+                    "sweep",
+                    _dumps(
+                        {
+                            "sweep_stats": sweep_stats,
+                            "overlap_match_ratio": overlap_ratio,
+                        }
+                    ),
+                )
+            )
+        validation_failures = manifest.get("validation_failures")
+        if validation_failures:
+            events.append(("validation", _dumps(validation_failures)))
+        dom_summary = None
+        dom_assists = manifest.get("dom_assists")
+        if isinstance(dom_assists, list) and dom_assists:
+            tiles_total = manifest.get("tiles_total")
+            tiles_total_int = tiles_total if isinstance(tiles_total, int) else None
+            dom_summary = summarize_dom_assists(dom_assists, tiles_total=tiles_total_int) or {
+                "count": len(dom_assists)
+            }
+        if not dom_summary:
+            raw_summary = manifest.get("dom_assist_summary")
+            if isinstance(raw_summary, Mapping):
+                dom_summary = dict(raw_summary)
+            elif raw_summary:
+                dom_summary = raw_summary
+        if dom_summary:
+            events.append(("dom_assist", _dumps(dom_summary)))
+        environment = manifest.get("environment")
+        if isinstance(environment, dict):
+            env_data = cast(dict[str, Any], environment)
+            cft_label = str(env_data.get("cft_label") or env_data.get("cft_version") or "CfT")
+            playwright_version = str(env_data.get("playwright_version") or "?")
+            events.append(("runtime", f"{cft_label} · Playwright {playwright_version}"))
+    return events
+
+
+def _sse_frame(event: str, data: str) -> bytes:
+    """Frame one server-sent event, prefixing every payload line with ``data:``."""
+
+    if "\n" not in data and "\r" not in data:
+        prefix = _SSE_PREFIXES.get(event) or f"event: {event}\ndata: ".encode()
+        return prefix + data.encode() + _SSE_SUFFIX
+    lines = "\n".join(f"data: {line}" for line in data.splitlines())
+    return f"event: {event}\n{lines}\n\n".encode()
+
+
+def _dumps(payload: Any) -> str:
+    """Compact JSON text for stream payloads."""
+
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def _ndjson_line(payload: Any) -> bytes:
+    """One newline-terminated NDJSON record, encoded straight to bytes."""
+
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+
+def _serialize_log_entry(entry: dict[str, Any]) -> bytes:
+    if "event" not in entry:
+        entry = {**entry, "event": "snapshot"}
+    return _ndjson_line(entry)
 
 
 def _extract_sequence(entry: Mapping[str, Any]) -> int | None:
@@ -5,21 +5,36 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 import base64
+from email.utils import parsedate_to_datetime
 import logging
+import random
 import time
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Sequence, cast
 
 import httpx
+import orjson
 
 from app.settings import Settings, get_settings
 
+try:  # pybase64 (SIMD libbase64) speeds up tile encoding; output is byte-identical
+    import pybase64 as _b64
+except ImportError:  # pragma: no cover - optional speedup
+    _b64 = base64  # type: ignore[assignment]
+
 LOGGER = logging.getLogger(__name__)
 DEFAULT_ENDPOINT_SUFFIX = "/chat/completions"  # OpenAI-compatible endpoint
 REQUEST_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=30.0, pool=10.0)
 _BACKOFF_SCHEDULE = (3.0, 9.0)
 _MAX_ATTEMPTS = len(_BACKOFF_SCHEDULE) + 1
+_MAX_RETRY_AFTER_SECONDS = 60.0
+_THROTTLE_STATUS_CODES = frozenset({429, 503})
 _QUOTA_WARNING_RATIO = 0.7
+_TASK_WAVE_SIZE = 64
+_IMAGE_PLACEHOLDER_TOKEN = b"@@mdwb-tile@@"
+_IMAGE_URL_PLACEHOLDER = "data:image/png;base64," + _IMAGE_PLACEHOLDER_TOKEN.decode("ascii")
 
 
 @dataclass(slots=True)
@@ -68,9 +83,10 @@ class _EncodedTile:
     """Internal helper storing base64 payload + size metadata."""
 
     tile_id: str
-    image_b64: str
+    image_b64: bytes
     size_bytes: int
     model: str | None
+    index: int = 0
 
 
 @dataclass(slots=True)
@@ -215,36 +231,42 @@ class _AutotuneController:
 
 
 class _AdaptiveLimiter:
-    """Async semaphore wrapper with adjustable concurrency."""
+    """Admission gate whose concurrency limit can move while slots are held."""
 
     def __init__(self, controller: _AutotuneController) -> None:
         self._controller = controller
-        self._semaphore = asyncio.Semaphore(controller.current)
-        self._pending_reduction = 0
-        self._limit_lock = asyncio.Lock()
+        self._limit = controller.current
+        self._active = 0
+        self._cond = asyncio.Condition()
 
     @asynccontextmanager
     async def slot(self):
-        await self._semaphore.acquire()
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
         try:
             yield
         finally:
-            if self._pending_reduction > 0:
-                self._pending_reduction -= 1
-            else:
-                self._semaphore.release()
+            # Decrement before taking the lock so a cancelled release never leaks a slot,
+            # and shield the wakeup so cancellation cannot drop the notify either.
+            self._active -= 1
+            await asyncio.shield(self._wake_one())
+
+    async def _wake_one(self) -> None:
+        async with self._cond:
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            grew = limit > self._limit
+            self._limit = max(1, limit)
+            if grew:
+                self._cond.notify_all()
 
     async def record(self, telemetry: OCRBatchTelemetry) -> OcrAutotuneEvent | None:
         event = self._controller.observe(telemetry)
-        if not event:
-            return None
-        async with self._limit_lock:
-            diff = event.new_limit - event.previous_limit
-            if diff > 0:
-                for _ in range(diff):
-                    self._semaphore.release()
-            elif diff < 0:
-                self._pending_reduction += -diff
+        if event:
+            await self.set_limit(event.new_limit)
         return event
 
     def snapshot(self) -> OcrAutotuneSnapshot:
@@ -271,13 +293,13 @@ async def submit_tiles(
     if cfg.ocr.api_key and not cfg.ocr.local_url:
         headers["Authorization"] = f"Bearer {cfg.ocr.api_key}"
 
-    owns_client = client is None
-    http_client = client or httpx.AsyncClient(timeout=REQUEST_TIMEOUT, http2=True)
+    http_client = client or _ocr_client()
 
     min_limit = max(1, cfg.ocr.min_concurrency)
     max_limit = max(min_limit, cfg.ocr.max_concurrency)
     limiter = _AdaptiveLimiter(_AutotuneController(min_limit=min_limit, max_limit=max_limit))
-    encoded_tiles = [_encode_request(req, cfg) for req in requests]
+    # Base64-encoding full-resolution tiles is CPU-bound; keep it off the event loop.
+    encoded_tiles = await asyncio.to_thread(_encode_requests, requests, cfg)
 
     # For OpenAI-compatible endpoints, force 1 tile per batch since the API
     # returns a single combined response for multiple images
@@ -290,7 +312,7 @@ async def submit_tiles(
     )
 
     telemetry: list[OCRBatchTelemetry] = []
-    markdown_by_id: dict[str, str] = {req.tile_id: "" for req in requests}
+    markdown_chunks: list[str] = [""] * len(requests)
 
     async def _submit(group: list[_EncodedTile]) -> None:
         async with limiter.slot():
@@ -302,18 +324,21 @@ async def submit_tiles(
                 use_fp8=cfg.ocr.use_fp8,
             )
         telemetry.append(batch_result.telemetry)
-        for tile_id, chunk in zip(batch_result.tile_ids, batch_result.markdown, strict=True):
-            markdown_by_id[tile_id] = chunk
+        for tile, chunk in zip(group, batch_result.markdown, strict=True):
+            markdown_chunks[tile.index] = chunk
         await limiter.record(batch_result.telemetry)
 
-    try:
-        await asyncio.gather(*(_submit(group) for group in batches))
-    finally:
-        if owns_client:
-            await http_client.aclose()
+    # Bounded waves cap how many Task objects exist at once, and TaskGroup cancels
+    # the rest of a wave as soon as one batch fails for good.
+    for start in range(0, len(batches), _TASK_WAVE_SIZE):
+        try:
+            async with asyncio.TaskGroup() as group_tasks:
+                for group in batches[start : start + _TASK_WAVE_SIZE]:
+                    group_tasks.create_task(_submit(group))
+        except ExceptionGroup as failures:
+            raise failures.exceptions[0] from None
 
     quota_status = _quota_tracker.record(len(requests), limit=cfg.ocr.daily_quota_tiles, ratio=_QUOTA_WARNING_RATIO)
-    markdown_chunks = [markdown_by_id[tile.tile_id] for tile in encoded_tiles]
     return SubmitTilesResult(
         markdown_chunks=markdown_chunks,
         batches=telemetry,
@@ -322,6 +347,31 @@ async def submit_tiles(
     )
 
 
+_OCR_CLIENT: httpx.AsyncClient | None = None
+
+
+def _ocr_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP/2 client shared by every OCR submission."""
+
+    global _OCR_CLIENT
+    if _OCR_CLIENT is None or _OCR_CLIENT.is_closed:
+        _OCR_CLIENT = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            http2=True,
+        )
+    return _OCR_CLIENT
+
+
+async def close_ocr_client() -> None:
+    """Close the shared OCR client (called from the FastAPI lifespan)."""
+
+    global _OCR_CLIENT
+    client, _OCR_CLIENT = _OCR_CLIENT, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 def reset_quota_tracker() -> None:
     """Reset quota accounting (exposed for testability)."""
 
@@ -349,15 +399,17 @@ async def _submit_batch(
     status_code = 0
     request_id: str | None = None
     tile_ids = tuple(tile.tile_id for tile in tiles)
+    # Serialize the (multi-megabyte) body once per batch and reuse it across retries.
+    body = await asyncio.to_thread(_encode_payload, tiles, use_fp8)
     while attempts < _MAX_ATTEMPTS:
         attempts += 1
-        payload = _build_payload(tiles, use_fp8=use_fp8)
+        failed_response: httpx.Response | None = None
         start = time.perf_counter()
         try:
-            response = await http_client.post(endpoint, headers=headers, json=payload)
+            response = await http_client.post(endpoint, headers=headers, content=body)
             status_code = response.status_code
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             markdown = _extract_markdown_batch(data, tile_ids)
             latency_ms = int((time.perf_counter() - start) * 1000)
             request_id = _extract_request_id(response, data)
@@ -372,6 +424,7 @@ async def _submit_batch(
             return _BatchResult(tile_ids=tile_ids, markdown=markdown, telemetry=telemetry)
         except httpx.HTTPStatusError as exc:
             status_code = exc.response.status_code
+            failed_response = exc.response
             last_error = exc
             LOGGER.warning(
                 "olmOCR request failed (status=%s, attempt=%s/%s)",
@@ -388,18 +441,51 @@ async def _submit_batch(
             )
         if attempts >= _MAX_ATTEMPTS:
             break
-        backoff_index = min(attempts - 1, len(_BACKOFF_SCHEDULE) - 1)
-        await _sleep(_BACKOFF_SCHEDULE[backoff_index])
+        await _sleep(_retry_delay(attempts, failed_response))
     raise RuntimeError(f"olmOCR request failed after {_MAX_ATTEMPTS} attempts") from last_error
 
 
-def _build_payload(tiles: Sequence[_EncodedTile], *, use_fp8: bool) -> dict:
+def _retry_delay(attempts: int, response: httpx.Response | None = None) -> float:
+    """Return the pause before the next attempt.
+
+    Throttled responses (429/503) honor ``Retry-After`` when present; otherwise
+    the backoff schedule is applied with equal jitter so concurrent batches
+    that failed together do not retry in lockstep.
+    """
+
+    if response is not None and response.status_code in _THROTTLE_STATUS_CODES:
+        hinted = _parse_retry_after(response.headers.get("retry-after"))
+        if hinted is not None:
+            return min(hinted, _MAX_RETRY_AFTER_SECONDS)
+    base = _BACKOFF_SCHEDULE[min(attempts - 1, len(_BACKOFF_SCHEDULE) - 1)]
+    return base / 2 + random.uniform(0, base / 2)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP date."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _build_payload(model: str | None, tile_count: int, *, use_fp8: bool) -> dict:
     # OpenAI-compatible vision format with multiple images in content array
-    if not tiles:
+    if tile_count < 1:
         raise ValueError("Must provide at least one tile")
 
     # Add allenai/ prefix if not present (for DeepInfra)
-    model = tiles[0].model
     if not model:
         model = "olmOCR-2-7B-1025-FP8"  # Fallback to default model
     if not model.startswith("allenai/") and "olmOCR" in model:
@@ -483,11 +569,11 @@ def _build_payload(tiles: Sequence[_EncodedTile], *, use_fp8: bool) -> dict:
     }]
 
     # Add all tile images
-    for tile in tiles:
+    for _ in range(tile_count):
         content.append({
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/png;base64,{tile.image_b64}"
+                "url": _IMAGE_URL_PLACEHOLDER
             }
         })
 
@@ -501,14 +587,48 @@ def _build_payload(tiles: Sequence[_EncodedTile], *, use_fp8: bool) -> dict:
     }
 
 
-def _encode_request(request: OCRRequest, settings: Settings) -> _EncodedTile:
-    image_b64 = base64.b64encode(request.tile_bytes).decode("ascii")
+def _encode_payload(tiles: Sequence[_EncodedTile], use_fp8: bool) -> bytes:
+    """Serialize the request body, splicing each tile's base64 bytes in directly.
+
+    Base64 output never needs JSON escaping, so the images skip the str decode,
+    the data-URL f-string and the encoder's escape scan; the envelope itself is
+    serialized once per (model, tile count) and reused.
+    """
+
+    if not tiles:
+        raise ValueError("Must provide at least one tile")
+    parts = _payload_template(tiles[0].model, len(tiles), use_fp8)
+    chunks = [parts[0]]
+    for tile, tail in zip(tiles, parts[1:], strict=True):
+        chunks.append(tile.image_b64)
+        chunks.append(tail)
+    return b"".join(chunks)
+
+
+@lru_cache(maxsize=32)
+def _payload_template(model: str | None, tile_count: int, use_fp8: bool) -> tuple[bytes, ...]:
+    """Return the serialized envelope split around each image placeholder."""
+
+    envelope = orjson.dumps(_build_payload(model, tile_count, use_fp8=use_fp8))
+    parts = tuple(envelope.split(_IMAGE_PLACEHOLDER_TOKEN))
+    if len(parts) != tile_count + 1:
+        raise ValueError("OCR payload template lost an image placeholder")
+    return parts
+
+
+def _encode_requests(requests: Sequence[OCRRequest], settings: Settings) -> list[_EncodedTile]:
+    return [_encode_request(req, settings, index=idx) for idx, req in enumerate(requests)]
+
+
+def _encode_request(request: OCRRequest, settings: Settings, *, index: int = 0) -> _EncodedTile:
+    image_b64 = _b64.b64encode(request.tile_bytes)
     model = request.model or settings.ocr.model
     return _EncodedTile(
         tile_id=request.tile_id,
         image_b64=image_b64,
         size_bytes=len(image_b64),
         model=model,
+        index=index,
     )
 
 
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
-import threading
+import logging
+from array import array
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from itertools import count
+from typing import Any, Dict, Optional, Union
 
 from fastapi import HTTPException, Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.settings import Settings
+from app.settings import Settings, settings as global_settings
+
+try:  # redis backs the shared limiter; slim installs keep per-process buckets
+    from redis.exceptions import RedisError
+except ImportError:  # pragma: no cover - optional backend
+    RedisError = OSError  # type: ignore[assignment,misc]
+
+LOGGER = logging.getLogger(__name__)
+
+
+_API_KEY_PREFIX = "mdwb_"
+_API_KEY_LEN = len(_API_KEY_PREFIX) + 32
 
 
 def extract_rate_limit_key(request: Request) -> str:
@@ -25,8 +39,9 @@ def extract_rate_limit_key(request: Request) -> str:
         Rate limit key string (api_key:*, api_key_id:*, or ip:*)
     """
     # Try to get API key from header
-    api_key = request.headers.get("X-API-Key", None)
-    if api_key and api_key.startswith("mdwb_") and len(api_key) == 37:
+    api_key = request.headers.get("x-api-key")
+    # Length first: the cheapest test rejects most non-key values outright
+    if api_key is not None and len(api_key) == _API_KEY_LEN and api_key.startswith(_API_KEY_PREFIX):
         # Valid API key format - use prefix for rate limiting
         return f"api_key:{api_key[:12]}"
 
@@ -39,7 +54,7 @@ def extract_rate_limit_key(request: Request) -> str:
     return f"ip:{client_host}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenBucket:
     """Token bucket for rate limiting.
 
@@ -50,20 +65,31 @@ class TokenBucket:
     capacity: int  # Maximum tokens
     tokens: float  # Current tokens
     refill_rate: float  # Tokens per second
-    last_refill: float  # Timestamp of last refill
+    last_refill: float  # time.monotonic() of last refill
 
-    def consume(self, tokens: int = 1) -> bool:
+    def consume(self, tokens: int = 1, now: float | None = None) -> bool:
         """Try to consume tokens. Returns True if successful, False if insufficient tokens."""
-        self._refill()
+        self._refill(now)
 
         if self.tokens >= tokens:
             self.tokens -= tokens
             return True
         return False
 
-    def _refill(self) -> None:
+    def consume_one(self, now: float) -> bool:
+        """``consume(1, now)`` with the refill inlined, for the per-request path."""
+        tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        if tokens >= 1.0:
+            self.tokens = tokens - 1.0
+            return True
+        self.tokens = tokens
+        return False
+
+    def _refill(self, now: float | None = None) -> None:
         """Refill tokens based on elapsed time."""
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         elapsed = now - self.last_refill
 
         # Add tokens based on elapsed time
@@ -71,9 +97,9 @@ class TokenBucket:
         self.tokens = min(self.capacity, self.tokens + new_tokens)
         self.last_refill = now
 
-    def time_until_available(self, tokens: int = 1) -> float:
+    def time_until_available(self, tokens: int = 1, now: float | None = None) -> float:
         """Calculate seconds until enough tokens are available."""
-        self._refill()
+        self._refill(now)
 
         if self.tokens >= tokens:
             return 0.0
@@ -81,9 +107,9 @@ class TokenBucket:
         needed = tokens - self.tokens
         return needed / self.refill_rate
 
-    def get_stats(self) -> Dict[str, float]:
+    def get_stats(self, now: float | None = None) -> Dict[str, float]:
         """Get current bucket statistics."""
-        self._refill()
+        self._refill(now)
         # Prevent division by zero if capacity is 0
         utilization = (
             1.0 - (self.tokens / self.capacity) if self.capacity > 0 else 0.0
@@ -96,6 +122,9 @@ class TokenBucket:
         }
 
 
+_BUCKET_SHARDS = 256  # power of two so the shard index is a mask
+
+
 class RateLimiter:
     """In-memory rate limiter using token buckets.
 
@@ -123,23 +152,37 @@ class RateLimiter:
         # Allow bursts up to the per-minute limit
         self.burst_capacity = burst_capacity or requests_per_minute
 
-        # Storage: key -> TokenBucket
-        self.buckets: Dict[str, TokenBucket] = {}
-
-    def _create_bucket(self) -> TokenBucket:
-        """Create a new token bucket with configured limits."""
-        return TokenBucket(
-            capacity=self.burst_capacity,
-            tokens=self.burst_capacity,  # Start full
-            refill_rate=self.requests_per_second,
-            last_refill=time.time(),
+        # Every key shares one (capacity, refill rate), so per-key state is just
+        # two floats kept in parallel arrays; shards map key -> slot index.
+        # Each shard is kept in least-recently-used order, which is also
+        # last-refill order, so cleanup only looks at the stale prefix.
+        self._shards: tuple[OrderedDict[str, int], ...] = tuple(
+            OrderedDict() for _ in range(_BUCKET_SHARDS)
         )
-
-    def _get_bucket(self, key: str) -> TokenBucket:
-        """Get or create a token bucket for the given key."""
-        if key not in self.buckets:
-            self.buckets[key] = self._create_bucket()
-        return self.buckets[key]
+        self._tokens = array("d")
+        self._last_refill = array("d")
+        self._free_slots: list[int] = []
+
+    def _shard(self, key: str) -> OrderedDict[str, int]:
+        return self._shards[hash(key) & (_BUCKET_SHARDS - 1)]
+
+    def _slot(self, key: str, now: float) -> int:
+        """Return the array slot for ``key``, allocating a full bucket on first use."""
+        shard = self._shard(key)
+        slot = shard.get(key)
+        if slot is not None:
+            shard.move_to_end(key)
+            return slot
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._tokens[slot] = self.burst_capacity
+            self._last_refill[slot] = now
+        else:
+            slot = len(self._tokens)
+            self._tokens.append(self.burst_capacity)
+            self._last_refill.append(now)
+        shard[key] = slot
+        return slot
 
     def check_rate_limit(self, key: str, tokens: int = 1) -> tuple[bool, Dict[str, Any]]:
         """Check if request is allowed under rate limit.
@@ -151,21 +194,35 @@ class RateLimiter:
                 - reset: Unix timestamp when bucket will be completely full
                 - retry_after: (if not allowed) Seconds to wait before retrying
         """
-        bucket = self._get_bucket(key)
-        allowed = bucket.consume(tokens)
-
-        stats = bucket.get_stats()
-        stats["limit"] = self.requests_per_minute
-        stats["remaining"] = int(bucket.tokens)
-        # Reset = when bucket will be completely full (burst capacity restored)
-        # Note: You may still have tokens available before this time
-        stats["reset"] = int(
-            time.time() + bucket.time_until_available(self.burst_capacity)
-        )
+        now = time.monotonic()
+        slot = self._slot(key, now)
+        capacity = self.burst_capacity
+        rate = self.requests_per_second
+        # Refill inline with the limiter-wide constants held in locals; the
+        # token column is written once whether or not the request is admitted.
+        last_refill = self._last_refill
+        available = min(capacity, self._tokens[slot] + (now - last_refill[slot]) * rate)
+        last_refill[slot] = now
+        allowed = available >= tokens
+        if allowed:
+            available -= tokens
+        self._tokens[slot] = available
+
+        stats: Dict[str, Any] = {
+            "tokens": available,
+            "capacity": capacity,
+            "refill_rate": rate,
+            "utilization": 1.0 - (available / capacity) if capacity > 0 else 0.0,
+            "limit": self.requests_per_minute,
+            "remaining": int(available),
+            # Reset = when bucket will be completely full (burst capacity restored)
+            # Note: You may still have tokens available before this time
+            "reset": int(time.time() + max(0.0, capacity - available) / rate),
+        }
 
         if not allowed:
             # Retry after = when next single token will be available
-            stats["retry_after"] = int(bucket.time_until_available(1)) + 1
+            stats["retry_after"] = int(max(0.0, 1 - available) / rate) + 1
 
         return allowed, stats
 
@@ -175,109 +232,300 @@ class RateLimiter:
         Returns:
             Number of buckets removed
         """
-        now = time.time()
-        stale_keys = [
-            key
-            for key, bucket in self.buckets.items()
-            if now - bucket.last_refill > max_age_seconds
-        ]
+        cutoff = time.monotonic() - max_age_seconds
+        last_refill = self._last_refill
+        removed = 0
+        for shard in self._shards:
+            # Oldest first: stop at the first bucket that is still live.
+            while shard and last_refill[next(iter(shard.values()))] < cutoff:
+                _, slot = shard.popitem(last=False)
+                self._free_slots.append(slot)
+                removed += 1
+        return removed
+
+    async def check(self, key: str, tokens: int = 1) -> tuple[bool, Dict[str, Any]]:
+        """Awaitable form of :meth:`check_rate_limit` shared with ``RedisRateLimiter``."""
+        return self.check_rate_limit(key, tokens)
+
+    def return_tokens(self, key: str, tokens: int) -> None:
+        """Credit unused pre-borrowed tokens back to ``key``'s bucket."""
+        slot = self._shard(key).get(key)
+        if slot is not None and tokens > 0:
+            self._tokens[slot] = min(self.burst_capacity, self._tokens[slot] + tokens)
+
+
+# Rolling one-minute window over a sorted set of request timestamps. Trimming,
+# counting and admitting happen in one script, so replicas never race and each
+# check is a single round-trip.
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local used = redis.call('ZCARD', KEYS[1])
+local limit = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[6])
+if used + tokens <= limit then
+  for i = 1, tokens do
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[4] .. ':' .. i)
+  end
+  redis.call('PEXPIRE', KEYS[1], ARGV[5])
+  return {1, limit - used - tokens, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, 0, tonumber(oldest[2]) or 0}
+"""
+
+
+class RedisRateLimiter:
+    """Sliding-window rate limiter shared by every worker through Redis.
+
+    Falls back to the in-process ``RateLimiter`` whenever Redis cannot be
+    reached, so an outage degrades to per-worker limits instead of failing open
+    or rejecting every request.
+    """
 
-        for key in stale_keys:
-            del self.buckets[key]
+    _WINDOW_MS = 60_000
 
-        return len(stale_keys)
+    def __init__(
+        self,
+        client: Any,
+        requests_per_minute: int = 60,
+        *,
+        fallback: RateLimiter | None = None,
+        key_prefix: str = "mdwb:ratelimit:",
+    ):
+        if requests_per_minute <= 0:
+            raise ValueError(
+                f"requests_per_minute must be positive, got {requests_per_minute}"
+            )
+        self.requests_per_minute = requests_per_minute
+        self.fallback = fallback or RateLimiter(requests_per_minute=requests_per_minute)
+        self._key_prefix = key_prefix
+        # register_script issues EVALSHA and reloads the script on NOSCRIPT.
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+        self._members = count()
+        self._degraded = False
+
+    async def check(self, key: str, tokens: int = 1) -> tuple[bool, Dict[str, Any]]:
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}:{id(self):x}:{next(self._members)}"
+        try:
+            allowed, remaining, oldest_ms = await self._script(
+                keys=[self._key_prefix + key],
+                args=[
+                    now_ms - self._WINDOW_MS,
+                    self.requests_per_minute,
+                    now_ms,
+                    member,
+                    self._WINDOW_MS,
+                    tokens,
+                ],
+            )
+        except (RedisError, OSError) as exc:
+            return self._fall_back(key, tokens, exc)
+
+        if self._degraded:
+            LOGGER.info("Redis rate limiter recovered; resuming shared limits")
+            self._degraded = False
+        stats: Dict[str, Any] = {
+            "limit": self.requests_per_minute,
+            "remaining": int(remaining),
+            "reset": (now_ms + self._WINDOW_MS) // 1000,
+        }
+        if not allowed:
+            wait_ms = max(0, int(oldest_ms) + self._WINDOW_MS - now_ms)
+            stats["retry_after"] = wait_ms // 1000 + 1
+        return bool(allowed), stats
 
+    def return_tokens(self, key: str, tokens: int) -> None:
+        """No-op: borrowed entries age out of the sliding window on their own."""
 
-# Global rate limiter instance (for single-process deployments)
-# For multi-worker deployments, use Redis-backed rate limiting
-_global_limiter: Optional[RateLimiter] = None
-_limiter_lock = threading.Lock()
+    def _fall_back(self, key: str, tokens: int, exc: BaseException) -> tuple[bool, Dict[str, Any]]:
+        if not self._degraded:
+            LOGGER.warning("Redis rate limiter unavailable (%s); using in-process buckets", exc)
+            self._degraded = True
+        return self.fallback.check_rate_limit(key, tokens)
 
 
-def get_rate_limiter(settings: Settings | None = None) -> RateLimiter:
-    """Get or create the global rate limiter instance.
+AnyRateLimiter = Union[RateLimiter, RedisRateLimiter]
 
-    Thread-safe singleton implementation using double-checked locking pattern.
 
-    Args:
-        settings: Optional settings to configure rate limiter.
-                  Only used on first initialization, ignored afterwards.
+def build_rate_limiter(settings: Settings) -> AnyRateLimiter:
+    """Construct the limiter described by ``settings``.
 
     Returns:
-        RateLimiter: Global rate limiter instance
+        RedisRateLimiter when ``RATE_LIMIT_REDIS_URL`` is configured, otherwise the
+        in-process RateLimiter
     """
-    global _global_limiter
+    # Get rate limit from settings, default to 60 requests per minute
+    requests_per_minute = getattr(settings, "RATE_LIMIT_PER_MINUTE", 60)
 
-    # Fast path - if already initialized, return immediately without locking
-    if _global_limiter is not None:
-        return _global_limiter
+    local_limiter = RateLimiter(requests_per_minute=requests_per_minute)
+    redis_url = getattr(settings, "RATE_LIMIT_REDIS_URL", None)
+    if not redis_url:
+        return local_limiter
+    # Imported lazily: single-worker deployments never touch Redis.
+    from redis import asyncio as redis_asyncio
 
-    # Slow path - need to initialize, acquire lock
-    with _limiter_lock:
-        # Double-check: another thread might have initialized while we waited for lock
-        if _global_limiter is None:
-            from app.settings import settings as global_settings
+    # from_url only builds the pool; connections open on first use.
+    return RedisRateLimiter(
+        redis_asyncio.from_url(redis_url),
+        requests_per_minute=requests_per_minute,
+        fallback=local_limiter,
+    )
 
-            active_settings = settings or global_settings
 
-            # Get rate limit from settings, default to 60 requests per minute
-            requests_per_minute = getattr(
-                active_settings, "RATE_LIMIT_PER_MINUTE", 60
-            )
+# Global rate limiter instance, built once at import from the process settings.
+# For multi-worker deployments, set RATE_LIMIT_REDIS_URL to share the window.
+_global_limiter: AnyRateLimiter = build_rate_limiter(global_settings)
 
-            _global_limiter = RateLimiter(requests_per_minute=requests_per_minute)
 
+def get_rate_limiter() -> AnyRateLimiter:
+    """Return the global rate limiter instance."""
     return _global_limiter
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting.
+def set_rate_limiter(limiter: AnyRateLimiter) -> AnyRateLimiter:
+    """Swap the global limiter (tests, embedding apps); returns the previous one."""
+    global _global_limiter
+    previous, _global_limiter = _global_limiter, limiter
+    return previous
+
+
+# Per-key buckets for API keys that carry their own ``rate_limit`` (requests/minute)
+_api_key_buckets: Dict[int, TokenBucket] = {}
+
+
+def enforce_api_key_rate_limit(api_key_id: int, requests_per_minute: int | None) -> None:
+    """Consume one token from the bucket of an API key with a per-key limit.
+
+    Keys without a limit pass straight through. The check is plain arithmetic on
+    an in-process bucket and never awaits, so it needs no lock on the event loop.
+
+    Raises:
+        HTTPException: 429 with Retry-After when the key's bucket is empty
+    """
+    if not requests_per_minute or requests_per_minute <= 0:
+        return
+
+    now = time.monotonic()
+    bucket = _api_key_buckets.get(api_key_id)
+    if bucket is None or bucket.capacity != requests_per_minute:
+        # New key, or its limit changed since the bucket was created
+        bucket = _api_key_buckets[api_key_id] = TokenBucket(
+            capacity=requests_per_minute,
+            tokens=requests_per_minute,
+            refill_rate=requests_per_minute / 60.0,
+            last_refill=now,
+        )
+
+    if bucket.consume_one(now):
+        return
+    # consume_one() already refilled at ``now``; the wait is plain arithmetic.
+    retry_after = int((1 - bucket.tokens) / bucket.refill_rate) + 1
+
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="API key rate limit exceeded. Please try again later.",
+        headers={
+            "Retry-After": str(retry_after),
+            "X-RateLimit-Limit": str(requests_per_minute),
+            "X-RateLimit-Remaining": "0",
+        },
+    )
+
+
+_MAX_CREDIT_ENTRIES = 4096  # sweep expired pre-borrowed credit past this many keys
+_RATE_LIMIT_BODY = b'{"detail":"Rate limit exceeded. Please try again later."}'
+# Limits, remaining counts and retry delays are small integers; format them once.
+_SMALL_INT_BYTES = tuple(str(value).encode("ascii") for value in range(1024))
+# Raw ASGI header names (lowercase, as Starlette stores them).
+_LIMIT_HEADER = b"x-ratelimit-limit"
+_REMAINING_HEADER = b"x-ratelimit-remaining"
+_RESET_HEADER = b"x-ratelimit-reset"
+_RETRY_AFTER_HEADER = b"retry-after"
+
+
+def _header_int(value: int) -> bytes:
+    if 0 <= value < len(_SMALL_INT_BYTES):
+        return _SMALL_INT_BYTES[value]
+    return str(value).encode("ascii")
+
+
+class RateLimitMiddleware:
+    """ASGI middleware for rate limiting.
 
     Adds rate limit headers to all responses:
     - X-RateLimit-Limit: Maximum requests per minute
     - X-RateLimit-Remaining: Remaining requests in current window
     - X-RateLimit-Reset: Unix timestamp when limit resets
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware`` so requests
+    are not re-run in a child task with the body piped through a stream.
     """
 
-    def __init__(self, app, limiter: Optional[RateLimiter] = None):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[AnyRateLimiter] = None,
+        *,
+        borrow_batch: int = 1,
+        credit_ttl_seconds: float = 1.0,
+    ):
+        """Wrap ``app`` with rate limiting.
+
+        Args:
+            borrow_batch: Tokens taken from the limiter per check for hot keys.
+                Values above 1 let following requests spend the leftover credit
+                locally, trading a slightly larger effective burst for one
+                limiter call per batch. Defaults to 1 (no pre-borrowing).
+            credit_ttl_seconds: How long borrowed credit stays spendable before
+                unused tokens are handed back to the limiter.
+        """
+        self.app = app
         self.limiter = limiter or get_rate_limiter()
+        self._borrow_batch = max(1, borrow_batch)
+        self._credit_ttl = credit_ttl_seconds
+        # key -> (tokens left, borrowed at (monotonic), stats from the borrow)
+        self._local_credit: Dict[str, tuple[int, float, Dict[str, Any]]] = {}
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and apply rate limiting."""
 
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Get rate limit key (API key or IP address)
-        rate_limit_key = self._get_rate_limit_key(request)
+        rate_limit_key = self._get_rate_limit_key(Request(scope))
 
         # Check rate limit
-        allowed, stats = self.limiter.check_rate_limit(rate_limit_key)
+        allowed, stats = await self._admit(rate_limit_key)
 
-        # Add rate limit headers
-        headers = {
-            "X-RateLimit-Limit": str(stats["limit"]),
-            "X-RateLimit-Remaining": str(stats["remaining"]),
-            "X-RateLimit-Reset": str(stats["reset"]),
-        }
+        # Rate limit headers, appended straight onto the raw ASGI header list
+        headers = [
+            (_LIMIT_HEADER, _header_int(stats["limit"])),
+            (_REMAINING_HEADER, _header_int(stats["remaining"])),
+            (_RESET_HEADER, _header_int(stats["reset"])),
+        ]
 
         if not allowed:
-            # Rate limit exceeded
-            headers["Retry-After"] = str(stats["retry_after"])
+            # Rate limit exceeded; answer without touching the app
+            headers.append((_RETRY_AFTER_HEADER, _header_int(stats["retry_after"])))
 
-            return Response(
-                content='{"detail": "Rate limit exceeded. Please try again later."}',
+            response = Response(
+                content=_RATE_LIMIT_BODY,
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                headers=headers,
                 media_type="application/json",
             )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
 
-        # Add rate limit headers to response
-        for key, value in headers.items():
-            response.headers[key] = value
-
-        return response
+        await self.app(scope, receive, send_with_rate_limit_headers)
 
     def _get_rate_limit_key(self, request: Request) -> str:
         """Extract rate limit key from request.
@@ -286,6 +534,40 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """
         return extract_rate_limit_key(request)
 
+    async def _admit(self, key: str) -> tuple[bool, Dict[str, Any]]:
+        """Spend local credit when possible, otherwise consult the limiter."""
+        if self._borrow_batch == 1:
+            return await self.limiter.check(key)
+
+        now = time.monotonic()
+        credit = self._local_credit.pop(key, None)
+        if credit is not None:
+            left, borrowed_at, stats = credit
+            if now - borrowed_at < self._credit_ttl:
+                if left > 1:
+                    self._local_credit[key] = (left - 1, borrowed_at, stats)
+                return True, {**stats, "remaining": stats["remaining"] + left - 1}
+            self.limiter.return_tokens(key, left)
+
+        allowed, stats = await self.limiter.check(key, self._borrow_batch)
+        if not allowed:
+            # Not enough for a whole batch; a single token may still be there.
+            return await self.limiter.check(key)
+        if len(self._local_credit) >= _MAX_CREDIT_ENTRIES:
+            self._drop_expired_credit(now)
+        self._local_credit[key] = (self._borrow_batch - 1, now, stats)
+        return True, {**stats, "remaining": stats["remaining"] + self._borrow_batch - 1}
+
+    def _drop_expired_credit(self, now: float) -> None:
+        expired = [
+            key
+            for key, (_, borrowed_at, _) in self._local_credit.items()
+            if now - borrowed_at >= self._credit_ttl
+        ]
+        for key in expired:
+            left, _, _ = self._local_credit.pop(key)
+            self.limiter.return_tokens(key, left)
+
 
 # Dependency for manual rate limit checking in endpoints
 async def check_rate_limit(
@@ -325,7 +607,7 @@ async def check_rate_limit(
     key = extract_rate_limit_key(request)
 
     # Check rate limit
-    allowed, stats = limiter.check_rate_limit(key, tokens)
+    allowed, stats = await limiter.check(key, tokens)
 
     if not allowed:
         raise HTTPException(
@@ -137,6 +137,11 @@ class ManifestWarning(BaseModel):
     count: float = Field(ge=0, description="Observed count/ratio triggering the warning")
     threshold: float = Field(ge=0, description="Configured threshold for the warning")
 
+    def to_dict(self) -> dict[str, Any]:
+        """Same shape as ``model_dump()`` without the generic serializer walk."""
+
+        return {"code": self.code, "message": self.message, "count": self.count, "threshold": self.threshold}
+
 
 class ManifestTimings(BaseModel):
     """Timing metrics captured for each job."""
@@ -132,6 +132,7 @@ class Settings:
     # Authentication settings
     REQUIRE_API_KEY: bool = False
     API_KEY_HEADER: str = "X-API-Key"
+    RATE_LIMIT_REDIS_URL: str | None = None
 
     def manifest_environment(self, *, playwright_version: str | None = None) -> ManifestEnvironment:
         """Return the manifest metadata block used across captures."""
@@ -343,6 +344,7 @@ def get_settings(env_path: str = ".env") -> Settings:
     # Authentication settings
     require_api_key = _bool(cfg, "REQUIRE_API_KEY", default=False)
     api_key_header = cfg("API_KEY_HEADER", default="X-API-Key")
+    rate_limit_redis_url = cfg("RATE_LIMIT_REDIS_URL", default="") or None
 
     return Settings(
         env_path=env_path,
@@ -357,6 +359,7 @@ def get_settings(env_path: str = ".env") -> Settings:
         server_runtime=server_runtime,
         REQUIRE_API_KEY=require_api_key,
         API_KEY_HEADER=api_key_header,
+        RATE_LIMIT_REDIS_URL=rate_limit_redis_url,
     )
 
 
@@ -205,6 +205,7 @@ class Store:
         SQLModel.metadata.create_all(self.engine)
         self._ensure_vec_table()
         self._ensure_run_columns()
+        self._ensure_api_key_prefix_blobs()
 
     def _ensure_vec_table(self) -> None:
         ddl = text(
@@ -256,6 +257,19 @@ class Store:
                     # Safe to use f-string now that inputs are validated
                     conn.exec_driver_sql(f"ALTER TABLE runs ADD COLUMN {column} {ddl}")
 
+    def _ensure_api_key_prefix_blobs(self) -> None:
+        """Convert TEXT ``api_keys.key_prefix`` values written before the BLOB switch."""
+
+        with self.engine.begin() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'api_keys'"
+            ).first()
+            if exists is None:
+                return
+            conn.exec_driver_sql(
+                "UPDATE api_keys SET key_prefix = CAST(key_prefix AS BLOB) WHERE typeof(key_prefix) = 'text'"
+            )
+
     @contextmanager
     def session(self) -> Iterator[Session]:
         with Session(self.engine) as session:
@@ -2,30 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import Counter
 from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
-import json
-from typing import Any, Mapping, Sequence
+from functools import lru_cache
+import logging
+from pathlib import Path
+import threading
+from typing import Any, Callable, Mapping, Sequence
+
+import orjson
 
 from app.schemas import ManifestWarning
 from app.settings import get_settings
 
-__all__ = ["append_warning_log", "summarize_dom_assists", "summarize_seam_markers"]
+__all__ = [
+    "append_warning_log",
+    "flush_warning_log",
+    "start_warning_log_flusher",
+    "stop_warning_log_flusher",
+    "summarize_dom_assists",
+    "summarize_seam_markers",
+]
+
+LOGGER = logging.getLogger(__name__)
+
+# Lines queued while the background flusher runs, grouped by destination file.
+_pending_lines: dict[Path, list[bytes]] = {}
+_pending_lock = threading.Lock()
+_buffering = False
+_flush_task: asyncio.Task[None] | None = None
 
 
 def _normalize_warning(entry: Any) -> dict[str, Any]:
-    if isinstance(entry, ManifestWarning):
-        return entry.model_dump()
-    if hasattr(entry, "model_dump"):
-        return entry.model_dump()
-    if is_dataclass(entry):
-        return asdict(entry)
-    if isinstance(entry, dict):
-        return entry
+    kind = type(entry)
+    normalizer = _NORMALIZERS.get(kind)
+    if normalizer is None:
+        normalizer = _NORMALIZERS[kind] = _normalizer_for(kind)
+    return normalizer(entry)
+
+
+def _normalizer_for(kind: type) -> Callable[[Any], dict[str, Any]]:
+    if hasattr(kind, "model_dump"):
+        return _model_dump
+    if is_dataclass(kind):
+        return asdict
+    if issubclass(kind, dict):
+        return _passthrough
+    return _code_only
+
+
+def _model_dump(entry: Any) -> dict[str, Any]:
+    return entry.model_dump()
+
+
+def _passthrough(entry: dict[str, Any]) -> dict[str, Any]:
+    return entry
+
+
+def _code_only(entry: Any) -> dict[str, Any]:
     return {"code": str(entry)}
 
 
+# Warning entries come from a handful of types; resolve each type's normalizer once.
+_NORMALIZERS: dict[type, Callable[[Any], dict[str, Any]]] = {ManifestWarning: ManifestWarning.to_dict}
+
+
+@lru_cache(maxsize=8)
+def _prepared_log_path(path: Path) -> Path:
+    """Create the log directory once per configured path."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def append_warning_log(
     *,
     job_id: str,
@@ -82,7 +133,7 @@ def append_warning_log(
         return
 
     record = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "job_id": job_id,
         "url": url,
         "warnings": warnings,
@@ -100,11 +151,75 @@ def append_warning_log(
     if dom_summary:
         record["dom_assist_summary"] = dom_summary
 
-    log_path = settings.logging.warning_log_path
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record))
-        handle.write("\n")
+    log_path = _prepared_log_path(settings.logging.warning_log_path)
+    line = _encode_record(record)
+    with _pending_lock:
+        if _buffering:
+            _pending_lines.setdefault(log_path, []).append(line)
+            return
+    _write_lines(log_path, [line])
+
+
+def _encode_record(record: dict[str, Any]) -> bytes:
+    """One newline-terminated JSON line; datetimes render as ISO 8601."""
+
+    return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+
+def _write_lines(log_path: Path, lines: list[bytes]) -> None:
+    with log_path.open("ab", buffering=8192) as handle:
+        handle.write(b"".join(lines))
+
+
+def flush_warning_log() -> int:
+    """Append queued warning records with one write per log file; returns lines flushed."""
+
+    with _pending_lock:
+        if not _pending_lines:
+            return 0
+        pending = dict(_pending_lines)
+        _pending_lines.clear()
+
+    flushed = 0
+    for log_path, lines in pending.items():
+        _write_lines(log_path, lines)
+        flushed += len(lines)
+    return flushed
+
+
+async def _warning_log_flush_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(flush_warning_log)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Failed to flush warning log records: %s", exc)
+
+
+def start_warning_log_flusher(*, interval: float = 0.1) -> None:
+    """Queue warning records and append them in batches from a background task."""
+
+    global _buffering, _flush_task
+    with _pending_lock:
+        _buffering = True
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_warning_log_flush_loop(interval))
+
+
+async def stop_warning_log_flusher() -> None:
+    """Cancel the flusher, return to direct appends, and write anything still queued."""
+
+    global _buffering, _flush_task
+    with _pending_lock:
+        _buffering = False
+    task, _flush_task = _flush_task, None
+    if task and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await asyncio.to_thread(flush_warning_log)
 
 
 def _coerce_mapping(value: Any) -> dict[str, Any] | None:
@@ -132,30 +247,36 @@ def summarize_seam_markers(
 ) -> dict[str, Any] | None:
     if not isinstance(markers, Sequence):
         return None
-    normalized: list[dict[str, Any]] = []
+    count = 0
+    sample: list[dict[str, Any]] = []
     tile_ids: set[int] = set()
     hashes: set[str] = set()
     for entry in markers:
         if not isinstance(entry, Mapping):
             continue
-        item: dict[str, Any] = {}
+        count += 1
         tile_index = entry.get("tile_index")
         if isinstance(tile_index, int):
-            item["tile_index"] = tile_index
             tile_ids.add(tile_index)
+        seam_hash = entry.get("hash")
+        if isinstance(seam_hash, str):
+            hashes.add(seam_hash)
+        if len(sample) >= sample_limit:
+            continue
+        # Only the sampled markers are materialized as dicts.
+        item: dict[str, Any] = {}
+        if isinstance(tile_index, int):
+            item["tile_index"] = tile_index
         position = entry.get("position")
         if isinstance(position, str):
             item["position"] = position
-        seam_hash = entry.get("hash")
         if isinstance(seam_hash, str):
             item["hash"] = seam_hash
-            hashes.add(seam_hash)
-        normalized.append(item)
-    if not normalized:
+        sample.append(item)
+    if not count:
         return None
-    sample = normalized[:sample_limit]
     summary: dict[str, Any] = {
-        "count": len(normalized),
+        "count": count,
         "unique_tiles": len(tile_ids) or None,
         "unique_hashes": len(hashes) or None,
         "sample": sample,
@@ -169,10 +290,14 @@ def summarize_seam_markers(
 def _summarize_seam_usage(events: Any, *, sample_limit: int = 3) -> dict[str, Any] | None:
     if not isinstance(events, Sequence):
         return None
-    normalized: list[dict[str, Any]] = []
+    count = 0
+    sample: list[dict[str, Any]] = []
     for entry in events:
         if not isinstance(entry, Mapping):
             continue
+        count += 1
+        if len(sample) >= sample_limit:
+            continue
         item: dict[str, Any] = {}
         prev_idx = entry.get("prev_tile_index")
         curr_idx = entry.get("curr_tile_index")
@@ -183,12 +308,12 @@ def _summarize_seam_usage(events: Any, *, sample_limit: int = 3) -> dict[str, An
             item["curr_tile_index"] = curr_idx
         if isinstance(seam_hash, str):
             item["seam_hash"] = seam_hash
-        normalized.append(item)
-    if not normalized:
+        sample.append(item)
+    if not count:
         return None
     return {
-        "count": len(normalized),
-        "sample": normalized[:sample_limit],
+        "count": count,
+        "sample": sample,
     }
 
 
@@ -30,7 +30,7 @@ def todos(
     limit: int = typer.Option(8, min=1, max=20, help="Maximum TODO items to emit."),
     json_output: bool = typer.Option(False, "--json/--no-json", help="Emit JSON instead of text."),
     http2: bool = typer.Option(True, "--http2/--no-http2"),
-    poll_interval: float = typer.Option(2.0, help="Seconds between polling /jobs/{id}."),
+    poll_interval: float = typer.Option(2.0, help="Seconds between polling /jobs/{id} when the SSE stream is unavailable."),
     timeout: float = typer.Option(300.0, help="Maximum seconds to wait for completion."),
     reuse_session: bool = typer.Option(True, "--reuse-session/--no-reuse-session", help="Reuse the same HTTP client across submit/poll/fetch."),
     out: Path | None = typer.Option(
@@ -1,22 +1,73 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+import hashlib
+import random
 import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, ContextManager, Optional, Sequence
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
 
-import typer
-from rich.console import Console
+    from scripts import mdwb_cli
 
-from scripts import mdwb_cli
-
-console = Console()
+# The HTTP/CLI stack (httpx, typer, rich, mdwb_cli) is imported inside the
+# functions that talk to the API, so text helpers such as summarize_markdown
+# and extract_todos import without it.
 
 TERMINAL_STATES = {"DONE", "FAILED", "CANCELLED"}
+# Status codes from /jobs/{id}/stream that mean "no stream here, poll instead".
+_STREAM_FALLBACK_STATUSES = {404, 405}
+_FETCH_CHUNK_BYTES = 64 * 1024
+_SUMMARY_CACHE_SIZE = 128
+_BATCH_MAX_WORKERS = 8
+_SUMMARY_PREFIX_LIMITS = (4096, 16384, 65536)
+# (content digest, sentences) -> summary, least recently used first.
+_summary_cache: OrderedDict[tuple[bytes, int], str] = OrderedDict()
+
+# Fences are cut by _strip_fences; images, links and quote markers need a
+# regex, and emphasis/heading/code markers are then plain character deletions.
+# Linked images (README badges) come first so the link branch never takes
+# "![alt" as its label.
+_RE_STRIP = re.compile(
+    r"(?P<linked_image>\[!\[[^\]]*\]\([^)]+\)\]\([^)]+\))"
+    r"|(?P<image>!\[[^\]]*\]\([^)]+\))"
+    r"|\[(?P<link>[^\]]+)\]\([^)]+\)"
+    r"|(?P<quote>^>+\s*)",
+    re.M,
+)
+_STRIP_TABLE = str.maketrans("", "", "#*_~`")
+# Every construct above needs one of these; images and links both need "[".
+_MARKDOWN_META = "`#>*_~["
+_RE_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+# Task lines, in priority order: checkboxes, plain bullets, then "todo:"-style
+# keyword prefixes (case-insensitive). Group 1 is the task text.
+_RE_TASK_LINE = re.compile(r"(?:- \[[ xX]\]|[-*] |(?i:todo|task|next|action):)(.*)", re.S)
+
+
+def _get_console() -> Console:
+    console = globals().get("console")
+    if console is None:
+        from rich.console import Console
+
+        console = globals()["console"] = Console()
+    return console
+
+
+def __getattr__(name: str) -> object:
+    # ``shared.console`` stays a module attribute (callers and tests swap it),
+    # it is just created on first access.
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(slots=True)
@@ -26,13 +77,18 @@ class CaptureResult:
     markdown: str
 
 
+@lru_cache(maxsize=8)
 def resolve_settings(api_base: Optional[str]) -> mdwb_cli.APISettings:
-    """Reuse mdwb_cli's settings resolver."""
+    """Reuse mdwb_cli's settings resolver (memoized; APISettings is frozen)."""
+
+    from scripts import mdwb_cli
 
     return mdwb_cli._resolve_settings(api_base)
 
 
 def _ctx(shared: httpx.Client | None, settings: mdwb_cli.APISettings, *, http2: bool = True):
+    from scripts import mdwb_cli
+
     return mdwb_cli._client_ctx_or_shared(shared, settings, http2=http2)
 
 
@@ -57,7 +113,7 @@ def submit_job(
         response = active_client.post("/jobs", json=payload)
         response.raise_for_status()
         job = response.json()
-        console.print(f"[green]Submitted job {job.get('id')} for {url}[/]")
+        _get_console().print(f"[green]Submitted job {job.get('id')} for {url}[/]")
         return job
 
 
@@ -70,10 +126,28 @@ def wait_for_completion(
     timeout: float = 300.0,
     client: httpx.Client | None = None,
 ) -> dict:
-    """Poll /jobs/{id} until the job reaches a terminal state."""
+    """Wait until the job reaches a terminal state and return its snapshot.
+
+    Follows the /jobs/{id}/stream SSE feed so completion is seen as soon as it
+    happens; servers without the stream (404/405) or a dropped connection fall
+    back to polling /jobs/{id} with jittered exponential backoff capped at
+    ``poll_interval`` seconds.
+    """
+
+    import httpx
 
     deadline = time.monotonic() + timeout
     with _ctx(client, settings, http2=http2) as active_client:
+        try:
+            _stream_until_terminal(job_id, active_client, deadline=deadline, timeout=timeout)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code not in _STREAM_FALLBACK_STATUSES:
+                raise
+        except httpx.TransportError:
+            pass
+        # Back off from a short first delay so quick jobs are seen promptly and
+        # long ones cost few requests; ``poll_interval`` caps the delay.
+        delay = min(poll_interval, max(0.2, poll_interval * 0.1))
         while True:
             response = active_client.get(f"/jobs/{job_id}")
             response.raise_for_status()
@@ -83,7 +157,24 @@ def wait_for_completion(
                 return snapshot
             if time.monotonic() > deadline:
                 raise TimeoutError(f"Job {job_id} did not finish within {timeout} seconds.")
-            time.sleep(poll_interval)
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 2, poll_interval)
+
+
+def _stream_until_terminal(job_id: str, client: httpx.Client, *, deadline: float, timeout: float) -> bool:
+    """Read SSE frames until a terminal ``state`` event; False if the stream ends first."""
+
+    from scripts import mdwb_cli
+
+    with client.stream("GET", f"/jobs/{job_id}/stream", headers={"Accept": "text/event-stream"}) as response:
+        response.raise_for_status()
+        for event, payload in mdwb_cli._iter_sse(response):
+            if event == "state" and payload.strip().upper() in TERMINAL_STATES:
+                return True
+            # The server sends a heartbeat frame every few seconds, so this is checked while idle too.
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Job {job_id} did not finish within {timeout} seconds.")
+    return False
 
 
 def fetch_markdown(
@@ -96,9 +187,14 @@ def fetch_markdown(
     """Download the final Markdown artifact for a job."""
 
     with _ctx(client, settings, http2=http2) as active_client:
-        response = active_client.get(f"/jobs/{job_id}/result.md")
-        response.raise_for_status()
-        return response.text
+        # Accumulate into one buffer and decode once instead of keeping httpx's
+        # chunk list, the joined body, and the decoded text alive together.
+        with active_client.stream("GET", f"/jobs/{job_id}/result.md") as response:
+            response.raise_for_status()
+            body = bytearray()
+            for chunk in response.iter_bytes(_FETCH_CHUNK_BYTES):
+                body.extend(chunk)
+            return body.decode(response.encoding or "utf-8", errors="replace")
 
 
 def capture_markdown(
@@ -111,21 +207,36 @@ def capture_markdown(
     ocr_policy: Optional[str] = None,
     poll_interval: float = 2.0,
     timeout: float = 300.0,
-    reuse_session: bool = False,
+    reuse_session: bool = True,
+    client: httpx.Client | None = None,
 ) -> CaptureResult:
-    """Ensure final Markdown is available by submitting or reusing a job."""
+    """Ensure final Markdown is available by submitting or reusing a job.
+
+    ``client`` lets batch callers share one client across captures; otherwise a
+    client is opened per capture when ``reuse_session`` is set.
+    """
 
     if not url and not job_id:
+        import typer
+
         raise typer.BadParameter("Provide either --url or --job-id.", param_hint="--url/--job-id")
 
     if url and job_id:
-        console.print("[yellow]Both URL and job id provided; using the existing job id.[/]")
+        _get_console().print("[yellow]Both URL and job id provided; using the existing job id.[/]")
+
+    from scripts import mdwb_cli
 
     effective_job_id = job_id
     snapshot: dict
 
-    shared_client: httpx.Client | None = mdwb_cli._client(settings, http2=http2) if reuse_session else None
-    try:
+    # One client (and so one TCP/TLS/HTTP2 session) serves submit, wait, and fetch.
+    if client is not None:
+        session: ContextManager[httpx.Client | None] = nullcontext(client)
+    elif reuse_session:
+        session = mdwb_cli._client_ctx(settings, http2=http2)
+    else:
+        session = nullcontext(None)
+    with session as shared_client:
         if effective_job_id is None:
             job = submit_job(
                 url=url or "",
@@ -156,57 +267,166 @@ def capture_markdown(
 
         markdown = fetch_markdown(effective_job_id, settings, http2=http2, client=shared_client)
         return CaptureResult(job_id=effective_job_id, snapshot=snapshot, markdown=markdown)
-    finally:
-        if shared_client is not None:
-            shared_client.close()
+
+
+def capture_markdown_batch(
+    urls: Sequence[str],
+    *,
+    settings: mdwb_cli.APISettings,
+    http2: bool = True,
+    profile: Optional[str] = None,
+    ocr_policy: Optional[str] = None,
+    poll_interval: float = 2.0,
+    timeout: float = 300.0,
+    max_workers: int = _BATCH_MAX_WORKERS,
+) -> list[CaptureResult | Exception]:
+    """Capture several URLs concurrently over one shared HTTP client.
+
+    Each capture is the usual submit/wait/fetch sequence; running them on a
+    small thread pool overlaps their waits, so N captures take roughly as long
+    as the slowest one. Results keep the order of ``urls``; a capture that fails
+    yields its exception instead of aborting the rest of the batch.
+    """
+
+    if not urls:
+        return []
+
+    from scripts import mdwb_cli
+
+    def _capture(url: str, client: httpx.Client) -> CaptureResult | Exception:
+        try:
+            return capture_markdown(
+                url=url,
+                job_id=None,
+                settings=settings,
+                http2=http2,
+                profile=profile,
+                ocr_policy=ocr_policy,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                client=client,
+            )
+        except Exception as exc:  # noqa: BLE001 - reported per URL by the caller
+            return exc
+
+    with mdwb_cli._client_ctx(settings, http2=http2) as client:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+            return list(pool.map(lambda url: _capture(url, client), urls))
+
+
+def read_url_list(path: Path) -> list[str]:
+    """Read one URL per line, skipping blank lines and ``#`` comments."""
+
+    lines = (line.strip() for line in path.read_text(encoding="utf-8").splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
 
 
 def _strip_markdown(markdown: str) -> str:
     """Coarsely strip Markdown to help heuristics."""
 
-    text = re.sub(r"```.*?```", " ", markdown, flags=re.S)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
-    text = re.sub(r"!\[[^\]]*\]\([^)]+\)", " ", text)
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    text = re.sub(r"^>+\s*", "", text, flags=re.M)
-    text = re.sub(r"#{1,6}\s*", "", text)
-    text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-    text = re.sub(r"_([^_]+)_", r"\1", text)
-    text = re.sub(r"~{2}([^~]+)~{2}", r"\1", text)
-    return re.sub(r"\s+", " ", text).strip()
+    if not any(char in markdown for char in _MARKDOWN_META):
+        return " ".join(markdown.split())
+    text = _RE_STRIP.sub(_strip_token, _strip_fences(markdown)).translate(_STRIP_TABLE)
+    return " ".join(text.split())
+
+
+def _strip_fences(markdown: str) -> str:
+    """Replace each ```fenced``` block with a space in one linear scan.
+
+    An unclosed fence is left as-is, like the ``.*?`` regex it replaces.
+    """
+
+    start = markdown.find("```")
+    if start < 0:
+        return markdown
+    parts: list[str] = []
+    pos = 0
+    while start >= 0:
+        end = markdown.find("```", start + 3)
+        if end < 0:
+            break
+        parts.append(markdown[pos:start])
+        parts.append(" ")
+        pos = end + 3
+        start = markdown.find("```", pos)
+    parts.append(markdown[pos:])
+    return "".join(parts)
+
+
+def _strip_token(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind == "link":
+        return match.group(kind)
+    return "" if kind == "quote" else " "
 
 
 def summarize_markdown(markdown: str, *, sentences: int = 5) -> str:
-    """Return the first N sentences from the Markdown body."""
-
-    plain = _strip_markdown(markdown)
-    if not plain:
-        return ""
-    chunks = re.split(r"(?<=[.!?])\s+", plain)
-    if not chunks:
-        return plain
-    summary = " ".join(chunks[:sentences]).strip()
-    if not summary:
-        return plain
+    """Return the first N sentences from the Markdown body.
+
+    Results are memoized by content digest, so re-summarizing the same capture
+    skips the strip/split work.
+    """
+
+    key = (hashlib.blake2b(markdown.encode("utf-8", "surrogatepass"), digest_size=16).digest(), sentences)
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        _summary_cache.move_to_end(key)
+        return summary
+    summary = _summarize(markdown, sentences)
+    _summary_cache[key] = summary
+    if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
     return summary
 
 
-def _normalize_task_line(line: str) -> Optional[str]:
-    stripped = line.strip()
-    lower = stripped.lower()
-    if not stripped:
-        return None
-    checkbox_prefixes = ("- [ ]", "- [x]", "- [X]")
-    for prefix in checkbox_prefixes:
-        if stripped.startswith(prefix):
-            return stripped[len(prefix) :].strip()
-    if stripped.startswith(("- ", "* ")):
-        return stripped[2:].strip()
-    keyword_prefixes = ("todo:", "task:", "next:", "action:")
-    for prefix in keyword_prefixes:
-        if lower.startswith(prefix):
-            return stripped[len(prefix) :].strip()
-    return None
+def _summarize(markdown: str, sentences: int) -> str:
+    if sentences > 0:
+        # Long captures: the opening sentences almost always sit in the first few
+        # KB, so strip growing line-aligned prefixes before the whole body.
+        tried = 0
+        for limit in _SUMMARY_PREFIX_LIMITS:
+            if len(markdown) <= limit:
+                break
+            cut = markdown.rfind("\n", 0, limit)
+            # Skip prefixes already tried or ending inside a fence (its code would
+            # leak into the text).
+            if cut <= tried or markdown.count("```", 0, cut) % 2:
+                continue
+            tried = cut
+            plain = _strip_markdown(markdown[:cut])
+            end = _sentence_end(plain, sentences)
+            if end is not None:
+                return plain[:end]
+    return _first_sentences(_strip_markdown(markdown), sentences)
+
+
+def _first_sentences(plain: str, sentences: int) -> str:
+    """First ``sentences`` sentences of whitespace-collapsed text, or all of it."""
+
+    end = _sentence_end(plain, sentences) if sentences > 0 else None
+    return plain if end is None else plain[:end]
+
+
+def _sentence_end(plain: str, sentences: int) -> int | None:
+    """Index where sentence ``sentences`` ends, or None when the text has fewer.
+
+    Boundaries are found lazily, so only the first ``sentences`` are scanned
+    for and no per-sentence strings are built.
+    """
+
+    end = None
+    for count, boundary in enumerate(_RE_SENTENCE_SPLIT.finditer(plain), start=1):
+        if count == sentences:
+            end = boundary.start()
+            break
+    return end
+
+
+@lru_cache(maxsize=8)
+def _heading_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    # Substring match like the old ``keyword in line.lower()`` check, so a
+    # "Tasks" heading still counts for "task".
+    return re.compile("|".join(map(re.escape, keywords)), re.I)
 
 
 def extract_todos(
@@ -223,24 +443,23 @@ def extract_todos(
     capture_from_heading = False
 
     for raw_line in markdown.splitlines():
+        if len(tasks) >= max_tasks:
+            break
         line = raw_line.strip()
         if line.startswith("#"):
-            lower = line.lower()
-            capture_from_heading = any(keyword in lower for keyword in keywords)
+            capture_from_heading = _heading_pattern(keywords).search(line) is not None
             continue
-        candidate = _normalize_task_line(line)
+        match = _RE_TASK_LINE.match(line)
+        candidate = match.group(1).strip() if match else None
         if candidate:
             cleaned = candidate.rstrip(".")
-            if cleaned and cleaned not in seen:
-                tasks.append(cleaned)
-                seen.add(cleaned)
         elif capture_from_heading and line:
             cleaned = line.lstrip("-*0123456789. ").strip()
-            if cleaned and cleaned not in seen:
-                tasks.append(cleaned)
-                seen.add(cleaned)
-        if len(tasks) >= max_tasks:
-            break
+        else:
+            continue
+        if cleaned and cleaned not in seen:
+            tasks.append(cleaned)
+            seen.add(cleaned)
     return tasks
 
 
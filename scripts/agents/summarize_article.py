@@ -5,6 +5,7 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
+from scripts import mdwb_cli
 from scripts.agents import shared
 
 cli = typer.Typer(help="Capture a URL (or reuse a job) and output a quick summary.")
@@ -28,7 +29,7 @@ def summarize(
     ocr_policy: str | None = typer.Option(None, help="OCR policy id."),
     sentences: int = typer.Option(5, min=1, max=12, help="Number of sentences to include in the summary."),
     http2: bool = typer.Option(True, "--http2/--no-http2"),
-    poll_interval: float = typer.Option(2.0, help="Seconds between polling /jobs/{id}."),
+    poll_interval: float = typer.Option(2.0, help="Seconds between polling /jobs/{id} when the SSE stream is unavailable."),
     timeout: float = typer.Option(300.0, help="Maximum seconds to wait for completion."),
     reuse_session: bool = typer.Option(True, "--reuse-session/--no-reuse-session", help="Reuse the same HTTP client across submit/poll/fetch."),
     out: Path | None = typer.Option(
@@ -36,10 +37,29 @@ def summarize(
         "--out",
         help="Write the summary (or raw Markdown when no summary is available) to this path.",
     ),
+    batch: Path | None = typer.Option(
+        None,
+        "--batch",
+        help="File with one URL per line; captures them concurrently and prints a summary for each.",
+    ),
 ) -> None:
     """Capture a URL (if needed) and print a short summary."""
 
     settings = shared.resolve_settings(api_base)
+    batch = mdwb_cli._option_value(batch)
+    if batch is not None:
+        _summarize_batch(
+            shared.read_url_list(batch),
+            settings=settings,
+            sentences=sentences,
+            http2=http2,
+            profile=profile,
+            ocr_policy=ocr_policy,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            out=out,
+        )
+        return
     capture = shared.capture_markdown(
         url=url or None,
         job_id=job_id or None,
@@ -66,6 +86,45 @@ def summarize(
         console.print(f"[dim]Saved summary to {out}[/]")
 
 
+def _summarize_batch(
+    urls: list[str],
+    *,
+    settings: mdwb_cli.APISettings,
+    sentences: int,
+    http2: bool,
+    profile: str | None,
+    ocr_policy: str | None,
+    poll_interval: float,
+    timeout: float,
+    out: Path | None,
+) -> None:
+    results = shared.capture_markdown_batch(
+        urls,
+        settings=settings,
+        http2=http2,
+        profile=profile,
+        ocr_policy=ocr_policy,
+        poll_interval=poll_interval,
+        timeout=timeout,
+    )
+    sections: list[str] = []
+    failures = 0
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            failures += 1
+            console.print(f"[red]{url}: {result}[/]")
+            continue
+        summary = shared.summarize_markdown(result.markdown, sentences=sentences)
+        console.rule(f"Summary for {url} (job {result.job_id})")
+        console.print(summary or "[yellow]No text content found.[/]")
+        sections.append(f"# {url}\n\n{summary}")
+    if out:
+        shared.save_text(out, "\n\n".join(sections))
+        console.print(f"[dim]Saved {len(sections)} summaries to {out}[/]")
+    if failures:
+        raise typer.Exit(code=1)
+
+
 def main() -> None:  # pragma: no cover - Typer entry point
     cli()
 
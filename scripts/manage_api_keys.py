@@ -42,7 +42,7 @@ def cmd_create(
 
         table.add_row("Key ID", str(api_key.id))
         table.add_row("Name", api_key.name)
-        table.add_row("Prefix", api_key.key_prefix)
+        table.add_row("Prefix", api_key.key_prefix.decode("ascii"))
         table.add_row("Rate Limit", str(api_key.rate_limit) if api_key.rate_limit else "Unlimited")
         table.add_row("Owner", api_key.owner or "None")
         table.add_row("Created", api_key.created_at.isoformat())
@@ -80,7 +80,7 @@ def cmd_list() -> None:
             table.add_row(
                 str(key.id),
                 key.name,
-                key.key_prefix,
+                key.key_prefix.decode("ascii"),
                 "✅" if key.is_active else "❌",
                 str(key.rate_limit) if key.rate_limit else "∞",
                 key.owner or "-",
@@ -125,7 +125,7 @@ def cmd_show(key_id: int) -> None:
 
         table.add_row("ID", str(api_key.id))
         table.add_row("Name", api_key.name)
-        table.add_row("Prefix", api_key.key_prefix)
+        table.add_row("Prefix", api_key.key_prefix.decode("ascii"))
         table.add_row("Active", "✅ Yes" if api_key.is_active else "❌ No")
         table.add_row("Rate Limit", str(api_key.rate_limit) if api_key.rate_limit else "Unlimited")
         table.add_row("Owner", api_key.owner or "None")
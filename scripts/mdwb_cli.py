@@ -9,17 +9,20 @@ import io
 import json
 import math
 import os
+import re
 import shlex
 import subprocess
 import time
-from collections import Counter, deque
+from collections import Counter
 from contextlib import contextmanager, nullcontext
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, ContextManager, Iterable, Iterator, Mapping, Optional, Sequence, TextIO, Tuple
+from typing import Any, BinaryIO, Callable, ContextManager, Iterable, Iterator, Mapping, Optional, Sequence, TextIO, Tuple
 
 import httpx
+import orjson
 import sys
 import typer
 from decouple import Config as DecoupleConfig, RepositoryEnv
@@ -28,6 +31,15 @@ from rich.table import Table
 import zstandard as zstd
 
 _DEFAULT_TIMEOUT = object()
+_STREAM_CHUNK_BYTES = 64 * 1024
+_TAIL_BLOCK_BYTES = 8 * 1024
+_FOLLOW_BATCH_LINES = 256
+_EVENTS_RECONNECT_DELAY = 0.25
+# The server writes compact NDJSON with "timestamp" (then "sequence") as the
+# last top-level keys of snapshot events. Anchoring on the closing brace means
+# a nested "timestamp" can never match: it would be followed by "}}".
+_RE_CURSOR_TAIL = re.compile(rb'"timestamp":"([^"\\]+)"(?:,"sequence":\d+)?}$')
+_CURSOR_TAIL_BYTES = 128
 
 _TyperOptionInfo: Any | None
 _TyperOptionInfo: Any = None
@@ -56,7 +68,7 @@ warnings_cli = typer.Typer(help="Warning/blocklist log helpers.")
 cli.add_typer(warnings_cli, name="warnings")
 
 
-@dataclass
+@dataclass(frozen=True)
 class APISettings:
     base_url: str
     api_key: Optional[str]
@@ -77,7 +89,7 @@ def _load_env_settings() -> APISettings:
 def _resolve_settings(override_base: Optional[str]) -> APISettings:
     settings = _load_env_settings()
     if override_base:
-        settings.base_url = override_base
+        settings = replace(settings, base_url=override_base)
     return settings
 
 
@@ -452,7 +464,7 @@ def _print_job(job: dict) -> None:
     for key in ("state", "url", "progress", "manifest", "warnings", "blocklist_hits"):
         value = job.get(key)
         if isinstance(value, (dict, list)):
-            value = json.dumps(value, indent=2)
+            value = _json_pretty(value)
         table.add_row(key, str(value))
     if sweep_row != "-":
         table.add_row("sweep", sweep_row)
@@ -703,22 +715,48 @@ def _run_hook(command: str, event_name: str, payload: Mapping[str, Any]) -> None
         console.print(f"[yellow]Hook command '{command}' failed: {exc}[/]")
 
 
+def _iter_byte_lines(response: httpx.Response) -> Iterator[bytes]:
+    """Split a streamed body into ``\n``-terminated lines without decoding it.
+
+    Lines are sliced out of one growing buffer; a trailing ``\r`` is dropped
+    and an unterminated last line is still yielded.
+    """
+
+    buffer = bytearray()
+    for chunk in response.iter_bytes(_STREAM_CHUNK_BYTES):
+        # The carried-over tail has no newline; only search the new bytes so a
+        # line spanning many chunks is scanned once, not once per chunk.
+        scan_from = len(buffer)
+        buffer += chunk
+        start = 0
+        end = buffer.find(b"\n", scan_from)
+        while end >= 0:
+            yield bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer).rstrip(b"\r")
+
+
 def _iter_sse(response: httpx.Response) -> Iterable[Tuple[str, str]]:
+    # Field names are matched on bytes; only the event name and the joined
+    # data payload are decoded, once per event.
     event = "message"
-    data_lines: list[str] = []
-    for line in response.iter_lines():
+    data_lines: list[bytes] = []
+    for line in _iter_byte_lines(response):
         if not line:
             if data_lines:
-                yield event, "\n".join(data_lines)
+                yield event, b"\n".join(data_lines).decode("utf-8", "replace")
+                data_lines.clear()
             event = "message"
-            data_lines = []
             continue
-        if line.startswith("event:"):
-            event = line.split(":", 1)[1].strip()
-        elif line.startswith("data:"):
-            data_lines.append(line.split(":", 1)[1].strip())
+        if line.startswith(b"data:"):
+            data_lines.append(line[5:].strip())
+        elif line.startswith(b"event:"):
+            event = line[6:].strip().decode("utf-8", "replace")
     if data_lines:
-        yield event, "\n".join(data_lines)
+        yield event, b"\n".join(data_lines).decode("utf-8", "replace")
 
 
 def _stream_job(
@@ -732,7 +770,8 @@ def _stream_job(
     client: httpx.Client | None = None,
 ) -> None:
     with _client_ctx_or_shared(client, settings, timeout=None) as active_client:
-        with active_client.stream("GET", f"/jobs/{job_id}/stream") as response:
+        # A shared client carries the default read timeout; SSE can sit idle.
+        with active_client.stream("GET", f"/jobs/{job_id}/stream", timeout=None) as response:
             response.raise_for_status()
             for event, payload in _iter_sse(response):
                 if raw:
@@ -749,7 +788,7 @@ def _stream_job(
                 if hooks:
                     entry_payload: Mapping[str, Any]
                     try:
-                        entry_payload = json.loads(payload)
+                        entry_payload = orjson.loads(payload)
                     except json.JSONDecodeError:
                         entry_payload = {"raw": payload}
                     _trigger_event_hooks({"event": event, "payload": entry_payload}, hooks)
@@ -772,7 +811,11 @@ def _iter_event_lines(
     follow: bool,
     interval: float,
     client: httpx.Client | None = None,
-):
+) -> Iterator[bytes]:
+    # The server keeps /events open and pushes entries as they happen, so the
+    # only wait is before reconnecting after the stream ends: 0.25s, doubling
+    # up to `interval`, and back to 0.25s once a reconnect yields lines.
+    delay = _EVENTS_RECONNECT_DELAY
     with (nullcontext(client) if client is not None else _client_ctx(settings)) as active_client:
         while True:
             params: dict[str, str] = {}
@@ -780,14 +823,16 @@ def _iter_event_lines(
                 params["since"] = cursor
             with active_client.stream("GET", f"/jobs/{job_id}/events", params=params) as response:
                 response.raise_for_status()
-                for line in response.iter_lines():
+                for line in _iter_byte_lines(response):
                     if not line:
                         continue
                     yield line
                     cursor = _cursor_from_line(line, cursor)
+                    delay = _EVENTS_RECONNECT_DELAY
             if not follow:
                 break
-            time.sleep(interval)
+            time.sleep(min(delay, interval))
+            delay = min(delay * 2, interval)
 
 
 def _watch_job_events(
@@ -808,7 +853,7 @@ def _watch_job_events(
         interval=interval,
         client=client,
     ):
-        output.write(line + "\n")
+        output.write(line.decode("utf-8", "replace") + "\n")
         output.flush()
 
 
@@ -836,19 +881,15 @@ def _watch_job_events_pretty(
     ):
         entry: dict[str, Any] | None = None
         try:
-            entry = json.loads(line)
+            entry = orjson.loads(line)
         except json.JSONDecodeError:
             entry = None
 
         if entry is not None:
             _trigger_event_hooks(entry, hooks)
 
-        if raw:
-            console.print(line)
-            continue
-
-        if entry is None:
-            console.print(line)
+        if raw or entry is None:
+            console.print(line.decode("utf-8", "replace"))
             continue
         event_name = entry.get("event")
         if isinstance(event_name, str) and event_name == "dom_assist":
@@ -911,32 +952,35 @@ def _watch_events_with_fallback(
 
 
 def _render_snapshot(snapshot: dict[str, Any], *, meter: _ProgressMeter | None = None) -> None:
+    # Collect every field line and hand Rich one print per snapshot.
+    lines: list[str] = []
     state = snapshot.get("state")
     if state:
-        _log_event("state", str(state))
+        lines.append(_format_event("state", str(state)))
     profile_id = snapshot.get("profile_id")
     if profile_id:
-        _log_event("log", f"profile: {profile_id}")
+        lines.append(_format_event("log", f"profile: {profile_id}"))
     if snapshot.get("cache_hit"):
-        _log_event("log", "cache: hit")
+        lines.append(_format_event("log", "cache: hit"))
     progress = snapshot.get("progress")
     if isinstance(progress, dict):
         text = _format_progress_text(progress, meter=meter)
         if text:
-            _log_event("progress", text)
+            lines.append(_format_event("progress", text))
     manifest_path = snapshot.get("manifest_path")
     if manifest_path:
-        _log_event("log", f"manifest: {manifest_path}")
+        lines.append(_format_event("log", f"manifest: {manifest_path}"))
     manifest = snapshot.get("manifest")
     if isinstance(manifest, dict):
         warnings = manifest.get("warnings")
         if warnings:
-            _log_event("warnings", json.dumps(warnings))
+            # json.dumps's ", " separators give Rich wrap points; compact orjson splits mid-key.
+            lines.append(_format_event("warnings", json.dumps(warnings)))
         blocklist_hits = manifest.get("blocklist_hits")
         if blocklist_hits:
             blocklist_summary = _format_blocklist(blocklist_hits)
             if blocklist_summary != "-":
-                _log_event("log", f"blocklist: {blocklist_summary}")
+                lines.append(_format_event("log", f"blocklist: {blocklist_summary}"))
         sweep_summary = _format_sweep_summary(
             {
                 "sweep_stats": manifest.get("sweep_stats"),
@@ -944,17 +988,20 @@ def _render_snapshot(snapshot: dict[str, Any], *, meter: _ProgressMeter | None =
             }
         )
         if sweep_summary != "-":
-            _log_event("log", f"sweep: {sweep_summary}")
+            lines.append(_format_event("log", f"sweep: {sweep_summary}"))
         validation_summary = _format_validation_summary(manifest.get("validation_failures"))
         if validation_summary != "-":
-            _log_event("log", f"validation: {validation_summary}")
+            lines.append(_format_event("log", f"validation: {validation_summary}"))
     seam_data = _resolve_seam_data(manifest if isinstance(manifest, dict) else None, snapshot)
     seam_summary = _format_seam_log_summary(seam_data)
     if seam_summary != "-":
-        _log_event("log", f"seams: {seam_summary}")
+        lines.append(_format_event("log", f"seams: {seam_summary}"))
     error = snapshot.get("error")
     if error:
-        _log_event("log", json.dumps({"error": error}))
+        lines.append(_format_event("log", json.dumps({"error": error})))
+    if lines:
+        console.print("\n".join(lines))
+
 
 @cli.command()
 def fetch(
@@ -992,7 +1039,7 @@ def fetch(
         help="Reuse cached captures when an identical configuration already exists.",
     ),
     reuse_session: bool = typer.Option(
-        False,
+        True,
         "--reuse-session/--no-reuse-session",
         help="Reuse a single HTTP/2 client for job submission and streaming (reduces TLS/H2 churn).",
     ),
@@ -1046,8 +1093,8 @@ def fetch(
             watch = True
             console.print("[dim]Resume requires watching job completion; enabling --watch automatically.[/]")
 
-    shared_client: httpx.Client | None = _client(settings, http2=http2) if reuse_session else None
-    try:
+    shared_ctx = _client_ctx(settings, http2=http2) if reuse_session else nullcontext(None)
+    with shared_ctx as shared_client:
         with _client_ctx_or_shared(shared_client, settings, http2=http2) as client:
             payload: dict[str, object] = {"url": url}
             if profile:
@@ -1095,9 +1142,6 @@ def fetch(
                 progress_meter=progress_meter,
                 client=shared_client,
             )
-    finally:
-        if shared_client is not None:
-            shared_client.close()
 
 
 @cli.command()
@@ -1193,7 +1237,7 @@ def events(
     api_base: Optional[str] = typer.Option(None, help="Override API base URL"),
     since: Optional[str] = typer.Option(None, help="ISO timestamp cursor for incremental polling."),
     follow: bool = typer.Option(False, "--follow/--no-follow", help="Continue polling for new events."),
-    interval: float = typer.Option(2.0, "--interval", help="Polling interval in seconds when following."),
+    interval: float = typer.Option(2.0, "--interval", help="Max seconds to wait before reconnecting when following."),
     output_path: str = typer.Option(
         "-", "--output", "-o", help="File to append NDJSON events to (default stdout)."
     ),
@@ -1215,10 +1259,10 @@ def watch(
     api_base: Optional[str] = typer.Option(None, help="Override API base URL"),
     since: Optional[str] = typer.Option(None, help="ISO timestamp cursor for incremental polling."),
     follow: bool = typer.Option(True, "--follow/--once", help="Keep polling for new events instead of exiting."),
-    interval: float = typer.Option(2.0, "--interval", help="Polling interval in seconds when following."),
+    interval: float = typer.Option(2.0, "--interval", help="Max seconds to wait before reconnecting when following."),
     raw: bool = typer.Option(False, "--raw", help="Print raw NDJSON events instead of formatted output."),
     progress_eta: bool = typer.Option(True, "--progress/--no-progress", help="Show percent/ETA while streaming events."),
-    reuse_session: bool = typer.Option(False, "--reuse-session/--no-reuse-session", help="Reuse a single HTTP client for the event stream."),
+    reuse_session: bool = typer.Option(True, "--reuse-session/--no-reuse-session", help="Reuse a single HTTP client for the event stream."),
     on_event: Optional[list[str]] = typer.Option(
         None,
         "--on",
@@ -1286,21 +1330,23 @@ def demo_links(
 
 
 def _log_event(event: str, payload: str) -> None:
+    console.print(_format_event(event, payload))
+
+
+def _format_event(event: str, payload: str) -> str:
+    """Return the Rich markup line ``_log_event`` prints for one event."""
+
     if event == "state":
-        console.print(f"[cyan]{payload}[/]")
-        return
+        return f"[cyan]{payload}[/]"
     if event == "progress":
-        console.print(f"[magenta]{payload}[/]")
-        return
+        return f"[magenta]{payload}[/]"
     if event in {"warning", "warnings"}:
-        console.print(f"[red]warning[/]: {payload}")
-        return
+        return f"[red]warning[/]: {payload}"
     if event == "blocklist":
         data = _parse_json_payload(payload)
         if isinstance(data, dict):
             summary = ", ".join(f"{sel}:{count}" for sel, count in data.items()) or "no hits"
-            console.print(f"[yellow]blocklist[/]: {summary}")
-            return
+            return f"[yellow]blocklist[/]: {summary}"
     if event == "sweep":
         data = _parse_json_payload(payload) or {}
         stats = data.get("sweep_stats") or {}
@@ -1313,21 +1359,17 @@ def _log_event(event: str, payload: str) -> None:
         if stats.get("retry_attempts"):
             parts.append(f"retries {stats['retry_attempts']}")
         summary = ", ".join(parts) or "no sweep data"
-        console.print(f"[blue]sweep[/]: {summary}")
-        return
+        return f"[blue]sweep[/]: {summary}"
     if event == "validation":
         data = _parse_json_payload(payload)
         if isinstance(data, list) and data:
-            console.print(f"[red]validation[/]: {'; '.join(map(str, data))}")
-            return
-        console.print("[green]validation[/]: none")
-        return
+            return f"[red]validation[/]: {'; '.join(map(str, data))}"
+        return "[green]validation[/]: none"
     if event == "seams":
         data = _parse_json_payload(payload)
         summary = _format_seam_log_summary(data)
-        console.print(f"[blue]seams[/]: {summary}")
-        return
-    console.print(f"[bold]{event}[/]: {payload}")
+        return f"[blue]seams[/]: {summary}"
+    return f"[bold]{event}[/]: {payload}"
 
 
 def _extract_detail(response) -> str | None:  # noqa: ANN001
@@ -1362,9 +1404,15 @@ def _delete_job_webhooks(
     return response, payload
 
 
+def _json_pretty(value: Any) -> str:
+    """Render ``value`` as 2-space indented JSON."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode("utf-8")
+
+
 def _parse_json_payload(payload: str) -> Any:
     try:
-        return json.loads(payload)
+        return orjson.loads(payload)
     except Exception:  # pragma: no cover - best effort
         return None
 
@@ -1423,9 +1471,13 @@ def _register_webhooks_for_job(
         console.print(f"[green]Registered {successes} webhook(s) for {job_id}.[/]")
 
 
-def _cursor_from_line(line: str, fallback: str | None) -> str | None:
+def _cursor_from_line(line: str | bytes, fallback: str | None) -> str | None:
+    if isinstance(line, bytes):
+        match = _RE_CURSOR_TAIL.search(line, max(0, len(line) - _CURSOR_TAIL_BYTES))
+        if match:
+            return _bump_timestamp(match.group(1).decode("utf-8", "replace"))
     try:
-        entry = json.loads(line)
+        entry = orjson.loads(line)
     except json.JSONDecodeError:
         return fallback
     timestamp = entry.get("timestamp")
@@ -1439,7 +1491,9 @@ def _cursor_from_line(line: str, fallback: str | None) -> str | None:
     return fallback
 
 
+@lru_cache(maxsize=4096)
 def _bump_timestamp(value: str) -> str:
+    # Pure in its input; event bursts and heartbeats repeat timestamps.
     try:
         dt = datetime.fromisoformat(value)
     except ValueError:
@@ -1450,18 +1504,37 @@ def _bump_timestamp(value: str) -> str:
 def _load_warning_records(path: Path, limit: int) -> list[dict[str, Any]]:
     if limit <= 0 or not path.exists():
         return []
-    records: deque[dict[str, Any]] = deque(maxlen=limit)
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
+    # Walk the log from EOF so `warnings tail` only parses the lines it shows.
+    records: list[dict[str, Any]] = []
+    with path.open("rb") as handle:
+        for line in _iter_lines_reversed(handle):
             line = line.strip()
             if not line:
                 continue
             try:
-                payload = json.loads(line)
+                payload = orjson.loads(line)
             except json.JSONDecodeError:
                 continue
             records.append(payload)
-    return list(records)
+            if len(records) >= limit:
+                break
+    records.reverse()
+    return records
+
+
+def _iter_lines_reversed(handle: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of ``handle`` last-first, reading fixed blocks backwards."""
+
+    position = handle.seek(0, os.SEEK_END)
+    remainder = b""
+    while position > 0:
+        size = min(_TAIL_BLOCK_BYTES, position)
+        position -= size
+        handle.seek(position)
+        lines = (handle.read(size) + remainder).split(b"\n")
+        remainder = lines[0]
+        yield from reversed(lines[1:])
+    yield remainder
 
 
 def _print_warning_records(records: list[dict[str, Any]], *, json_output: bool) -> None:
@@ -2012,8 +2085,14 @@ def _follow_warning_log(path: Path, *, json_output: bool, interval: float) -> No
                     console.print(f"[dim]{path} not found; waiting…[/]")
                     time.sleep(interval)
                     continue
-            line = handle.readline()
-            if not line:
+            # Drain whatever is already written so a burst renders as one table.
+            lines: list[str] = []
+            while len(lines) < _FOLLOW_BATCH_LINES:
+                line = handle.readline()
+                if not line:
+                    break
+                lines.append(line)
+            if not lines:
                 if _log_rotated_or_truncated(handle, path, last_inode):
                     handle.close()
                     handle = None
@@ -2021,14 +2100,17 @@ def _follow_warning_log(path: Path, *, json_output: bool, interval: float) -> No
                     continue
                 time.sleep(interval)
                 continue
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            _print_warning_records([record], json_output=json_output)
+            records: list[dict[str, Any]] = []
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(orjson.loads(line))
+                except json.JSONDecodeError:
+                    continue
+            if records:
+                _print_warning_records(records, json_output=json_output)
     finally:
         if handle:
             handle.close()
@@ -2266,7 +2348,7 @@ def jobs_manifest(
         if pretty:
             parsed = _parse_json_payload(text)
             if parsed is not None:
-                text = json.dumps(parsed, indent=2)
+                text = _json_pretty(parsed)
         _write_text_output(text, out, description="manifest")
 
 
@@ -2304,7 +2386,7 @@ def jobs_links(
         if pretty:
             parsed = _parse_json_payload(text)
             if parsed is not None:
-                text = json.dumps(parsed, indent=2)
+                text = _json_pretty(parsed)
         _write_text_output(text, out, description="links")
 
 
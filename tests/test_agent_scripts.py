@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import threading
 
+import httpx
 import pytest
 import typer
 from scripts import mdwb_cli
@@ -39,6 +41,75 @@ def test_summarize_markdown_truncates_to_sentences():
     assert "Third sentence adds more context" not in summary
 
 
+def test_strip_markdown_removes_nested_markup_in_one_pass():
+    markdown = (
+        "# Title\n> quote **bold** and _it_ ~~s~~ `code` [link **b**](http://x) ![img](y)\n"
+        "```py\nx=1\n```\nend."
+    )
+
+    assert shared._strip_markdown(markdown) == "Title quote bold and it s code link b end."
+    assert shared._strip_markdown("[![Build](https://x/badge.svg)](https://ci) Hello world.") == "Hello world."
+
+
+def test_strip_fences_scans_unbalanced_fences_linearly():
+    fence = "`" * 3
+    markdown = f"a{fence}x{fence}b{fence}" + "c" * 200_000
+
+    assert shared._strip_fences(markdown) == f"a b{fence}" + "c" * 200_000
+    assert shared._strip_fences("no fences here") == "no fences here"
+
+
+def test_strip_markdown_plain_text_skips_markup_passes(monkeypatch):
+    class _FailingPattern:
+        def sub(self, *_args):
+            raise AssertionError("plain text should not reach the markup regex")
+
+    monkeypatch.setattr(shared, "_RE_STRIP", _FailingPattern())
+
+    assert shared._strip_markdown("  Plain text.\n\nNo markup here!  ") == "Plain text. No markup here!"
+
+
+def test_summarize_markdown_memoizes_by_content(monkeypatch):
+    calls: list[str] = []
+    original = shared._strip_markdown
+
+    def _counting_strip(markdown: str) -> str:
+        calls.append(markdown)
+        return original(markdown)
+
+    monkeypatch.setattr(shared, "_strip_markdown", _counting_strip)
+    monkeypatch.setattr(shared, "_summary_cache", type(shared._summary_cache)())
+    markdown = SAMPLE_MD + "\nUnique memo sentence."
+
+    first = shared.summarize_markdown(markdown, sentences=2)
+    assert shared.summarize_markdown("".join(list(markdown)), sentences=2) == first
+    shared.summarize_markdown(markdown, sentences=3)
+
+    assert len(calls) == 2
+
+
+def test_summarize_markdown_strips_only_a_prefix_of_long_documents(monkeypatch):
+    fence = "`" * 3
+    markdown = (
+        "Intro one. Intro two.\n" + "filler line\n" * 300 + f"{fence}\ncode. not prose. at all.\n" + "x\n" * 400
+        + f"{fence}\nOutro three. Outro four. Outro five.\n" + "More prose here.\n" * 20_000
+    )
+    expected = shared._first_sentences(shared._strip_markdown(markdown), 5)
+    lengths: list[int] = []
+    original = shared._strip_markdown
+
+    def _recording_strip(text: str) -> str:
+        lengths.append(len(text))
+        return original(text)
+
+    monkeypatch.setattr(shared, "_strip_markdown", _recording_strip)
+    monkeypatch.setattr(shared, "_summary_cache", type(shared._summary_cache)())
+
+    assert shared.summarize_markdown(markdown, sentences=5) == expected
+    assert "code" not in expected
+    assert max(lengths) <= 16384
+
+
 def test_extract_todos_prefers_checkboxes_and_heading_context():
     todos = shared.extract_todos(SAMPLE_MD, max_tasks=8)
     assert todos[0].startswith("Wire nightly smoke")
@@ -47,6 +118,20 @@ def test_extract_todos_prefers_checkboxes_and_heading_context():
     assert any("Update docs/ops" in task for task in todos)
 
 
+def test_extract_todos_matches_heading_keywords_case_insensitively():
+    markdown = "## Open TASKS\nShip the release\n## Background\nNot a task line\n"
+
+    assert shared.extract_todos(markdown) == ["Ship the release"]
+    assert shared.extract_todos(markdown, heading_keywords=["backGROUND"]) == ["Not a task line"]
+
+
+def test_extract_todos_stops_once_the_budget_is_met():
+    markdown = "- first\n- second\n- third\n"
+
+    assert shared.extract_todos(markdown, max_tasks=2) == ["first", "second"]
+    assert shared.extract_todos(markdown, max_tasks=0) == []
+
+
 def _mock_capture(monkeypatch, markdown=SAMPLE_MD):
     capture = shared.CaptureResult(job_id="job-xyz", snapshot={}, markdown=markdown)
 
@@ -78,6 +163,43 @@ def test_summarize_article_cli_writes_out(monkeypatch, tmp_path: Path):
     assert out_path.read_text(encoding="utf-8") == expected
 
 
+def test_summarize_article_batch_captures_urls_concurrently(monkeypatch, tmp_path: Path):
+    settings = mdwb_cli.APISettings(base_url="http://localhost", api_key=None, warning_log_path=Path("ops/warnings.jsonl"))
+    monkeypatch.setattr(shared, "resolve_settings", lambda api_base: settings)
+    barrier = threading.Barrier(3, timeout=5)
+    clients: set[int] = set()
+
+    def fake_capture(*, url, client, **kwargs):  # noqa: ANN001
+        clients.add(id(client))
+        barrier.wait()  # all three captures must be in flight at once
+        if url.endswith("bad"):
+            raise RuntimeError("boom")
+        return shared.CaptureResult(job_id=f"job-{url[-1]}", snapshot={}, markdown=f"Page {url[-1]}. Done.")
+
+    monkeypatch.setattr(shared, "capture_markdown", fake_capture)
+    batch_file = tmp_path / "urls.txt"
+    batch_file.write_text("# targets\nhttps://a.example/1\n\nhttps://a.example/2\nhttps://a.example/bad\n", encoding="utf-8")
+    out_path = tmp_path / "summaries.txt"
+
+    with pytest.raises(typer.Exit):
+        summarize_article_module.summarize(
+            url="",
+            job_id="",
+            api_base=None,
+            profile=None,
+            ocr_policy=None,
+            sentences=1,
+            http2=False,
+            poll_interval=2.0,
+            timeout=300.0,
+            out=out_path,
+            batch=batch_file,
+        )
+
+    assert len(clients) == 1
+    assert out_path.read_text(encoding="utf-8") == "# https://a.example/1\n\nPage 1.\n\n# https://a.example/2\n\nPage 2."
+
+
 def test_generate_todos_cli_writes_text(monkeypatch, tmp_path: Path):
     _mock_capture(monkeypatch)
     out_path = tmp_path / "todos.txt"
@@ -170,6 +292,30 @@ def test_capture_markdown_raises_on_non_done_state(monkeypatch):
         )
 
 
+def test_capture_markdown_shares_one_client_across_phases(monkeypatch):
+    settings = mdwb_cli.APISettings(base_url="http://localhost", api_key=None, warning_log_path=Path("ops/warnings.jsonl"))
+    clients: list[object] = []
+
+    def _record(result):
+        def _call(*args, client=None, **kwargs):  # noqa: ANN001
+            clients.append(client)
+            return result
+
+        return _call
+
+    monkeypatch.setattr(shared, "submit_job", _record({"id": "job-1"}))
+    monkeypatch.setattr(shared, "wait_for_completion", _record({"id": "job-1", "state": "DONE"}))
+    monkeypatch.setattr(shared, "fetch_markdown", _record("# Hi"))
+
+    result = shared.capture_markdown(url="https://example.com", job_id=None, settings=settings)
+
+    assert result.markdown == "# Hi"
+    assert len(clients) == 3
+    assert isinstance(clients[0], httpx.Client)
+    assert clients[0] is clients[1] is clients[2]
+    assert clients[0].is_closed
+
+
 def test_generate_todos_cli_handles_empty_output(monkeypatch, tmp_path: Path):
     _mock_capture(monkeypatch, markdown="")
     out_path = tmp_path / "todos.txt"
@@ -189,3 +335,71 @@ def test_generate_todos_cli_handles_empty_output(monkeypatch, tmp_path: Path):
     )
 
     assert out_path.read_text(encoding="utf-8") == ""
+
+
+def _wait_with_transport(monkeypatch, handler, sleeps: list[float] | None = None) -> dict:
+    monkeypatch.setattr(shared.time, "sleep", (sleeps if sleeps is not None else []).append)
+    settings = mdwb_cli.APISettings(base_url="http://localhost", api_key=None, warning_log_path=Path("ops/warnings.jsonl"))
+    with httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(handler)) as client:
+        return shared.wait_for_completion("job-1", settings, client=client)
+
+
+def test_wait_for_completion_follows_stream_until_terminal_state(monkeypatch):
+    paths: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/stream"):
+            body = b": connected\n\nevent: state\ndata: RUNNING\n\nevent: state\ndata: DONE\n\n"
+            return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+        return httpx.Response(200, json={"id": "job-1", "state": "DONE"})
+
+    assert _wait_with_transport(monkeypatch, _handler)["state"] == "DONE"
+    assert paths == ["/jobs/job-1/stream", "/jobs/job-1"]
+
+
+def test_wait_for_completion_polls_when_stream_is_missing(monkeypatch):
+    states = iter(["RUNNING"] * 6 + ["FAILED"])
+    sleeps: list[float] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/stream"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json={"id": "job-1", "state": next(states)})
+
+    assert _wait_with_transport(monkeypatch, _handler, sleeps)["state"] == "FAILED"
+    # Backoff starts at 0.2s, doubles, and caps at the 2s poll interval (plus <=10% jitter).
+    expected = [0.2, 0.4, 0.8, 1.6, 2.0, 2.0]
+    assert len(sleeps) == len(expected)
+    assert all(base <= slept <= base * 1.1 for slept, base in zip(sleeps, expected))
+
+
+def test_fetch_markdown_decodes_streamed_body_once():
+    markdown = "# Título\n\n" + "Body text. " * 20_000
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/jobs/job-1/result.md"
+        return httpx.Response(200, content=markdown.encode("utf-8"), headers={"content-type": "text/markdown; charset=utf-8"})
+
+    settings = mdwb_cli.APISettings(base_url="http://localhost", api_key=None, warning_log_path=Path("ops/warnings.jsonl"))
+    with httpx.Client(base_url="http://localhost", transport=httpx.MockTransport(_handler)) as client:
+        assert shared.fetch_markdown("job-1", settings, client=client) == markdown
+
+
+def test_resolve_settings_memoizes_per_api_base(monkeypatch):
+    calls: list[int] = []
+
+    def _load():
+        calls.append(1)
+        return mdwb_cli.APISettings(base_url="http://localhost", api_key=None, warning_log_path=Path("ops/warnings.jsonl"))
+
+    monkeypatch.setattr(mdwb_cli, "_load_env_settings", _load)
+    shared.resolve_settings.cache_clear()
+    try:
+        assert shared.resolve_settings(None) is shared.resolve_settings(None)
+        assert shared.resolve_settings("http://other").base_url == "http://other"
+        assert shared.resolve_settings(None).base_url == "http://localhost"
+    finally:
+        shared.resolve_settings.cache_clear()
+
+    assert len(calls) == 2
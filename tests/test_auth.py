@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from fastapi import HTTPException, Request
+from sqlmodel import select
+
+from app import auth, rate_limit
+from app.auth import (
+    APIKey,
+    _parse_api_key,
+    clear_api_key_cache,
+    create_api_key,
+    flush_last_used,
+    get_auth_context,
+    hash_api_key,
+    revoke_api_key,
+    verify_api_key,
+)
+from app.settings import Settings
+from app.store import StorageConfig, Store
+
+
+@pytest.fixture(autouse=True)
+def _reset_key_cache() -> None:
+    clear_api_key_cache()
+    auth._pending_last_used.clear()
+    rate_limit._api_key_buckets.clear()
+
+
+def _storage(tmp_path: Path) -> Store:
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    return Store(config=config)
+
+
+def test_hash_api_key_uses_blake2b_160() -> None:
+    digest = hash_api_key("mdwb_" + "a" * 32)
+
+    assert len(digest) == 40
+    assert digest == hashlib.blake2b(("mdwb_" + "a" * 32).encode(), digest_size=20).hexdigest()
+
+
+def test_verify_api_key_roundtrip(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.session() as session:
+        plain_key, record = create_api_key(session, "agent")
+
+        record_id = record.id
+        verified = verify_api_key(session, plain_key)
+
+        assert verified is not None
+        assert verified.id == record_id
+        assert verified.last_used_at is not None
+
+    assert flush_last_used(store) == 1
+    with store.session() as session:
+        stored = session.get(APIKey, record_id)
+        assert stored is not None
+        assert stored.last_used_at is not None
+
+
+def test_verify_api_key_upgrades_legacy_sha256_hash(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    plain_key = "mdwb_" + "0123456789abcdef" * 2
+    with store.session() as session:
+        session.add(
+            APIKey(
+                key_hash=hashlib.sha256(plain_key.encode()).hexdigest(),
+                key_prefix=plain_key.encode("ascii")[:12],
+                name="legacy",
+            )
+        )
+        session.commit()
+
+        verified = verify_api_key(session, plain_key)
+        assert verified is not None
+
+        stored = session.exec(select(APIKey).where(APIKey.name == "legacy")).one()
+        assert stored.key_hash == hash_api_key(plain_key)
+
+
+def test_verify_api_key_rejects_unknown_key(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.session() as session:
+        assert verify_api_key(session, "mdwb_" + "f" * 32) is None
+        assert verify_api_key(session, "not-a-key") is None
+
+
+def test_verify_api_key_unknown_key_costs_one_query(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.session() as session:
+        calls = 0
+        real_exec = session.exec
+
+        def _counting_exec(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return real_exec(*args, **kwargs)
+
+        session.exec = _counting_exec  # type: ignore[method-assign]
+        assert verify_api_key(session, "mdwb_" + "f" * 32) is None
+
+    assert calls == 1
+
+
+def test_verify_api_key_serves_repeat_lookups_from_cache(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.session() as session:
+        plain_key, _ = create_api_key(session, "agent")
+        assert verify_api_key(session, plain_key) is not None
+
+    def _fail_exec(*_args, **_kwargs):
+        raise AssertionError("cached verification should not query the database")
+
+    with store.session() as session:
+        session.exec = _fail_exec  # type: ignore[method-assign]
+        cached = verify_api_key(session, plain_key)
+
+    assert cached is not None
+    assert cached.name == "agent"
+
+
+def test_revoke_api_key_evicts_cached_entry(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.session() as session:
+        plain_key, record = create_api_key(session, "agent")
+        assert verify_api_key(session, plain_key) is not None
+        assert record.id is not None
+
+        assert revoke_api_key(session, record.id)
+        assert verify_api_key(session, plain_key) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "mdwb_" + "g" * 32,
+        "mdwb_" + "a" * 31,
+        "mdwb_" + "ab " * 10 + "ab",
+        "mdwc_" + "a" * 32,
+        "mdwb_" + "\u00e9" * 32,
+        "mdwb_" + "A" * 32,
+        "mdwb_" + "a" * 32 + "\n",
+    ],
+)
+def test_parse_api_key_rejects_malformed_keys(value: str) -> None:
+    assert _parse_api_key(value) is None
+
+
+def test_parse_api_key_returns_ascii_bytes() -> None:
+    value = "mdwb_" + "0123456789abcdef" * 2
+
+    assert _parse_api_key(value) == value.encode("ascii")
+    assert hash_api_key(value.encode("ascii")) == hash_api_key(value)
+
+
+def test_get_auth_context_enforces_per_key_rate_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = _storage(tmp_path)
+    monkeypatch.setattr(auth, "_global_store", store)
+    settings = cast(Settings, SimpleNamespace(REQUIRE_API_KEY=True))
+    with store.session() as session:
+        plain_key, _ = create_api_key(session, "agent", rate_limit=2)
+
+    def _authenticate():
+        return asyncio.run(get_auth_context(cast(Request, None), x_api_key=plain_key, settings=settings))
+
+    assert _authenticate().rate_limit == 2
+    _authenticate()
+    with pytest.raises(HTTPException) as excinfo:
+        _authenticate()
+
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.headers is not None
+    assert int(excinfo.value.headers["Retry-After"]) >= 1
+
+
+def test_store_upgrades_text_key_prefix_to_blob(tmp_path: Path) -> None:
+    store = _storage(tmp_path)
+    with store.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO api_keys (key_hash, key_prefix, name, created_at, is_active) "
+            "VALUES ('legacy-hash', 'mdwb_0123456', 'legacy', '2024-01-01 00:00:00', 1)"
+        )
+
+    reopened = _storage(tmp_path)
+    with reopened.session() as session:
+        record = session.exec(select(APIKey).where(APIKey.name == "legacy")).one()
+        assert record.key_prefix == b"mdwb_0123456"
+
+
+def test_get_auth_context_skips_database_when_auth_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail_get_store():
+        raise AssertionError("anonymous mode should not open a database session")
+
+    monkeypatch.setattr(auth, "get_store", _fail_get_store)
+    settings = cast(Settings, SimpleNamespace(REQUIRE_API_KEY=False))
+
+    context = asyncio.run(get_auth_context(cast(Request, None), x_api_key=None, settings=settings))
+
+    assert context.api_key_name == "anonymous"
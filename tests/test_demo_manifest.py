@@ -7,7 +7,13 @@ if "pyvips" not in sys.modules:
     pyvips_stub.Image = object  # type: ignore[attr-defined]
     sys.modules["pyvips"] = pyvips_stub
 
-from app.main import _demo_manifest_payload, _snapshot_events
+from app.main import (
+    _demo_manifest_payload,
+    _serialize_log_entry,
+    _snapshot_events,
+    _SnapshotEventCache,
+    _sse_frame,
+)
 
 
 def test_demo_manifest_contains_warnings_and_blocklist():
@@ -85,3 +91,31 @@ def test_snapshot_events_use_dom_assist_summary_field():
     summary = json.loads(events["dom_assist"])
     assert summary["count"] == 3
     assert summary["reasons"] == ["low-alpha", "punctuation"]
+
+
+def test_sse_frame_prefixes_each_payload_line():
+    assert _sse_frame("state", "DONE") == b"event: state\ndata: DONE\n\n"
+    assert _sse_frame("log", "boom\nsecond line") == b"event: log\ndata: boom\ndata: second line\n\n"
+    assert _sse_frame("custom", "x") == b"event: custom\ndata: x\n\n"
+
+
+def test_snapshot_events_reuse_cached_manifest_serialization():
+    manifest = {"warnings": [{"code": "canvas-heavy"}], "blocklist_hits": {"#ad": 1}}
+    cache = _SnapshotEventCache()
+
+    first = dict(_snapshot_events({"state": "RUNNING", "manifest": manifest}, cache))
+    second = dict(_snapshot_events({"state": "DONE", "manifest": manifest}, cache))
+    assert second["state"] == "DONE"
+    assert second["manifest"] is first["manifest"]
+    assert second["warnings"] is first["warnings"]
+
+    replaced = dict(_snapshot_events({"manifest": {**manifest, "warnings": []}}, cache))
+    assert "warnings" not in replaced
+
+
+def test_serialize_log_entry_emits_ndjson_bytes():
+    line = _serialize_log_entry({"sequence": 3, "snapshot": {"state": "DONE"}})
+
+    assert isinstance(line, bytes)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == {"sequence": 3, "snapshot": {"state": "DONE"}, "event": "snapshot"}
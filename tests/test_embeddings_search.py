@@ -47,3 +47,26 @@ def test_store_embedding_search_ranks_best_match(tmp_path):
     assert matches
     assert matches[0].section_id == "intro"
     assert matches[0].similarity >= matches[-1].similarity
+
+
+def test_embeddings_search_endpoint_uses_dedicated_executor(monkeypatch):
+    import asyncio
+    import threading
+
+    from app import main
+    from app.schemas import EmbeddingSearchRequest
+
+    threads: list[str] = []
+
+    def _search(**_kwargs):
+        threads.append(threading.current_thread().name)
+        return 0, []
+
+    monkeypatch.setattr(main.store, "search_section_embeddings", _search)
+    payload = EmbeddingSearchRequest(vector=_vector(0.5), top_k=1)
+
+    response = asyncio.run(main.embeddings_search("run-1", payload))
+    main._shutdown_embedding_executor()
+
+    assert response.total_sections == 0
+    assert threads and threads[0].startswith("mdwb-embeddings")
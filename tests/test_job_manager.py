@@ -82,7 +82,7 @@ except OSError:  # pyvips missing in CI
         manifest: CaptureManifest
 
 import app.jobs as jobs_module  # noqa: E402
-from app.jobs import JobManager, JobState  # noqa: E402
+from app.jobs import JobManager, JobRecord, JobState  # noqa: E402
 from app.schemas import JobCreateRequest  # noqa: E402
 from app.store import StorageConfig, Store  # noqa: E402
 from app.tiler import TileSlice  # noqa: E402
@@ -183,12 +183,76 @@ async def test_job_manager_snapshot_queue(tmp_path: Path):
         states.append(update["state"])
         if update["state"] == JobState.DONE.value:
             break
-    manager.unsubscribe(job_id, queue)
 
     assert JobState.BROWSER_STARTING.value in states
     assert states[-1] == JobState.DONE.value
 
 
+def test_build_initial_snapshot_reuses_environment_dump():
+    first = jobs_module.build_initial_snapshot("https://example.com/a", job_id="a", profile_id="p1")
+    second = jobs_module.build_initial_snapshot("https://example.com/b", job_id="b", cache_hit=True)
+
+    assert first["manifest"]["environment"] is second["manifest"]["environment"]
+    assert first["manifest"]["profile_id"] == "p1"
+    assert first["manifest"]["cache_hit"] is False
+    assert second["manifest"]["profile_id"] is None
+    assert second["manifest"]["cache_hit"] is True
+
+
+@pytest.mark.asyncio
+async def test_job_manager_releases_finished_tasks(tmp_path: Path):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/tasks"))
+    job_id = snapshot["id"]
+
+    await manager._tasks[job_id]
+    await asyncio.sleep(0)  # let the done callback run
+
+    assert not manager._bg_tasks
+    assert job_id not in manager._tasks
+
+
+@pytest.mark.asyncio
+async def test_job_manager_broadcast_shares_payload_without_mutating_history(tmp_path: Path):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/shared"))
+    job_id = snapshot["id"]
+    first = manager.subscribe(job_id)
+    second = manager.subscribe(job_id)
+    first.get_nowait()
+    second.get_nowait()
+
+    manager._set_state(job_id, JobState.NAVIGATING)
+    left = first.get_nowait()
+    right = second.get_nowait()
+    manager._set_state(job_id, JobState.SCROLLING)
+
+    assert left is right
+    assert left["state"] == JobState.NAVIGATING.value
+    assert type(manager._jobs[job_id].snapshot["state"]) is str
+    await manager._tasks[job_id]
+
+
+@pytest.mark.asyncio
+async def test_job_manager_lagging_subscriber_keeps_latest_snapshots(tmp_path: Path):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/lag"))
+    job_id = snapshot["id"]
+    queue = manager.subscribe(job_id)
+
+    manager._set_state(job_id, JobState.NAVIGATING)
+    manager._set_state(job_id, JobState.SCROLLING)
+    manager._set_state(job_id, JobState.CAPTURING)
+
+    assert queue.get_nowait()["state"] == JobState.CAPTURING.value
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+    await manager._tasks[job_id]
+
+
 @pytest.mark.asyncio
 async def test_job_manager_event_log_records_history(tmp_path: Path):
     config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
@@ -226,6 +290,24 @@ async def test_job_manager_snapshot_includes_seam_counts(tmp_path: Path):
         assert len(seam_summary) == 2
 
 
+@pytest.mark.asyncio
+async def test_job_manager_snapshot_payload_skips_copy_and_lookup(tmp_path: Path, monkeypatch):
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/shared"))
+    job_id = snapshot["id"]
+    await manager._tasks[job_id]
+
+    def _fail_fetch(_job_id):
+        raise AssertionError("snapshots should not hit the run table")
+
+    monkeypatch.setattr(manager.store, "fetch_run", _fail_fetch)
+    subscription = manager.subscribe(job_id)
+    manager._set_error(job_id, "late failure")
+
+    assert subscription.get_nowait() is manager.get_snapshot(job_id)
+
+
 @pytest.mark.asyncio
 async def test_job_manager_event_log_clamps_length(monkeypatch, tmp_path: Path):
     from app import jobs as jobs_module
@@ -287,6 +369,25 @@ async def test_job_manager_events_sequence_filter(tmp_path: Path):
     assert new_events[0]["sequence"] > last_seq
 
 
+@pytest.mark.asyncio
+async def test_job_manager_sequence_filter_after_log_trim(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(jobs_module, "_EVENT_HISTORY_LIMIT", 3)
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner)
+    snapshot = await manager.create_job(JobCreateRequest(url="https://example.com/trim"))
+    job_id = snapshot["id"]
+    await manager._tasks[job_id]
+
+    events = manager.get_events(job_id)
+    sequences = [event["sequence"] for event in events]
+    assert len(sequences) == 3
+
+    assert manager.get_events(job_id, min_sequence=0) == events
+    assert [event["sequence"] for event in manager.get_events(job_id, min_sequence=sequences[0])] == sequences[1:]
+    since = manager._parse_timestamp(events[-1]["timestamp"])
+    assert manager.get_events(job_id, since=since, min_sequence=sequences[-1]) == []
+
+
 @pytest.mark.asyncio
 async def test_job_manager_emits_ocr_event(tmp_path: Path):
     config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
@@ -405,6 +506,12 @@ async def test_job_manager_webhook_delivery(tmp_path: Path):
 
     assert sent, "webhook sender should be invoked"
     assert sent[-1]["payload"]["state"] == JobState.DONE.value
+    done_events = [
+        event
+        for event in manager.get_events(job_id)
+        if event.get("snapshot", {}).get("state") == JobState.DONE.value
+    ]
+    assert done_events[-1]["timestamp"] == sent[-1]["payload"]["timestamp"]
 
 
 @pytest.mark.asyncio
@@ -450,7 +557,7 @@ async def test_delete_webhook_after_job_cleanup(tmp_path: Path):
     await manager._tasks[job_id]
     manager.register_webhook(job_id, url="https://example.com/hook", events=[JobState.DONE.value])
     # simulate job cleanup (no snapshot in memory)
-    manager._snapshots.pop(job_id, None)
+    manager._jobs.pop(job_id, None)
     deleted = manager.delete_webhook(job_id, url="https://example.com/hook")
     assert deleted == 1
     assert store.list_webhooks(job_id) == []
@@ -490,7 +597,7 @@ async def test_delete_webhook_requires_both_identifiers(tmp_path: Path):
     assert deleted == 0
     # Store still has the record because the ID mismatch prevented deletion.
     assert len(store.list_webhooks(job_id)) == 1
-    assert manager._webhooks[job_id], "cached webhook list should remain intact"
+    assert manager._jobs[job_id].webhooks, "cached webhook list should remain intact"
 
 
 @pytest.mark.asyncio
@@ -554,15 +661,18 @@ def test_delete_webhook_handles_pending_entries():
     store = _DeleteStubStore()
     manager = JobManager(store=cast(Store, store), runner=_fake_runner)
     job_id = "pending-job"
-    manager._snapshots[job_id] = {"id": job_id, "url": "https://example.com", "state": JobState.CAPTURING}
-    manager._webhooks[job_id] = [{"url": "https://example.com/hook"}]
-    manager._pending_webhooks[job_id] = [{"url": "https://example.com/hook"}]
+    record = JobRecord(
+        snapshot={"id": job_id, "url": "https://example.com", "state": JobState.CAPTURING},
+        webhooks=[{"url": "https://example.com/hook"}],
+        pending_webhooks=[{"url": "https://example.com/hook"}],
+    )
+    manager._jobs[job_id] = record
 
     deleted = manager.delete_webhook(job_id, url="https://example.com/hook")
 
     assert deleted == 1
-    assert manager._webhooks.get(job_id) is None
-    assert manager._pending_webhooks.get(job_id) is None
+    assert record.webhooks == []
+    assert record.pending_webhooks == []
     assert store.calls == [(job_id, None, "https://example.com/hook")]
 
 
@@ -572,3 +682,103 @@ def test_delete_webhook_unknown_job_propagates_keyerror():
 
     with pytest.raises(KeyError):
         manager.delete_webhook("missing-job", url="https://example.com/hook")
+
+
+class _RecordingAsyncClient:
+    posts: list[dict[str, Any]] = []
+
+    def __init__(self, **_kwargs: Any) -> None:
+        self.is_closed = False
+
+    async def __aenter__(self) -> "_RecordingAsyncClient":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def post(self, url: str, *, content: bytes, headers: dict[str, str]) -> None:
+        self.posts.append({"url": url, "content": content, "headers": headers})
+
+    async def aclose(self) -> None:
+        self.is_closed = True
+
+
+@pytest.mark.asyncio
+async def test_webhook_pool_bounds_backlog(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(jobs_module, "_WEBHOOK_WORKERS", 1)
+    monkeypatch.setattr(jobs_module, "_WEBHOOK_QUEUE_SIZE", 1)
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def _sender(url: str, payload: dict):  # noqa: ANN001
+        await release.wait()
+        sent.append(url)
+
+    config = StorageConfig(cache_root=tmp_path / "cache", db_path=tmp_path / "runs.db")
+    manager = JobManager(store=Store(config), runner=_fake_runner, webhook_sender=_sender)
+
+    manager._enqueue_webhook("https://example.com/a", {"state": "DONE"})
+    await asyncio.sleep(0)  # worker picks up the first delivery and blocks
+    manager._enqueue_webhook("https://example.com/b", {"state": "DONE"})
+    manager._enqueue_webhook("https://example.com/c", {"state": "DONE"})  # dropped: backlog full
+
+    assert len(manager._webhook_workers) == 1
+    release.set()
+    assert manager._webhook_queue is not None
+    await manager._webhook_queue.join()
+    assert sent == ["https://example.com/a", "https://example.com/b"]
+
+    await manager.stop_webhook_workers()
+    assert manager._webhook_workers == []
+
+
+@pytest.mark.asyncio
+async def test_signed_webhook_sender_signs_sorted_compact_body(monkeypatch: pytest.MonkeyPatch):
+    import hashlib
+    import hmac
+    import json
+
+    _RecordingAsyncClient.posts = []
+    monkeypatch.setattr(jobs_module.httpx, "AsyncClient", _RecordingAsyncClient)
+    monkeypatch.setattr(jobs_module, "_WEBHOOK_CLIENT", None)
+    sender = jobs_module.build_signed_webhook_sender("secret")
+
+    await sender("https://example.com/hook", {"state": "DONE", "job_id": "abc"})
+
+    post = _RecordingAsyncClient.posts[0]
+    body = post["content"]
+    assert json.loads(body) == {"job_id": "abc", "state": "DONE"}
+    assert body == b'{"job_id":"abc","state":"DONE"}'
+    expected = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    assert post["headers"]["X-MDWB-Signature"] == f"v1={expected}"
+
+    await sender("https://example.com/hook", {"state": "FAILED", "job_id": "abc"})
+    second = _RecordingAsyncClient.posts[-1]
+    expected_second = hmac.new(b"secret", second["content"], hashlib.sha256).hexdigest()
+    assert second["headers"]["X-MDWB-Signature"] == f"v1={expected_second}"
+
+
+def test_encode_json_sorts_keys_and_treats_naive_datetimes_as_utc():
+    payload = {"state": "DONE", "finished_at": datetime(2024, 1, 2, 3, 4, 5), "job_id": "abc"}
+
+    body = jobs_module._encode_json(payload, sort_keys=True)
+
+    assert body == b'{"finished_at":"2024-01-02T03:04:05+00:00","job_id":"abc","state":"DONE"}'
+
+
+@pytest.mark.asyncio
+async def test_webhook_senders_reuse_one_client(monkeypatch: pytest.MonkeyPatch):
+    _RecordingAsyncClient.posts = []
+    monkeypatch.setattr(jobs_module.httpx, "AsyncClient", _RecordingAsyncClient)
+    monkeypatch.setattr(jobs_module, "_WEBHOOK_CLIENT", None)
+    signed = jobs_module.build_signed_webhook_sender("secret")
+
+    await signed("https://example.com/a", {"state": "DONE"})
+    await jobs_module._default_webhook_sender("https://example.com/b", {"state": "FAILED"})
+    client = jobs_module._WEBHOOK_CLIENT
+
+    assert client is not None
+    assert len(_RecordingAsyncClient.posts) == 2
+    await jobs_module.close_webhook_client()
+    assert client.is_closed
+    assert jobs_module._WEBHOOK_CLIENT is None
@@ -4,6 +4,7 @@ import json
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
 
 import httpx
@@ -32,8 +33,8 @@ class FakeResponse:
     def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
         return None
 
-    def iter_lines(self):  # noqa: D401
-        yield from self._lines
+    def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+        yield "".join(line + "\n" for line in self._lines).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -62,6 +63,13 @@ def test_cursor_from_line_prefers_top_level_timestamp():
     assert datetime.fromisoformat(bumped) > datetime.fromisoformat(base)
 
 
+def test_json_pretty_matches_stdlib_indent():
+    payload = {"url": "https://example.com/caf\u00e9", "tiles": [1, 2]}
+
+    assert mdwb_cli._json_pretty(payload) == json.dumps(payload, indent=2, ensure_ascii=False)
+    assert mdwb_cli._cursor_from_line("{not json", "fallback") == "fallback"
+
+
 def test_cursor_from_line_uses_snapshot_timestamp_when_missing_top_level():
     base = "2025-11-08T00:00:00+00:00"
     line = json.dumps({"snapshot": {"timestamp": base}})
@@ -70,6 +78,44 @@ def test_cursor_from_line_uses_snapshot_timestamp_when_missing_top_level():
     assert datetime.fromisoformat(bumped) > datetime.fromisoformat(base)
 
 
+def test_cursor_from_line_reads_trailing_timestamp_without_parsing(monkeypatch):
+    def _fail_loads(_line):  # noqa: ANN001
+        raise AssertionError("snapshot lines should not be parsed for the cursor")
+
+    line = json.dumps(
+        {
+            "event": "snapshot",
+            "snapshot": {"state": "DONE", "manifest": {"timestamp": "2020-01-01T00:00:00+00:00"}},
+            "timestamp": "2025-11-08T00:00:00+00:00",
+            "sequence": 7,
+        },
+        separators=(",", ":"),
+    ).encode()
+    monkeypatch.setattr(mdwb_cli, "orjson", SimpleNamespace(loads=_fail_loads))
+
+    assert mdwb_cli._cursor_from_line(line, None) == "2025-11-08T00:00:00.000001+00:00"
+
+
+def test_cursor_from_line_ignores_nested_trailing_timestamp():
+    line = json.dumps(
+        {"event": "log", "data": {"timestamp": "2020-01-01T00:00:00+00:00"}},
+        separators=(",", ":"),
+    ).encode()
+
+    assert mdwb_cli._cursor_from_line(line, "fallback") == "fallback"
+
+
+def test_bump_timestamp_memoizes_repeated_cursors():
+    mdwb_cli._bump_timestamp.cache_clear()
+
+    for _ in range(3):
+        assert mdwb_cli._bump_timestamp("2025-11-08T00:00:00+00:00") == "2025-11-08T00:00:00.000001+00:00"
+    assert mdwb_cli._bump_timestamp("not-a-timestamp") == "not-a-timestamp"
+
+    info = mdwb_cli._bump_timestamp.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
 def test_iter_event_lines_updates_cursor_and_closes_client(monkeypatch):
     responses = [FakeResponse([json.dumps({"timestamp": "2025-11-08T00:00:00+00:00"})])]
     fake_client = FakeClient(responses)
@@ -93,11 +139,66 @@ def test_iter_event_lines_updates_cursor_and_closes_client(monkeypatch):
         )
     )
 
-    assert lines == [json.dumps({"timestamp": "2025-11-08T00:00:00+00:00"})]
+    assert lines == [json.dumps({"timestamp": "2025-11-08T00:00:00+00:00"}).encode()]
     assert fake_client.calls == [None]
     assert fake_client.closed
 
 
+def test_iter_event_lines_reconnects_with_backoff_instead_of_fixed_sleep(monkeypatch):
+    first = json.dumps({"timestamp": "2025-11-08T00:00:00+00:00"})
+    second = json.dumps({"timestamp": "2025-11-08T00:00:05+00:00"})
+    fake_client = FakeClient([FakeResponse([first]), FakeResponse([]), FakeResponse([]), FakeResponse([second])])
+    sleeps: list[float] = []
+    monkeypatch.setattr(mdwb_cli.time, "sleep", sleeps.append)
+
+    stream = mdwb_cli._iter_event_lines(
+        "job123",
+        API_SETTINGS,
+        cursor=None,
+        follow=True,
+        interval=1.0,
+        client=cast(httpx.Client, fake_client),
+    )
+    lines = [next(stream), next(stream)]
+
+    assert lines == [first.encode(), second.encode()]
+    assert sleeps == [0.25, 0.5, 1.0]
+    assert fake_client.calls[0] is None
+    assert fake_client.calls[1] == fake_client.calls[3] == "2025-11-08T00:00:00.000001+00:00"
+
+
+def test_iter_byte_lines_reassembles_fragmented_chunks():
+    class ChunkedResponse:
+        def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+            yield from (b'{"a":', b'1}\r\n{"b"', b":2}\n\n", b"caf\xc3", b"\xa9")
+
+    lines = list(mdwb_cli._iter_byte_lines(cast(httpx.Response, ChunkedResponse())))
+
+    assert lines == [b'{"a":1}', b'{"b":2}', b"", "caf\u00e9".encode()]
+
+
+def test_iter_byte_lines_scans_each_chunk_once(monkeypatch):
+    class SplitLineResponse:
+        def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+            yield b"x" * 10
+            yield b"y" * 10
+            yield b"z\nrest"
+
+    finds: list[int] = []
+    original_find = bytearray.find
+
+    class RecordingBuffer(bytearray):
+        def find(self, sub, start=0, *args):  # noqa: ANN001
+            finds.append(start)
+            return original_find(self, sub, start, *args)
+
+    monkeypatch.setattr(mdwb_cli, "bytearray", RecordingBuffer, raising=False)
+    lines = list(mdwb_cli._iter_byte_lines(cast(httpx.Response, SplitLineResponse())))
+
+    assert lines == [b"x" * 10 + b"y" * 10 + b"z", b"rest"]
+    assert finds[:3] == [0, 10, 20]
+
+
 def test_client_ctx_preserves_explicit_timeout(monkeypatch):
     captured: dict[str, object] = {}
 
@@ -137,7 +238,7 @@ def test_watch_job_events_pretty_renders_snapshot(monkeypatch):
         ),
     ]
 
-    monkeypatch.setattr(mdwb_cli, "_iter_event_lines", lambda *_, **__: iter(events))
+    monkeypatch.setattr(mdwb_cli, "_iter_event_lines", lambda *_, **__: (event.encode() for event in events))
     with mdwb_cli.console.capture() as capture:
         mdwb_cli._watch_job_events_pretty(
             "job123",
@@ -164,6 +265,31 @@ def test_log_event_formats_blocklist_and_sweep():
     assert "Tile checksum mismatch" in output
 
 
+def test_render_snapshot_prints_once_per_snapshot(monkeypatch):
+    prints: list[str] = []
+    original_print = mdwb_cli.console.print
+
+    def _counting_print(*args, **kwargs):  # noqa: ANN001
+        prints.append(args[0])
+        original_print(*args, **kwargs)
+
+    monkeypatch.setattr(mdwb_cli.console, "print", _counting_print)
+    snapshot = {
+        "state": "DONE",
+        "profile_id": "agent",
+        "manifest_path": "/tmp/manifest.json",
+        "manifest": {"warnings": [{"code": "canvas-heavy"}]},
+        "error": "boom",
+    }
+    with mdwb_cli.console.capture() as capture:
+        mdwb_cli._render_snapshot(snapshot)
+
+    output = capture.get()
+    assert len(prints) == 1
+    assert output.splitlines()[:3] == ["DONE", "log: profile: agent", "log: manifest: /tmp/manifest.json"]
+    assert "canvas-heavy" in output and "boom" in output
+
+
 def test_cli_events_invokes_watch_job_events(monkeypatch, tmp_path: Path) -> None:
     called: dict[str, Any] = {}
 
@@ -264,7 +390,7 @@ def test_watch_job_events_pretty_triggers_hooks_in_raw_mode(monkeypatch):
             }
         )
     ]
-    monkeypatch.setattr(mdwb_cli, "_iter_event_lines", lambda *_, **__: iter(events))
+    monkeypatch.setattr(mdwb_cli, "_iter_event_lines", lambda *_, **__: (event.encode() for event in events))
     received: list[dict[str, Any]] = []
     monkeypatch.setattr(mdwb_cli, "_trigger_event_hooks", lambda entry, hooks: received.append(entry))
 
@@ -289,8 +415,11 @@ def test_iter_sse_parses_events():
         def __init__(self, lines: list[str]) -> None:
             self.lines = lines
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.lines
+        def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+            body = "".join(line + "\n" for line in self.lines).encode()
+            # Deliver the stream in 3-byte fragments so lines span chunks.
+            for start in range(0, len(body), 3):
+                yield body[start : start + 3]
 
     response = cast(
         httpx.Response,
@@ -362,8 +491,9 @@ def test_stream_job_triggers_hooks_and_terminal(monkeypatch):
         def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
             return None
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.payload
+        def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+            for line in self.payload:
+                yield (line + "\n").encode()
 
         def raise_for_status(self) -> None:
             return None
@@ -423,8 +553,9 @@ def test_stream_job_stops_after_terminal_state():
         def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
             return None
 
-        def iter_lines(self):  # noqa: ANN001
-            yield from self.payload
+        def iter_bytes(self, chunk_size=None):  # noqa: ANN001
+            for line in self.payload:
+                yield (line + "\n").encode()
 
         def raise_for_status(self) -> None:
             return None
@@ -580,6 +711,8 @@ def test_watch_command_invokes_helper(monkeypatch):
         invoked.append((job_id, cursor, follow, interval, raw, hooks, progress_meter, client))
 
     monkeypatch.setattr(mdwb_cli, "_watch_events_with_fallback", fake_helper)
+    shared_client = mdwb_cli._client(API_SETTINGS)
+    monkeypatch.setattr(mdwb_cli, "_client", lambda settings: shared_client)
 
     result = runner.invoke(mdwb_cli.cli, ["watch", "job123", "--interval", "0.5", "--raw", "--on", "snapshot=echo hi"])
 
@@ -588,7 +721,15 @@ def test_watch_command_invokes_helper(monkeypatch):
     entry = invoked[0]
     assert entry[:6] == ("job123", None, True, 0.5, True, {"snapshot": ["echo hi"]})
     assert isinstance(entry[6], mdwb_cli._ProgressMeter)
-    assert entry[7] is None
+    # --reuse-session is the default, so one client serves the whole watch.
+    assert entry[7] is shared_client
+    assert shared_client.is_closed
+
+    invoked.clear()
+    result = runner.invoke(mdwb_cli.cli, ["watch", "job123", "--no-reuse-session"])
+
+    assert result.exit_code == 0
+    assert invoked[0][7] is None
 
 
 def test_parse_event_hooks_valid():
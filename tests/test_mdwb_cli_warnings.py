@@ -133,3 +133,42 @@ def test_warnings_tail_handles_missing_file(tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert "Warning log not found" in result.output
     assert str(missing_log) in result.output
+
+
+def test_load_warning_records_reads_only_the_tail(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "warnings.jsonl"
+    lines = [json.dumps({"job_id": f"run-{idx}", "note": "x" * 40}) for idx in range(500)]
+    lines[-2] = "{not json"
+    log_path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+    monkeypatch.setattr(mdwb_cli, "_TAIL_BLOCK_BYTES", 64)
+
+    records = mdwb_cli._load_warning_records(log_path, 3)
+
+    assert [record["job_id"] for record in records] == ["run-496", "run-497", "run-499"]
+    assert len(mdwb_cli._load_warning_records(log_path, 1000)) == 499
+
+
+def test_follow_warning_log_prints_a_burst_as_one_batch(tmp_path: Path, monkeypatch) -> None:
+    log_path = tmp_path / "warnings.jsonl"
+    log_path.write_text("", encoding="utf-8")
+    batches: list[list[str]] = []
+
+    def _fake_print(records, *, json_output):  # noqa: ANN001
+        batches.append([record["job_id"] for record in records])
+
+    def _fake_sleep(_interval: float) -> None:
+        if not batches:
+            burst = [json.dumps({"job_id": f"run-{idx}"}) for idx in range(3)]
+            log_path.write_text("\n".join([*burst[:2], "{not json", burst[2]]) + "\n", encoding="utf-8")
+            return
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(mdwb_cli, "_print_warning_records", _fake_print)
+    monkeypatch.setattr(mdwb_cli.time, "sleep", _fake_sleep)
+
+    try:
+        mdwb_cli._follow_warning_log(log_path, json_output=True, interval=0.1)
+    except KeyboardInterrupt:
+        pass
+
+    assert batches == [["run-0", "run-1", "run-2"]]
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import io
+import json
 from typing import Iterator
 
 import pytest
 from PIL import Image, ImageDraw, ImageFont
 from playwright.async_api import async_playwright
 
-from app.ocr_client import OCRRequest, reset_quota_tracker, submit_tiles
+import httpx
+
+from app import ocr_client
+from app.ocr_client import (
+    OCRRequest,
+    _AdaptiveLimiter,
+    _AutotuneController,
+    _encode_payload,
+    _encode_request,
+    _ocr_client,
+    _parse_retry_after,
+    _payload_template,
+    _retry_delay,
+    close_ocr_client,
+    reset_quota_tracker,
+    submit_tiles,
+)
 from app.settings import get_settings, load_config
 
 
@@ -25,6 +44,145 @@ def _reset_quota_tracker_fixture() -> Iterator[None]:
     reset_quota_tracker()
 
 
+def test_retry_delay_honors_retry_after_on_throttle() -> None:
+    throttled = httpx.Response(429, headers={"Retry-After": "7"})
+    capped = httpx.Response(503, headers={"Retry-After": "3600"})
+
+    assert _retry_delay(1, throttled) == 7.0
+    assert _retry_delay(1, capped) == 60.0
+
+
+def test_retry_delay_applies_equal_jitter_to_schedule() -> None:
+    server_error = httpx.Response(500, headers={"Retry-After": "30"})
+
+    for attempt, base in ((1, 3.0), (2, 9.0), (5, 9.0)):
+        delay = _retry_delay(attempt, server_error)
+        assert base / 2 <= delay <= base
+
+
+def test_parse_retry_after_accepts_http_dates() -> None:
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_posts_prebuilt_json_bodies() -> None:
+    settings = get_settings()
+    seen: list[dict] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        seen.append(payload)
+        image = payload["messages"][0]["content"][-1]["image_url"]["url"]
+        return httpx.Response(200, json={"choices": [{"message": {"content": image[-8:]}}]})
+
+    tiles = [OCRRequest(tile_id=f"tile-{idx}", tile_bytes=bytes([idx]) * 6) for idx in range(3)]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        result = await submit_tiles(requests=tiles, settings=settings, client=client)
+
+    assert len(seen) == 3
+    expected = [base64.b64encode(tile.tile_bytes).decode("ascii")[-8:] for tile in tiles]
+    assert result.markdown_chunks == expected
+
+
+@pytest.mark.asyncio
+async def test_submit_tiles_surfaces_batch_failure_unwrapped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ocr_client, "_retry_delay", lambda *_args: 0.0)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": "boom"})
+
+    tiles = [OCRRequest(tile_id=f"tile-{idx}", tile_bytes=b"png") for idx in range(2)]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        with pytest.raises(RuntimeError, match="olmOCR request failed"):
+            await submit_tiles(requests=tiles, settings=get_settings(), client=client)
+
+
+def test_encode_payload_splices_images_into_json() -> None:
+    settings = get_settings()
+    tiles = [_encode_request(OCRRequest(tile_id=f"t{idx}", tile_bytes=b"\x89PNG" * (idx + 1)), settings) for idx in range(2)]
+
+    payload = json.loads(_encode_payload(tiles, True))
+
+    urls = [part["image_url"]["url"] for part in payload["messages"][0]["content"][1:]]
+    assert urls == [f"data:image/png;base64,{tile.image_b64.decode('ascii')}" for tile in tiles]
+
+    reversed_payload = json.loads(_encode_payload(tiles[::-1], True))
+    reversed_urls = [part["image_url"]["url"] for part in reversed_payload["messages"][0]["content"][1:]]
+    assert reversed_urls == urls[::-1]
+    assert _payload_template(tiles[0].model, 2, True) is _payload_template(tiles[0].model, 2, True)
+
+
+@pytest.mark.asyncio
+async def test_ocr_client_is_shared_until_closed() -> None:
+    client = _ocr_client()
+
+    assert _ocr_client() is client
+    await close_ocr_client()
+    assert client.is_closed
+    assert _ocr_client() is not client
+    await close_ocr_client()
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_resizes_while_slots_are_held() -> None:
+    limiter = _AdaptiveLimiter(_AutotuneController(min_limit=2, max_limit=4))
+    peak = active = 0
+    release = asyncio.Event()
+
+    async def _worker() -> None:
+        nonlocal peak, active
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            active -= 1
+
+    workers = [asyncio.create_task(_worker()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert active == 2
+
+    await limiter.set_limit(4)
+    await asyncio.sleep(0)
+    assert active == 4
+
+    await limiter.set_limit(1)
+    release.set()
+    await asyncio.gather(*workers)
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter_wakes_waiter_when_holder_is_cancelled() -> None:
+    limiter = _AdaptiveLimiter(_AutotuneController(min_limit=1, max_limit=1))
+    release = asyncio.Event()
+
+    async def _holder() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    async def _waiter() -> None:
+        async with limiter.slot():
+            pass
+
+    holder = asyncio.create_task(_holder())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_waiter())
+    await asyncio.sleep(0)
+
+    # Hold the condition lock so the holder's release blocks on it, then cancel it there.
+    async with limiter._cond:
+        release.set()
+        await asyncio.sleep(0)
+        holder.cancel()
+        await asyncio.sleep(0)
+
+    with pytest.raises(asyncio.CancelledError):
+        await holder
+    await asyncio.wait_for(waiter, timeout=1)
+
+
 def create_real_test_image(width: int = 1280, height: int = 720, text: str = "Test") -> bytes:
     """Create a real PNG image with text for testing."""
     # Create white image
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from fastapi import Request, Response
+from starlette.datastructures import Headers
+
+from app.rate_limit import (
+    RateLimiter,
+    RateLimitMiddleware,
+    RedisRateLimiter,
+    TokenBucket,
+    build_rate_limiter,
+    extract_rate_limit_key,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+from app.settings import Settings
+
+
+def test_check_rate_limit_reports_retry_after_when_exhausted() -> None:
+    limiter = RateLimiter(requests_per_minute=2)
+
+    assert limiter.check_rate_limit("ip:1")[0]
+    allowed, stats = limiter.check_rate_limit("ip:1")
+    assert allowed
+    assert stats["remaining"] == 0
+
+    allowed, stats = limiter.check_rate_limit("ip:1")
+    assert not allowed
+    assert stats["retry_after"] >= 1
+    assert stats["reset"] >= int(time.time())
+
+
+def test_buckets_refill_on_the_monotonic_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter(requests_per_minute=60)
+    limiter.check_rate_limit("ip:1", tokens=60)
+
+    assert not limiter.check_rate_limit("ip:1")[0]
+    clock[0] += 1.0
+    assert limiter.check_rate_limit("ip:1")[0]
+
+    clock[0] += 7200.0
+    assert limiter.cleanup_stale_buckets(max_age_seconds=3600) == 1
+
+
+def test_cleanup_only_drops_stale_buckets_across_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter(requests_per_minute=10)
+    for idx in range(50):
+        limiter.check_rate_limit(f"ip:old-{idx}")
+    clock[0] = 5000.0
+    limiter.check_rate_limit("ip:fresh")
+
+    assert limiter.cleanup_stale_buckets(max_age_seconds=3600) == 50
+    assert sum(len(shard) for shard in limiter._shards) == 1
+    assert limiter._last_refill[limiter._shard("ip:fresh")["ip:fresh"]] == 5000.0
+
+
+class _ScriptClient:
+    def __init__(self, result=None, error: Exception | None = None) -> None:
+        self.result = result
+        self.error = error
+        self.calls: list[dict] = []
+
+    def register_script(self, _source: str):
+        async def _run(*, keys, args):
+            self.calls.append({"keys": keys, "args": args})
+            if self.error is not None:
+                raise self.error
+            return self.result
+
+        return _run
+
+
+@pytest.mark.asyncio
+async def test_redis_rate_limiter_reports_script_verdict() -> None:
+    now_ms = int(time.time() * 1000)
+    client = _ScriptClient(result=[0, 0, now_ms - 30_000])
+    limiter = RedisRateLimiter(client, requests_per_minute=5)
+
+    allowed, stats = await limiter.check("ip:1")
+
+    assert not allowed
+    assert stats["limit"] == 5
+    assert 29 <= stats["retry_after"] <= 31
+    assert client.calls[0]["keys"] == ["mdwb:ratelimit:ip:1"]
+
+
+@pytest.mark.asyncio
+async def test_redis_rate_limiter_falls_back_when_unreachable() -> None:
+    limiter = RedisRateLimiter(
+        _ScriptClient(error=ConnectionRefusedError("down")),
+        requests_per_minute=1,
+    )
+
+    assert (await limiter.check("ip:1"))[0]
+    allowed, stats = await limiter.check("ip:1")
+    assert not allowed
+    assert stats["retry_after"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_spends_borrowed_credit_locally(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter(requests_per_minute=60)
+    calls: list[int] = []
+    original_check = limiter.check
+
+    async def _counting_check(key: str, tokens: int = 1):
+        calls.append(tokens)
+        return await original_check(key, tokens)
+
+    monkeypatch.setattr(limiter, "check", _counting_check)
+    middleware = RateLimitMiddleware(lambda *_: None, limiter, borrow_batch=4)
+
+    results = [await middleware._admit("ip:1") for _ in range(4)]
+    assert all(allowed for allowed, _ in results)
+    assert [stats["remaining"] for _, stats in results] == [59, 58, 57, 56]
+    assert calls == [4]
+
+    await middleware._admit("ip:1")
+    clock[0] += 5.0
+    await middleware._admit("ip:1")
+    assert calls == [4, 4, 4]
+    # Three unused tokens from the expired batch were credited back.
+    assert limiter._tokens[limiter._shard("ip:1")["ip:1"]] == pytest.approx(60 - 8 + 3 + 5 - 4)
+
+
+def test_cleanup_stops_at_first_recently_used_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter(requests_per_minute=10)
+    keys = [f"ip:{idx}" for idx in range(600)]
+    for key in keys:
+        limiter.check_rate_limit(key)
+    clock[0] = 5000.0
+    for key in keys[::2]:
+        limiter.check_rate_limit(key)
+
+    assert limiter.cleanup_stale_buckets(max_age_seconds=3600) == 300
+    assert {key for shard in limiter._shards for key in shard} == set(keys[::2])
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({"X-API-Key": "mdwb_" + "a" * 32}, "api_key:mdwb_aaaaaaa"),
+        ({"x-api-key": "mdwb_" + "b" * 32}, "api_key:mdwb_bbbbbbb"),
+        ({"X-API-Key": "mdwb_" + "a" * 31}, "ip:10.0.0.1"),
+        ({"X-API-Key": "xxxx_" + "a" * 32}, "ip:10.0.0.1"),
+        ({}, "ip:10.0.0.1"),
+    ],
+)
+def test_extract_rate_limit_key_prefers_well_formed_api_keys(headers: dict[str, str], expected: str) -> None:
+    request = Request(
+        {
+            "type": "http",
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+            "client": ("10.0.0.1", 1234),
+        }
+    )
+
+    assert extract_rate_limit_key(request) == expected
+
+
+def test_token_bucket_has_no_instance_dict() -> None:
+    bucket = TokenBucket(capacity=1, tokens=1.0, refill_rate=1.0, last_refill=0.0)
+
+    assert not hasattr(bucket, "__dict__")
+
+
+def test_cleanup_recycles_array_slots(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter(requests_per_minute=10)
+    for idx in range(8):
+        limiter.check_rate_limit(f"ip:{idx}")
+    clock[0] = 5000.0
+    assert limiter.cleanup_stale_buckets(max_age_seconds=3600) == 8
+
+    allowed, stats = limiter.check_rate_limit("ip:new")
+
+    assert allowed and stats["remaining"] == 9
+    assert len(limiter._tokens) == 8
+
+
+async def _ok_app(scope, receive, send) -> None:
+    await Response("ok")(scope, receive, send)
+
+
+async def _call_middleware(middleware: RateLimitMiddleware, host: str) -> tuple[int, Headers, bytes]:
+    messages: list[dict] = []
+
+    async def _receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def _send(message) -> None:
+        messages.append(message)
+
+    await middleware({"type": "http", "headers": [], "client": (host, 1)}, _receive, _send)
+    start = messages[0]
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], Headers(raw=start["headers"]), body
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_with_precomputed_body() -> None:
+    middleware = RateLimitMiddleware(_ok_app, RateLimiter(requests_per_minute=1))
+
+    assert (await _call_middleware(middleware, "10.0.0.2"))[1]["X-RateLimit-Remaining"] == "0"
+    status_code, headers, body = await _call_middleware(middleware, "10.0.0.2")
+
+    assert status_code == 429
+    assert body == b'{"detail":"Rate limit exceeded. Please try again later."}'
+    assert headers["X-RateLimit-Limit"] == "1"
+    assert int(headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_appends_raw_rate_limit_headers_once() -> None:
+    middleware = RateLimitMiddleware(_ok_app, RateLimiter(requests_per_minute=5))
+
+    status_code, headers, body = await _call_middleware(middleware, "10.0.0.3")
+
+    assert (status_code, body) == (200, b"ok")
+    assert len(headers.getlist("X-RateLimit-Limit")) == 1
+    assert headers["X-RateLimit-Remaining"] == "4"
+    assert int(headers["X-RateLimit-Reset"]) >= int(time.time())
+
+
+@pytest.mark.asyncio
+async def test_middleware_passes_non_http_scopes_through() -> None:
+    seen: list[str] = []
+
+    async def _app(scope, receive, send) -> None:
+        seen.append(scope["type"])
+
+    middleware = RateLimitMiddleware(_app, RateLimiter(requests_per_minute=1))
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
+
+
+def test_set_rate_limiter_swaps_the_global_instance() -> None:
+    replacement = RateLimiter(requests_per_minute=3)
+    previous = set_rate_limiter(replacement)
+    try:
+        assert get_rate_limiter() is replacement
+        assert RateLimitMiddleware(_ok_app).limiter is replacement
+    finally:
+        set_rate_limiter(previous)
+
+    assert get_rate_limiter() is previous
+
+
+def test_build_rate_limiter_defaults_to_in_process_buckets() -> None:
+    settings = cast(Settings, SimpleNamespace(RATE_LIMIT_PER_MINUTE=7, RATE_LIMIT_REDIS_URL=None))
+
+    limiter = build_rate_limiter(settings)
+
+    assert isinstance(limiter, RateLimiter)
+    assert limiter.check_rate_limit("ip:1")[1]["limit"] == 7
+
+
+def test_token_bucket_consume_one_matches_consume() -> None:
+    fast = TokenBucket(capacity=2, tokens=2.0, refill_rate=0.5, last_refill=0.0)
+    generic = TokenBucket(capacity=2, tokens=2.0, refill_rate=0.5, last_refill=0.0)
+
+    for now in (0.0, 0.1, 0.2, 1.0, 2.5, 2.6, 10.0):
+        assert fast.consume_one(now) == generic.consume(1, now)
+        assert (fast.tokens, fast.last_refill) == pytest.approx((generic.tokens, generic.last_refill))
@@ -1,5 +1,8 @@
+import asyncio
+from datetime import datetime, timezone
 import json
 
+from app import warning_log
 from app.schemas import (
     ConcurrencyWindow,
     ManifestEnvironment,
@@ -7,7 +10,11 @@ from app.schemas import (
     ManifestWarning,
     ViewportSettings,
 )
-from app.warning_log import append_warning_log
+from app.warning_log import (
+    append_warning_log,
+    start_warning_log_flusher,
+    stop_warning_log_flusher,
+)
 
 
 class _DummyWarnings:
@@ -153,3 +160,59 @@ def test_append_warning_log_includes_seam_usage_when_events_exist(monkeypatch, t
     assert usage.get("count") == 2
     sample = usage.get("sample")
     assert isinstance(sample, list) and sample[0]["prev_tile_index"] == 0
+
+
+def test_warning_log_flusher_batches_records_until_stopped(monkeypatch, tmp_path):
+    log_path = tmp_path / "warnings.jsonl"
+    monkeypatch.setattr("app.warning_log.get_settings", lambda: _settings_with_log(log_path))
+
+    async def _scenario():
+        start_warning_log_flusher(interval=60)
+        for idx in range(3):
+            append_warning_log(job_id=f"run-{idx}", url="https://example.com", manifest=_demo_manifest())
+        assert not log_path.exists()
+        await stop_warning_log_flusher()
+
+    asyncio.run(_scenario())
+
+    lines = log_path.read_text().splitlines()
+    assert [json.loads(line)["job_id"] for line in lines] == ["run-0", "run-1", "run-2"]
+
+
+def test_encode_record_writes_compact_iso_timestamped_lines():
+    record = {"timestamp": datetime(2025, 11, 7, 12, 30, 5, 250, tzinfo=timezone.utc), "blocklist_hits": {"#a": 1}}
+
+    line = warning_log._encode_record(record)
+
+    assert line == b'{"timestamp":"2025-11-07T12:30:05.000250+00:00","blocklist_hits":{"#a":1}}\n'
+
+
+def test_normalize_warning_caches_normalizer_per_type():
+    warning = ManifestWarning(code="canvas-heavy", message="demo", count=5, threshold=3)
+
+    assert warning_log._normalize_warning(warning)["code"] == "canvas-heavy"
+    assert warning_log._normalize_warning({"code": "x"}) == {"code": "x"}
+    assert warning_log._normalize_warning("plain") == {"code": "plain"}
+    assert {ManifestWarning, dict, str} <= set(warning_log._NORMALIZERS)
+
+
+def test_manifest_warning_to_dict_matches_model_dump():
+    warning = ManifestWarning(code="seam", message="demo", count=0.95, threshold=0.9)
+
+    assert warning.to_dict() == warning.model_dump()
+
+
+def test_summarize_seam_markers_counts_all_but_samples_first_entries():
+    markers = [{"tile_index": idx % 10, "position": "top", "hash": f"h{idx % 4}"} for idx in range(1000)]
+    markers.insert(1, "not-a-marker")
+
+    summary = warning_log.summarize_seam_markers(markers, sample_limit=2)
+
+    assert summary is not None
+    assert summary["count"] == 1000
+    assert summary["unique_tiles"] == 10
+    assert summary["unique_hashes"] == 4
+    assert summary["sample"] == [
+        {"tile_index": 0, "position": "top", "hash": "h0"},
+        {"tile_index": 1, "position": "top", "hash": "h1"},
+    ]